@@ -1,9 +1,11 @@
 """Audio module for Samantha."""
 
 from .recording import (
+    AudioBuffer,
+    CaptureRing,
     normalize_audio,
+    pcm_to_wav,
     _prepare_audio_for_whisper,
-    _clear_queue,
 )
 
 from .playback import (
@@ -14,24 +16,40 @@ from .playback import (
     _tts_playing,
     _tts_start_time,
     _tts_interrupt,
+    enqueue_tts,
     speak_tts_sync,
     speak_tts,
     play_sound,
 )
 
+from .vad import (
+    SileroVad,
+    create_vad,
+    get_vad,
+    reset_vad,
+)
+
 from .processing import (
     is_echo,
     get_active_interrupt_words,
     is_skip_allowed,
     contains_interrupt_phrase,
     contains_skip_phrase,
+    detect_control_words,
 )
 
 __all__ = [
     # Recording
+    "AudioBuffer",
+    "CaptureRing",
     "normalize_audio",
+    "pcm_to_wav",
     "_prepare_audio_for_whisper",
-    "_clear_queue",
+    # VAD
+    "SileroVad",
+    "create_vad",
+    "get_vad",
+    "reset_vad",
     # Playback globals
     "_tts_text_queue",
     "_tts_queue_lock",
@@ -41,6 +59,7 @@ __all__ = [
     "_tts_start_time",
     "_tts_interrupt",
     # Playback functions
+    "enqueue_tts",
     "speak_tts_sync",
     "speak_tts",
     "play_sound",
@@ -50,4 +69,5 @@ __all__ = [
     "is_skip_allowed",
     "contains_interrupt_phrase",
     "contains_skip_phrase",
+    "detect_control_words",
 ]
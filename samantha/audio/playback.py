@@ -8,15 +8,39 @@ import subprocess
 import tempfile
 import threading
 import time
+from collections import OrderedDict, deque
+from functools import lru_cache
 
-import numpy as np
 import sounddevice as sd
 
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
 from samantha.config import KOKORO_URL, get_voice, get_output_device
+from samantha.services.http import get_http_session
+from samantha.utils import process
 from samantha.utils.logging import log_conversation
 
 logger = logging.getLogger("samantha")
 
+PLATFORM = platform.system()
+
+# Resolved once at import so chimes and the TTS fallback don't walk PATH per call
+_LINUX_PLAYER = None
+_LINUX_TTS_PLAYER = None
+if PLATFORM == "Linux":
+    _LINUX_PLAYER = next((p for p in ("paplay", "pw-play", "aplay") if shutil.which(p)), None)
+    _LINUX_TTS_PLAYER = _LINUX_PLAYER or ("ffplay" if shutil.which("ffplay") else None)
+
+# Players that accept raw Kokoro PCM (s16le, 24kHz, mono) on stdin
+_LINUX_PCM_STDIN_ARGS = {
+    "paplay": ["paplay", "--raw", "--format=s16le", "--rate=24000", "--channels=1"],
+    "pw-play": ["pw-play", "--format", "s16", "--rate", "24000", "--channels", "1", "-"],
+    "aplay": ["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-r", "24000", "-c", "1"],
+}
+
 _tts_text_queue = []
 _tts_queue_lock = threading.Lock()
 _last_tts_text = ""
@@ -26,6 +50,39 @@ _tts_start_time = 0
 _tts_interrupt = False
 _post_tts_pending = False
 
+# Synthesized PCM for short phrases, keyed by (voice, text), least recently used evicted first
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024
+TTS_CACHE_MAX_CHARS = 200
+_tts_pcm_cache = OrderedDict()
+_tts_pcm_cache_bytes = 0
+_tts_pcm_cache_lock = threading.Lock()
+
+_SENTENCE_END = ('.', '!', '?', '\n', '…', ':', ';')
+# Fragments of one streamed reply arrive back to back; separate messages are further apart
+TTS_MERGE_WINDOW = 0.5
+_tts_last_enqueue_time = float("-inf")
+
+
+def enqueue_tts(text: str) -> None:
+    """Queue text for the loop to speak, merging fragments that don't end a sentence.
+
+    If the newest queued entry is still waiting, has no sentence terminator and was queued
+    within TTS_MERGE_WINDOW seconds, the new text is appended to it, so Kokoro gets whole
+    sentences instead of one request per fragment. Separate short replies ("Done") stay apart.
+    """
+    global _tts_last_enqueue_time
+    with _tts_queue_lock:
+        now = time.monotonic()
+        if (
+            _tts_text_queue
+            and now - _tts_last_enqueue_time < TTS_MERGE_WINDOW
+            and not _tts_text_queue[-1].rstrip(' "\')').endswith(_SENTENCE_END)
+        ):
+            _tts_text_queue[-1] = f"{_tts_text_queue[-1].rstrip()} {text.lstrip()}"
+        else:
+            _tts_text_queue.append(text)
+        _tts_last_enqueue_time = now
+
 
 def refresh_audio_devices() -> None:
     """Re-enumerate audio devices so playback/recording bind to the CURRENT default.
@@ -63,7 +120,7 @@ def speak_tts_sync(text: str) -> bool:
     logger.info("🔊 TTS: %s", text[:80] + "..." if len(text) > 80 else text)
 
     _last_tts_text = text
-    _last_tts_time = time.time()
+    _last_tts_time = time.monotonic()
     _tts_interrupt = False
 
     # Try sounddevice first (streaming, interruptible)
@@ -78,55 +135,167 @@ def speak_tts_sync(text: str) -> bool:
         return False
 
 
+def _whole_samples(chunks):
+    """Yield non-empty PCM byte chunks cut to whole int16 samples, carrying a split sample forward."""
+    carry = b""
+    for chunk in chunks:
+        if carry:
+            chunk = carry + chunk
+        cut = len(chunk) & ~1
+        carry = chunk[cut:]
+        if cut:
+            yield chunk[:cut] if carry else chunk
+
+
+def _cached_pcm(key: tuple[str, str]):
+    """Cached PCM for (voice, text), or None."""
+    with _tts_pcm_cache_lock:
+        pcm = _tts_pcm_cache.get(key)
+        if pcm is not None:
+            _tts_pcm_cache.move_to_end(key)
+        return pcm
+
+
+def _cache_pcm(key: tuple[str, str], pcm: bytes) -> None:
+    global _tts_pcm_cache_bytes
+    if not pcm or len(pcm) > TTS_CACHE_MAX_BYTES:
+        return
+    with _tts_pcm_cache_lock:
+        old = _tts_pcm_cache.pop(key, None)
+        if old is not None:
+            _tts_pcm_cache_bytes -= len(old)
+        _tts_pcm_cache[key] = pcm
+        _tts_pcm_cache_bytes += len(pcm)
+        while _tts_pcm_cache_bytes > TTS_CACHE_MAX_BYTES:
+            _, evicted = _tts_pcm_cache.popitem(last=False)
+            _tts_pcm_cache_bytes -= len(evicted)
+
+
+class _PcmFeed:
+    """PCM handed from the TTS thread to the output stream callback.
+
+    Chunks pass through a deque (atomic append/popleft), so the audio callback never waits on a
+    lock, and it aborts the stream on the first tick after _tts_interrupt is set.
+    """
+
+    def __init__(self, depth: int = 16):
+        self.depth = depth
+        self.finished = threading.Event()
+        self._chunks = deque()
+        self._head = memoryview(b"")
+        self._closed = False
+        self._drained = False
+        self._consumed = threading.Event()
+
+    def callback(self, outdata, frames, time_info, status):
+        if _tts_interrupt:
+            raise sd.CallbackAbort
+        need = len(outdata)
+        filled = 0
+        head = self._head
+        while filled < need:
+            if not head:
+                try:
+                    head = memoryview(self._chunks.popleft())
+                except IndexError:
+                    break
+                self._consumed.set()
+            n = min(need - filled, len(head))
+            outdata[filled:filled + n] = head[:n]
+            head = head[n:]
+            filled += n
+        self._head = head
+        if filled < need:
+            outdata[filled:] = bytes(need - filled)
+            if self._closed and not self._chunks:
+                self._drained = True
+                raise sd.CallbackStop
+
+    def play(self, stream, chunks, keep: list = None) -> str:
+        """Feed chunks to the running stream and wait for them to play.
+
+        Returns "complete" when every chunk was queued and played out, "interrupted" on a user
+        interrupt, or "cut" when the stream ended early (device error, stream stopped).
+        """
+        fed_all = True
+        for chunk in chunks:
+            while len(self._chunks) >= self.depth and not (_tts_interrupt or self.finished.is_set()):
+                self._consumed.wait(0.05)
+                self._consumed.clear()
+            if _tts_interrupt or self.finished.is_set():
+                fed_all = False
+                break
+            self._chunks.append(chunk)
+            if keep is not None:
+                keep.append(chunk)
+        self._closed = True
+        while not self.finished.wait(0.05):
+            if _tts_interrupt or not stream.active:
+                break
+        if _tts_interrupt:
+            logger.info("🛑 TTS interrupted by user - aborting stream")
+            return "interrupted"
+        if fed_all and self._drained:
+            return "complete"
+        logger.warning("⚠️ TTS stream ended before playback finished")
+        return "cut"
+
+
 def _speak_with_sounddevice(text: str) -> bool:
-    """Speak using sounddevice with PCM streaming (interruptible)."""
+    """Speak using a callback-mode sounddevice stream fed with streamed PCM (interruptible).
+
+    Short phrases are played from the PCM cache when Kokoro has already synthesized them.
+    """
     global _tts_interrupt
 
     stream = None
-    interrupted = False
+    feed = _PcmFeed()
     try:
-        import requests
-
-        stream = sd.OutputStream(
+        stream = sd.RawOutputStream(
             device=get_output_device(),
             samplerate=24000,
             channels=1,
             dtype='int16',
             blocksize=1024,
-            latency='low'
+            latency='low',
+            callback=feed.callback,
+            finished_callback=feed.finished.set,
         )
         stream.start()
 
-        with requests.post(
-            KOKORO_URL,
-            json={
-                "model": "kokoro",
-                "input": text,
-                "voice": get_voice(),
-                "response_format": "pcm",
-                "stream": True
-            },
-            timeout=60.0,
-            stream=True
-        ) as response:
-            if response.status_code != 200:
-                logger.error("TTS error: HTTP %s", response.status_code)
-                return False
+        voice = get_voice()
+        key = (voice, text)
+        pcm = _cached_pcm(key)
+        if pcm is not None:
+            logger.debug("TTS cache hit")
+            status = feed.play(stream, (pcm,))
+        else:
+            pieces = [] if len(text) <= TTS_CACHE_MAX_CHARS else None
+            with get_http_session().post(
+                KOKORO_URL,
+                json={
+                    "model": "kokoro",
+                    "input": text,
+                    "voice": voice,
+                    "response_format": "pcm",
+                    "stream": True
+                },
+                timeout=60.0,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error("TTS error: HTTP %s", response.status_code)
+                    return False
 
-            for chunk in response.iter_content(chunk_size=1024):
-                if _tts_interrupt:
-                    logger.info("🛑 TTS interrupted by user - aborting stream")
-                    interrupted = True
-                    stream.abort()
-                    break
-                if chunk:
-                    audio_array = np.frombuffer(chunk, dtype=np.int16)
-                    stream.write(audio_array)
+                status = feed.play(stream, _whole_samples(response.iter_content(chunk_size=1024)), pieces)
 
-        if not interrupted:
-            stream.stop()
+            # Only a phrase that streamed and played out in full is worth replaying
+            if pieces is not None and status == "complete":
+                _cache_pcm(key, b"".join(pieces))
+
+        if status == "complete":
             log_conversation("TTS", text)
-        return True
+        return status != "cut"
     finally:
         if stream:
             try:
@@ -140,12 +309,19 @@ def _speak_with_system_player(text: str) -> bool:
     """Fallback TTS using system audio player when sounddevice fails.
 
     Supports macOS (afplay), Linux (paplay/pw-play/aplay), and Windows (winsound).
+    On Linux, PCM is piped to the player as it streams in rather than buffered to a file.
     """
-    import requests
+
+    if PLATFORM == "Linux" and _LINUX_TTS_PLAYER in _LINUX_PCM_STDIN_ARGS:
+        try:
+            return _stream_with_system_player(text, _LINUX_PCM_STDIN_ARGS[_LINUX_TTS_PLAYER])
+        except Exception as e:
+            logger.error("TTS fallback error: %s", e)
+            return False
 
     try:
         # Request WAV format for system player compatibility
-        response = requests.post(
+        response = get_http_session().post(
             KOKORO_URL,
             json={
                 "model": "kokoro",
@@ -165,27 +341,21 @@ def _speak_with_system_player(text: str) -> bool:
             temp_path = f.name
 
         try:
-            system = platform.system()
-
-            if system == "Darwin":
-                subprocess.run(["afplay", temp_path], check=True)
-            elif system == "Linux":
-                # Try available Linux audio players
-                for player in ["paplay", "pw-play", "aplay", "ffplay"]:
-                    if shutil.which(player):
-                        cmd = [player, temp_path]
-                        if player == "ffplay":
-                            cmd = ["ffplay", "-nodisp", "-autoexit", temp_path]
-                        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        break
-                else:
+            if PLATFORM == "Darwin":
+                process.run(["afplay", temp_path], check=True)
+            elif PLATFORM == "Linux":
+                if not _LINUX_TTS_PLAYER:
                     logger.error("TTS fallback error: no audio player found on Linux")
                     return False
-            elif system == "Windows":
+                cmd = [_LINUX_TTS_PLAYER, temp_path]
+                if _LINUX_TTS_PLAYER == "ffplay":
+                    cmd = ["ffplay", "-nodisp", "-autoexit", temp_path]
+                process.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            elif PLATFORM == "Windows":
                 import winsound
                 winsound.PlaySound(temp_path, winsound.SND_FILENAME)
             else:
-                logger.error("TTS fallback error: unsupported platform %s", system)
+                logger.error("TTS fallback error: unsupported platform %s", PLATFORM)
                 return False
 
             log_conversation("TTS", text)
@@ -197,6 +367,52 @@ def _speak_with_system_player(text: str) -> bool:
         return False
 
 
+def _stream_with_system_player(text: str, cmd: list[str]) -> bool:
+    """Stream Kokoro PCM into a player's stdin so playback starts with the first chunk (interruptible)."""
+    global _tts_interrupt
+    interrupted = False
+    try:
+        with get_http_session().post(
+            KOKORO_URL,
+            json={
+                "model": "kokoro",
+                "input": text,
+                "voice": get_voice(),
+                "response_format": "pcm",
+                "stream": True
+            },
+            timeout=60.0,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                logger.error("TTS fallback error: HTTP %s", response.status_code)
+                return False
+
+            player = process.popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                for chunk in response.iter_content(chunk_size=4800):
+                    if _tts_interrupt:
+                        logger.info("🛑 TTS interrupted by user - stopping player")
+                        interrupted = True
+                        break
+                    if chunk:
+                        player.stdin.write(chunk)
+            finally:
+                if interrupted:
+                    player.kill()
+                try:
+                    player.stdin.close()
+                except BrokenPipeError:
+                    pass
+                player.wait()
+
+        if not interrupted:
+            log_conversation("TTS", text)
+        return True
+    finally:
+        _tts_interrupt = False
+
+
 async def speak_tts(text: str) -> bool:
     """Speak text using Kokoro TTS."""
     return speak_tts_sync(text)
@@ -219,34 +435,56 @@ SOUNDS_LINUX = {
 }
 
 
+@lru_cache(maxsize=None)
+def _load_sound(path: str):
+    """Decoded (samples, rate) for a sound file, read once; None if it can't be decoded."""
+    try:
+        return soundfile.read(path, dtype="int16")
+    except Exception as e:
+        logger.debug("Could not decode %s: %s", path, e)
+        return None
+
+
+def _play_decoded(path: str) -> bool:
+    """Play a sound from decoded memory through sounddevice (no player process); False if unavailable."""
+    if soundfile is None:
+        return False
+    sound = _load_sound(path)
+    if sound is None:
+        return False
+    try:
+        sd.play(sound[0], sound[1], device=get_output_device())
+        return True
+    except Exception as e:
+        logger.debug("sounddevice chime failed, using system player: %s", e)
+        return False
+
+
 def play_sound(sound_type: str):
     """Play a sound effect (cross-platform).
 
+    With soundfile installed, chimes are decoded once and played in-process; otherwise a system player is spawned.
+
     Args:
         sound_type: One of "activate", "deactivate", "skip", "stop", "timeout"
     """
-    system = platform.system()
-
-    if system == "Darwin":
+    if PLATFORM == "Darwin":
         sound_file = SOUNDS_DARWIN.get(sound_type)
-        if sound_file:
-            subprocess.Popen(
+        if sound_file and not _play_decoded(sound_file):
+            process.popen(
                 ["afplay", sound_file],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
-    elif system == "Linux":
+    elif PLATFORM == "Linux":
         sound_file = SOUNDS_LINUX.get(sound_type)
-        if sound_file:
-            for player in ["paplay", "pw-play", "aplay"]:
-                if shutil.which(player):
-                    subprocess.Popen(
-                        [player, sound_file],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    break
-    elif system == "Windows":
+        if sound_file and not _play_decoded(sound_file) and _LINUX_PLAYER:
+            process.popen(
+                [_LINUX_PLAYER, sound_file],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+    elif PLATFORM == "Windows":
         try:
             import winsound
             sounds_win = {
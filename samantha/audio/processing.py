@@ -2,12 +2,25 @@
 
 import logging
 import time
+from collections import Counter
+from functools import lru_cache
 
 from samantha.config import INTERRUPT_WORDS, SKIP_WORDS
 import samantha.audio.playback as playback
 
 logger = logging.getLogger("samantha")
 
+_INTERRUPT_SET = frozenset(INTERRUPT_WORDS)
+_SKIP_SET = frozenset(SKIP_WORDS)
+_CONTROL_WORDS = _INTERRUPT_SET | _SKIP_SET
+
+
+@lru_cache(maxsize=1)
+def _tts_tokens(tts_text: str) -> tuple[str, frozenset]:
+    """Lowercase and tokenize the last TTS text once per phrase, not once per STT result."""
+    tts_lower = tts_text.lower().strip()
+    return tts_lower, frozenset(tts_lower.split())
+
 
 def is_echo(text: str) -> bool:
     """Check if transcription is likely echo from TTS playback."""
@@ -15,17 +28,16 @@ def is_echo(text: str) -> bool:
     _last_tts_time = playback._last_tts_time
     if not _last_tts_text or not text:
         return False
-    if time.time() - _last_tts_time > 10:
+    if time.monotonic() - _last_tts_time > 10:
         return False
 
     text_lower = text.lower().strip()
-    tts_lower = _last_tts_text.lower().strip()
+    tts_lower, tts_words = _tts_tokens(_last_tts_text)
 
     if text_lower in tts_lower or tts_lower in text_lower:
         return True
 
     text_words = set(text_lower.split())
-    tts_words = set(tts_lower.split())
     if len(text_words) > 3:
         overlap = len(text_words & tts_words) / len(text_words)
         if overlap > 0.5:
@@ -34,6 +46,15 @@ def is_echo(text: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
+def _control_word_state(tts_text: str) -> tuple[frozenset, bool]:
+    """Active interrupt words and whether skip is allowed, computed once per TTS phrase."""
+    tts_lower = tts_text.lower()
+    active = frozenset(word for word in INTERRUPT_WORDS if word not in tts_lower)
+    skip_allowed = not any(word in tts_lower for word in SKIP_WORDS)
+    return active, skip_allowed
+
+
 def get_active_interrupt_words() -> list:
     """Get interrupt words that are NOT in the current TTS text.
 
@@ -41,10 +62,8 @@ def get_active_interrupt_words() -> list:
     If TTS says "quiet", only "stop" works.
     If neither, both work.
     """
-    _last_tts_text = playback._last_tts_text
-    tts_lower = _last_tts_text.lower() if _last_tts_text else ""
-
-    return [word for word in INTERRUPT_WORDS if word not in tts_lower]
+    active = _control_word_state(playback._last_tts_text or "")[0]
+    return [word for word in INTERRUPT_WORDS if word in active]
 
 
 def is_skip_allowed() -> bool:
@@ -52,44 +71,33 @@ def is_skip_allowed() -> bool:
 
     If TTS contains a skip word, don't allow skip detection to avoid self-triggering.
     """
-    _last_tts_text = playback._last_tts_text
-    if not _last_tts_text:
-        return True
-    tts_lower = _last_tts_text.lower()
-    return not any(word in tts_lower for word in SKIP_WORDS)
+    return _control_word_state(playback._last_tts_text or "")[1]
 
 
-def contains_interrupt_phrase(text: str) -> bool:
-    """Check if text contains an active interrupt word. Expects pre-sanitized text.
+def detect_control_words(text: str) -> tuple[bool, bool]:
+    """Single pass over the words of pre-sanitized text, returning (is_interrupt, is_skip).
 
-    If a word appears twice (e.g., "stop stop"), it always works as an interrupt,
+    If an interrupt word appears twice (e.g., "stop stop"), it always works as an interrupt,
     even if that word is in the TTS text. This ensures users can always interrupt.
     """
     if not text:
-        return False
+        return False, False
 
-    words = text.split()
+    counts = Counter(word for word in text.split() if word in _CONTROL_WORDS)
+    if not counts:
+        return False, False
 
-    for word in INTERRUPT_WORDS:
-        word_count = words.count(word)
-        if word_count >= 2:
-            return True
+    active_words, skip_allowed = _control_word_state(playback._last_tts_text or "")
+    is_interrupt = any(counts[word] >= 2 or word in active_words for word in counts if word in _INTERRUPT_SET)
+    is_skip = skip_allowed and any(word in _SKIP_SET for word in counts)
+    return is_interrupt, is_skip
 
-    active_words = get_active_interrupt_words()
-    for word in active_words:
-        if word in words:
-            return True
-    return False
+
+def contains_interrupt_phrase(text: str) -> bool:
+    """Check if text contains an active interrupt word. Expects pre-sanitized text."""
+    return detect_control_words(text)[0]
 
 
 def contains_skip_phrase(text: str) -> bool:
     """Check if text contains a skip word. Expects pre-sanitized text."""
-    if not text:
-        return False
-    if not is_skip_allowed():
-        return False
-
-    for word in SKIP_WORDS:
-        if word in text.split():
-            return True
-    return False
+    return detect_control_words(text)[1]
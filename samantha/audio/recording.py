@@ -1,46 +1,174 @@
 """Audio recording utilities for Samantha."""
 
 import io
+import queue
+import threading
+import wave
+from math import gcd
 
 import numpy as np
+from scipy import signal as scipy_signal
 
 from samantha.config import SAMPLE_RATE, WHISPER_SAMPLE_RATE, CHANNELS
 
+# Polyphase SAMPLE_RATE -> WHISPER_SAMPLE_RATE with the anti-aliasing kernel built once
+_WHISPER_GCD = gcd(SAMPLE_RATE, WHISPER_SAMPLE_RATE)
+_WHISPER_UP = WHISPER_SAMPLE_RATE // _WHISPER_GCD
+_WHISPER_DOWN = SAMPLE_RATE // _WHISPER_GCD
+_WHISPER_FIR = None
+if SAMPLE_RATE != WHISPER_SAMPLE_RATE:
+    _WHISPER_FIR = scipy_signal.firwin(2 * 10 * max(_WHISPER_UP, _WHISPER_DOWN) + 1, 1 / max(_WHISPER_UP, _WHISPER_DOWN))
+
+
+class AudioBuffer:
+    """Growable int16 sample buffer: appends copy into preallocated storage, reads are zero-copy views."""
+
+    def __init__(self, capacity: int):
+        self._data = np.empty(capacity, dtype=np.int16)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def append(self, samples: np.ndarray) -> None:
+        n = len(samples)
+        if self._end + n > len(self._data):
+            self._make_room(n)
+        self._data[self._end:self._end + n] = samples
+        self._end += n
+
+    def view(self) -> np.ndarray:
+        """Buffered samples; only valid until the next append/reset."""
+        return self._data[self._start:self._end]
+
+    def reset(self) -> None:
+        self._start = 0
+        self._end = 0
+
+    def keep_last(self, n: int) -> None:
+        """Drop all but the most recent n samples."""
+        if len(self) > n:
+            self._start = self._end - n
+
+    def _make_room(self, n: int) -> None:
+        size = len(self)
+        capacity = len(self._data)
+        while size + n > capacity:
+            capacity *= 2
+        if capacity != len(self._data):
+            data = np.empty(capacity, dtype=np.int16)
+            data[:size] = self.view()
+            self._data = data
+        else:
+            self._data[:size] = self.view()
+        self._start = 0
+        self._end = size
+
+
+class CaptureRing:
+    """Single-producer/single-consumer ring of fixed-size blocks between the input callback and the loop.
+
+    The callback only advances the head and the loop only the tail (plain int stores under the GIL),
+    so neither side takes a lock per block; an Event wakes a waiting consumer. A full ring drops new
+    blocks rather than overwrite unread ones. Returned blocks are views into the ring, valid until the
+    producer wraps around to them again, so copy them out promptly (e.g. into an AudioBuffer).
+    """
+
+    def __init__(self, slots: int, block_samples: int):
+        self._data = np.empty((slots, block_samples), dtype=np.int16)
+        self._lengths = [0] * slots
+        # Byte views of each slot, for put_raw
+        self._slot_bytes = [memoryview(row).cast("B") for row in self._data]
+        self._head = 0
+        self._tail = 0
+        self._ready = threading.Event()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    def put_raw(self, indata) -> None:
+        """Producer side for a RawInputStream: copy a mono int16 buffer byte-for-byte into the next slot(s)."""
+        raw = memoryview(indata).cast("B")
+        block_bytes = self._data.shape[1] * self._data.itemsize
+        slots = len(self._data)
+        for start in range(0, len(raw), block_bytes):
+            if self._head - self._tail >= slots:
+                self.dropped += 1
+                break
+            piece = raw[start:start + block_bytes]
+            slot = self._head % slots
+            self._slot_bytes[slot][:len(piece)] = piece
+            self._lengths[slot] = len(piece) // self._data.itemsize
+            self._head += 1
+        self._ready.set()
+
+    def get(self, timeout: float) -> np.ndarray:
+        """Next block as a 1-D view, waiting up to timeout (raises queue.Empty)."""
+        if not self._wait(timeout):
+            raise queue.Empty
+        return self._take()
+
+    def drain(self, timeout: float) -> list:
+        """Wait for one block, then take everything already captured (raises queue.Empty on timeout)."""
+        if not self._wait(timeout):
+            raise queue.Empty
+        return [self._take() for _ in range(self._head - self._tail)]
+
+    def clear(self) -> None:
+        """Discard everything captured so far."""
+        self._tail = self._head
+
+    def _take(self) -> np.ndarray:
+        slot = self._tail % len(self._data)
+        block = self._data[slot, :self._lengths[slot]]
+        self._tail += 1
+        return block
+
+    def _wait(self, timeout: float) -> bool:
+        if self._head != self._tail:
+            return True
+        self._ready.clear()
+        if self._head != self._tail:
+            return True
+        self._ready.wait(timeout)
+        return self._head != self._tail
+
 
 def normalize_audio(audio_data: np.ndarray, target_peak: int = 20000) -> np.ndarray:
     """Normalize audio to target peak level for better recognition with low-sensitivity mics."""
-    peak = max(abs(audio_data.min()), abs(audio_data.max()))
+    if audio_data.size == 0:
+        return audio_data
+    # Python ints so -(-32768) can't overflow int16
+    peak = max(-int(audio_data.min()), int(audio_data.max()))
     if peak < 100:
         return audio_data
     gain = min(target_peak / peak, 20.0)
     if gain > 1.5:
-        normalized = np.clip(audio_data.astype(np.float32) * gain, -32768, 32767).astype(np.int16)
-        return normalized
+        # One float32 temporary, clipped in place (no shared scratch: STT workers call this concurrently)
+        scaled = np.multiply(audio_data, np.float32(gain), dtype=np.float32)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        return scaled.astype(np.int16)
     return audio_data
 
 
 def _prepare_audio_for_whisper(audio_data: np.ndarray) -> io.BytesIO:
     """Convert audio data to WAV buffer for Whisper STT."""
-    from pydub import AudioSegment
-    audio = AudioSegment(
-        audio_data.tobytes(),
-        frame_rate=SAMPLE_RATE,
-        sample_width=2,
-        channels=CHANNELS
-    )
     if SAMPLE_RATE != WHISPER_SAMPLE_RATE:
-        audio = audio.set_frame_rate(WHISPER_SAMPLE_RATE)
+        resampled = scipy_signal.resample_poly(audio_data, _WHISPER_UP, _WHISPER_DOWN, window=_WHISPER_FIR)
+        audio_data = np.clip(resampled, -32768, 32767, out=resampled).astype(np.int16)
+    return pcm_to_wav(audio_data, WHISPER_SAMPLE_RATE)
+
+
+def pcm_to_wav(samples: np.ndarray, rate: int) -> io.BytesIO:
+    """Wrap int16 samples in an in-memory WAV file (header plus raw frames)."""
     wav_buffer = io.BytesIO()
-    audio.export(wav_buffer, format="wav")
+    with wave.open(wav_buffer, "wb") as wav:
+        wav.setnchannels(CHANNELS)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.ascontiguousarray(samples, dtype=np.int16).tobytes())
     wav_buffer.seek(0)
     return wav_buffer
 
-
-def _clear_queue(q) -> None:
-    """Clear all items from a queue."""
-    import queue
-    while not q.empty():
-        try:
-            q.get_nowait()
-        except queue.Empty:
-            break
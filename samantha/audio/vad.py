@@ -0,0 +1,119 @@
+"""Voice activity detection backends for Samantha.
+
+Silero VAD (ONNX) is used when onnxruntime is installed and the model file is
+present at ~/.samantha/models/silero_vad.onnx; otherwise WebRTC VAD. Both expose
+webrtcvad's is_speech(frame_bytes, sample_rate) for 16kHz int16 frames.
+"""
+
+import logging
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
+from samantha.config import SAMANTHA_DIR
+
+logger = logging.getLogger("samantha")
+
+SILERO_MODEL_FILE = SAMANTHA_DIR / "models" / "silero_vad.onnx"
+SILERO_SAMPLE_RATE = 16000
+
+VAD_AVAILABLE = webrtcvad is not None or (onnxruntime is not None and SILERO_MODEL_FILE.exists())
+
+
+@lru_cache(maxsize=1)
+def _silero_session():
+    """Shared inference session (recurrent state lives in each SileroVad, so one session serves all)."""
+    if onnxruntime is None or not SILERO_MODEL_FILE.exists():
+        return None
+    try:
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        return onnxruntime.InferenceSession(str(SILERO_MODEL_FILE), sess_options=options,
+                                            providers=["CPUExecutionProvider"])
+    except Exception as e:
+        logger.warning("Failed to load Silero VAD, using WebRTC VAD: %s", e)
+        return None
+
+
+class SileroVad:
+    """Streaming Silero VAD: runs the model once per 512 new samples, 64 samples of context carried over."""
+
+    WINDOW = 512
+    CONTEXT = 64
+
+    def __init__(self, session, threshold: float = 0.5):
+        self._session = session
+        self._threshold = threshold
+        self._sr = np.array(SILERO_SAMPLE_RATE, dtype=np.int64)
+        # Context followed by the window being filled; frames are scaled straight into it
+        self._input = np.zeros((1, self.CONTEXT + self.WINDOW), dtype=np.float32)
+        self.reset()
+
+    def reset(self) -> None:
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._input[:] = 0
+        self._filled = 0
+        self._speech = False
+
+    def is_speech(self, frame: bytes, sample_rate: int) -> bool:
+        """Latest decision after consuming the frame (unchanged if it didn't complete a window)."""
+        samples = np.frombuffer(frame, dtype=np.int16)
+        pos = 0
+        while pos < len(samples):
+            take = min(self.WINDOW - self._filled, len(samples) - pos)
+            start = self.CONTEXT + self._filled
+            np.multiply(samples[pos:pos + take], 1 / 32768, out=self._input[0, start:start + take], casting="unsafe")
+            self._filled += take
+            pos += take
+            if self._filled == self.WINDOW:
+                out, self._state = self._session.run(None, {"input": self._input, "state": self._state, "sr": self._sr})
+                self._speech = float(out[0][0]) > self._threshold
+                self._input[0, :self.CONTEXT] = self._input[0, -self.CONTEXT:]
+                self._filled = 0
+        return self._speech
+
+
+def create_vad(aggressiveness: int, silero_threshold: float = 0.5):
+    """Silero VAD if available, else WebRTC VAD at the given aggressiveness, else None."""
+    session = _silero_session()
+    if session is not None:
+        return SileroVad(session, silero_threshold)
+    if webrtcvad is not None:
+        return webrtcvad.Vad(aggressiveness)
+    return None
+
+
+_VAD_INSTANCES = {}
+
+
+def get_vad(aggressiveness: int, silero_threshold: float = 0.5):
+    """Shared detector per setting; listening and TTS-interrupt detection never run at the same time."""
+    key = (aggressiveness, silero_threshold)
+    if key not in _VAD_INSTANCES:
+        _VAD_INSTANCES[key] = create_vad(aggressiveness, silero_threshold)
+    return _VAD_INSTANCES[key]
+
+
+def reset_vad(detector) -> None:
+    """Clear a shared detector's streaming state (Silero's recurrent state and context; WebRTC keeps none)."""
+    reset = getattr(detector, "reset", None)
+    if reset is not None:
+        reset()
+
+
+def vad_backend() -> str:
+    """Name of the backend create_vad will use, for logging."""
+    if _silero_session() is not None:
+        return "silero"
+    return "webrtc" if webrtcvad is not None else "disabled"
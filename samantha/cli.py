@@ -31,6 +31,17 @@ SERVICES_DIR = SAMANTHA_DIR / "services"
 WHISPER_DIR = SERVICES_DIR / "whisper"
 KOKORO_DIR = SERVICES_DIR / "kokoro"
 
+WHISPER_MODELS = ['tiny', 'base', 'small', 'medium', 'large-v2', 'large-v3']
+# Quantized ggml builds published by whisper.cpp (large-v3 only ships at 5 bits)
+WHISPER_QUANTIZATION = {
+    'tiny': 'q8_0',
+    'base': 'q8_0',
+    'small': 'q8_0',
+    'medium': 'q8_0',
+    'large-v2': 'q8_0',
+    'large-v3': 'q5_0',
+}
+
 
 def print_logo():
     click.echo('\033[38;5;208m' + '\033[1m' + LOGO + '\033[0m')
@@ -56,6 +67,11 @@ def check_command(cmd: str) -> bool:
     return shutil.which(cmd) is not None
 
 
+def whisper_model_name(model: str, quantized: bool = True) -> str:
+    """ggml model name to download, e.g. 'small-q8_0' for quantized weights."""
+    return f"{model}-{WHISPER_QUANTIZATION[model]}" if quantized else model
+
+
 def run_command(cmd: list, cwd: Path = None, capture: bool = False) -> subprocess.CompletedProcess:
     kwargs = {"cwd": cwd, "check": True}
     if capture:
@@ -270,8 +286,8 @@ def setup_launchd_service(name: str, script_path: Path, port: int):
     print_success(f"LaunchAgent created: {plist_name}")
 
 
-def create_whisper_start_script() -> Path:
-    """Create a start script for whisper-server."""
+def create_whisper_start_script(model: str = "base") -> Path:
+    """Create a start script for whisper-server that defaults to the installed model."""
     bin_dir = WHISPER_DIR / "bin"
     bin_dir.mkdir(parents=True, exist_ok=True)
 
@@ -279,7 +295,7 @@ def create_whisper_start_script() -> Path:
 
     script_content = f"""#!/bin/bash
 WHISPER_DIR="{WHISPER_DIR}"
-MODEL_NAME="${{SAMANTHA_WHISPER_MODEL:-base}}"
+MODEL_NAME="${{SAMANTHA_WHISPER_MODEL:-{model}}}"
 MODEL_PATH="$WHISPER_DIR/models/ggml-$MODEL_NAME.bin"
 PORT="${{SAMANTHA_WHISPER_PORT:-2022}}"
 
@@ -324,10 +340,12 @@ def cli():
 @cli.command()
 @click.option('-y', '--yes', is_flag=True, help='Run without prompts (auto-accept all)')
 @click.option('-m', '--model', default='small',
-              type=click.Choice(['tiny', 'base', 'small', 'medium', 'large-v2', 'large-v3']),
+              type=click.Choice(WHISPER_MODELS),
               help='Whisper model to download (default: small)')
+@click.option('--quantized/--full-precision', default=True,
+              help='Download quantized Whisper weights (default; q8_0, or q5_0 for large-v3) or the full-precision model')
 @click.option('--force', is_flag=True, help='Force reinstall even if already installed')
-def install(yes, model, force):
+def install(yes, model, quantized, force):
     """Install Whisper STT and Kokoro TTS services.
 
     This command installs the local voice services required for Samantha:
@@ -343,8 +361,10 @@ def install(yes, model, force):
     Examples:
       samantha-install install              # Install both services
       samantha-install install -m base      # Use smaller/faster Whisper model
+      samantha-install install --full-precision  # Unquantized Whisper weights
       samantha-install install --force      # Reinstall everything
     """
+    model = whisper_model_name(model, quantized)
     print_logo()
     click.echo()
 
@@ -386,7 +406,7 @@ def install(yes, model, force):
     click.echo()
 
     if platform.system() == "Darwin":
-        whisper_script = create_whisper_start_script()
+        whisper_script = create_whisper_start_script(model)
         setup_launchd_service("whisper", whisper_script, 2022)
 
     click.echo()
@@ -449,10 +469,12 @@ def status():
 
 
 @cli.command()
-@click.argument('model', default='base',
-                type=click.Choice(['tiny', 'base', 'small', 'medium', 'large-v2', 'large-v3']))
-def download_model(model):
+@click.argument('model', default='base', type=click.Choice(WHISPER_MODELS))
+@click.option('--quantized/--full-precision', default=True,
+              help='Download quantized weights (default; q8_0, or q5_0 for large-v3) or the full-precision model')
+def download_model(model, quantized):
     """Download an additional Whisper model."""
+    model = whisper_model_name(model, quantized)
     if not WHISPER_DIR.exists():
         print_error("Whisper not installed. Run 'samantha install' first.")
         sys.exit(1)
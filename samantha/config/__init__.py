@@ -44,6 +44,7 @@ from .settings import (
     get_user_names,
     get_voice_message_suffix,
     get_min_audio_energy,
+    get_whisper_language,
     get_wake_words,
     get_stop_phrases,
     get_deactivation_phrases,
@@ -97,6 +98,7 @@ __all__ = [
     "get_user_names",
     "get_voice_message_suffix",
     "get_min_audio_energy",
+    "get_whisper_language",
     "get_wake_words",
     "get_stop_phrases",
     "get_deactivation_phrases",
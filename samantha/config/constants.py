@@ -4,7 +4,7 @@ import os
 import re
 from pathlib import Path
 
-SAMPLE_RATE = 24000
+SAMPLE_RATE = 16000
 WHISPER_SAMPLE_RATE = 16000
 CHANNELS = 1
 WHISPER_URL = os.getenv("WHISPER_URL", "http://localhost:2022/v1/audio/transcriptions")
@@ -79,7 +79,7 @@ VOICE_MESSAGE_PREFIX = "[🎙️ Voice - samantha_speak]"
 DEFAULT_AI_PROCESS_PATTERN = "claude|gemini|copilot|aider|chatgpt|gpt|sgpt|codex"
 DEFAULT_AI_WINDOW_TITLES = ["claude", "gemini", "copilot", "aider", "chatgpt", "gpt"]
 
-WHISPER_SOUND_PATTERN = re.compile(r"\[.*?\]|\(.*?\)|♪+", re.IGNORECASE)
+WHISPER_SOUND_PATTERN = re.compile(r"\[.*?\]|\(.*?\)|♪+")
 
 # IDEs with Claude Code extension/plugin support (Cmd/Ctrl+Escape focuses Claude input)
 # VS Code family: VS Code, Cursor, Windsurf
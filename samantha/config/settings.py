@@ -1,7 +1,11 @@
 """Configuration settings for Samantha voice assistant."""
 
+import functools
+import itertools
+import json
 import logging
 import os
+import time
 
 from .constants import (
     CONFIG_FILE,
@@ -16,15 +20,59 @@ from .profiles import PROFILES, DEFAULT_PROFILE
 logger = logging.getLogger("samantha")
 
 
+# Parsed config keyed on the file's (mtime, size); getters run per utterance, so avoid re-reading JSON.
+# The file is stat'ed at most once per _CONFIG_STAT_INTERVAL; "generation" bumps whenever the data changes.
+_CONFIG_STAT_INTERVAL = 1.0
+_config_cache = {"stamp": None, "data": {}, "checked": None, "generation": 0}
+# Generations are never reused, so a getter memo can't mistake new data for data it already saw
+_generations = itertools.count(1)
+
+
 def load_config() -> dict:
-    """Load configuration from ~/.samantha/config.json if it exists."""
-    if CONFIG_FILE.exists():
+    """Load configuration from ~/.samantha/config.json if it exists.
+
+    Re-parsed only when the file changes. The returned dict is shared; don't mutate it.
+    """
+    now = time.monotonic()
+    checked = _config_cache["checked"]
+    if checked is not None and now - checked < _CONFIG_STAT_INTERVAL:
+        return _config_cache["data"]
+    _config_cache["checked"] = now
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
+        if _config_cache["stamp"] is not None or _config_cache["data"]:
+            _config_cache["generation"] = next(_generations)
+        _config_cache["stamp"] = None
+        _config_cache["data"] = {}
+        return _config_cache["data"]
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp != _config_cache["stamp"]:
         try:
-            import json
-            return json.loads(CONFIG_FILE.read_text())
+            data = json.loads(CONFIG_FILE.read_text())
         except Exception as e:
             logger.warning("Failed to load config: %s", e)
-    return {}
+            data = {}
+        _config_cache["stamp"] = stamp
+        _config_cache["data"] = data
+        _config_cache["generation"] = next(_generations)
+    return _config_cache["data"]
+
+
+def _per_config(getter):
+    """Memoize a no-argument getter until the config file changes."""
+    memo = {}
+
+    @functools.wraps(getter)
+    def wrapper():
+        load_config()
+        generation = _config_cache["generation"]
+        if memo.get("generation") != generation:
+            memo["value"] = getter()
+            memo["generation"] = generation
+        return memo["value"]
+
+    return wrapper
 
 
 def get_config(key: str, default=None):
@@ -39,6 +87,7 @@ def get_config(key: str, default=None):
     return default
 
 
+@_per_config
 def get_profile_name() -> str:
     """Get active profile name: 'samantha', 'jarvis', etc."""
     val = get_config("profile", DEFAULT_PROFILE)
@@ -52,11 +101,13 @@ def get_profile() -> dict:
     return PROFILES[get_profile_name()]
 
 
+@_per_config
 def get_voice() -> str:
     profile = get_profile()
     return get_config("voice", profile["voice"])
 
 
+@_per_config
 def get_input_device():
     """Get configured input device, or system default."""
     val = get_config("input_device")
@@ -66,6 +117,7 @@ def get_input_device():
     return None
 
 
+@_per_config
 def get_output_device():
     """Get configured output device, or system default."""
     val = get_config("output_device")
@@ -75,24 +127,34 @@ def get_output_device():
     return None
 
 
-def get_restore_focus() -> bool:
-    val = get_config("restore_focus", "true")
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _bool_config(key: str, default: bool = True) -> bool:
+    """Boolean setting that may be written as a JSON bool or a string like "true"/"yes"."""
+    val = get_config(key)
+    if val is None:
+        return default
     if isinstance(val, bool):
         return val
-    return str(val).lower() == "true"
+    return str(val).strip().lower() in _TRUE_VALUES
+
+
+@_per_config
+def get_restore_focus() -> bool:
+    return _bool_config("restore_focus")
 
 
+@_per_config
 def get_theodore_mode() -> bool:
     """Check if Theodore mode is enabled (call user Theodore from the movie Her).
 
     For backward compatibility. Prefer get_user_names() for profile-aware usage.
     """
-    val = get_config("theodore", "true")
-    if isinstance(val, bool):
-        return val
-    return str(val).lower() == "true"
+    return _bool_config("theodore")
 
 
+@_per_config
 def get_user_names() -> list[str]:
     """Get the in-character forms of address for the user.
 
@@ -130,6 +192,7 @@ def get_user_names() -> list[str]:
     return []
 
 
+@_per_config
 def get_min_audio_energy() -> int:
     """Get minimum audio energy threshold for Whisper.
 
@@ -153,6 +216,14 @@ def get_min_audio_energy() -> int:
         return 1500
 
 
+@_per_config
+def get_whisper_language() -> str:
+    """Language passed to Whisper ("en" by default; "auto" lets Whisper detect it)."""
+    val = get_config("whisper_language", "en")
+    return str(val).strip().lower() or "en"
+
+
+@_per_config
 def get_wake_words() -> list:
     config_words = get_config("wake_words")
     if config_words:
@@ -163,11 +234,13 @@ def get_wake_words() -> list:
     return profile.get("wake_words", DEFAULT_WAKE_WORDS)
 
 
+@_per_config
 def get_stop_phrases() -> list:
     profile = get_profile()
     return profile.get("stop_phrases", STOP_PHRASES)
 
 
+@_per_config
 def get_deactivation_phrases() -> list:
     config_phrases = get_config("deactivation_words")
     if config_phrases:
@@ -178,6 +251,7 @@ def get_deactivation_phrases() -> list:
     return profile.get("deactivation_words", DEFAULT_DEACTIVATION_PHRASES)
 
 
+@_per_config
 def get_target_app() -> str | None:
     """Get user's preferred target app for injection.
 
@@ -192,6 +266,7 @@ def get_target_app() -> str | None:
     return None
 
 
+@_per_config
 def get_injection_mode() -> str:
     """Get injection mode: 'auto', 'extension', 'cli', 'terminal', or 'desktop'.
 
@@ -209,6 +284,7 @@ def get_injection_mode() -> str:
     return "auto"
 
 
+@_per_config
 def get_ai_process_pattern() -> str:
     """Get AI process detection pattern (regex).
 
@@ -223,6 +299,7 @@ def get_ai_process_pattern() -> str:
     return DEFAULT_AI_PROCESS_PATTERN
 
 
+@_per_config
 def get_ai_window_titles() -> list[str]:
     """Get AI window titles to search for.
 
@@ -234,6 +311,7 @@ def get_ai_window_titles() -> list[str]:
     return DEFAULT_AI_WINDOW_TITLES
 
 
+@_per_config
 def get_voice_message_suffix() -> str:
     """Build the runtime voice-mode reminder appended to every voice message.
 
@@ -1,18 +1,17 @@
 """Main Samantha voice assistant loop."""
 
 import logging
+import queue
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from math import gcd
+from typing import Optional
 
 import numpy as np
 import sounddevice as sd
-
-try:
-    import webrtcvad
-    VAD_AVAILABLE = True
-except ImportError:
-    webrtcvad = None
-    VAD_AVAILABLE = False
+from scipy import signal as scipy_signal
 
 from samantha.config import (
     SAMPLE_RATE,
@@ -21,15 +20,16 @@ from samantha.config import (
     get_input_device,
     get_voice_message_suffix,
 )
-from samantha.audio.recording import _clear_queue
+from samantha.audio.recording import AudioBuffer, CaptureRing
+from samantha.audio.vad import VAD_AVAILABLE, get_vad, reset_vad, vad_backend
 import samantha.audio.playback as playback
 from samantha.audio.processing import (
     is_echo,
     get_active_interrupt_words,
-    contains_interrupt_phrase,
-    contains_skip_phrase,
+    detect_control_words,
 )
-from samantha.speech.stt import transcribe_audio_sync
+from samantha.speech.stt import transcribe_audio_sync, transcribe_segments_sync
+from samantha.speech.streaming import StreamingTranscriber
 from samantha.utils.text import (
     check_for_deactivation,
     clean_command,
@@ -43,10 +43,106 @@ import samantha.core.state as state
 
 logger = logging.getLogger("samantha")
 
+VAD_CHUNK_DURATION_MS = 30
+VAD_SAMPLE_RATE = 16000
+
+# Polyphase resampling ratio and anti-aliasing filter for SAMPLE_RATE -> VAD_SAMPLE_RATE
+_VAD_GCD = gcd(SAMPLE_RATE, VAD_SAMPLE_RATE)
+_VAD_UP = VAD_SAMPLE_RATE // _VAD_GCD
+_VAD_DOWN = SAMPLE_RATE // _VAD_GCD
+_VAD_FIR = None
+if SAMPLE_RATE != VAD_SAMPLE_RATE:
+    _VAD_FIR = scipy_signal.firwin(2 * 16 * max(_VAD_UP, _VAD_DOWN) + 1, 1 / max(_VAD_UP, _VAD_DOWN))
+# Integer-ratio rates (e.g. 48k -> 16k) only need a low-pass and a stride
+_VAD_DECIM = SAMPLE_RATE // VAD_SAMPLE_RATE if _VAD_UP == 1 else None
+_VAD_LP_SOS = scipy_signal.butter(4, 0.9 / _VAD_DECIM, output='sos') if _VAD_DECIM and _VAD_DECIM > 1 else None
+VAD_FRAME_SAMPLES = VAD_SAMPLE_RATE * VAD_CHUNK_DURATION_MS // 1000
+# Reused int16 output for _vad_bytes; webrtcvad reads it through a byte view, so no per-frame allocation
+_VAD_SCRATCH = np.empty(VAD_FRAME_SAMPLES, dtype=np.int16)
+_VAD_SCRATCH_BYTES = memoryview(_VAD_SCRATCH).cast('B')
+
+# Idle pre-gate: chunks below these levels are silence/rumble and skip webrtcvad
+IDLE_GATE_MIN_RMS = 100
+IDLE_GATE_MIN_ZERO_CROSSINGS = 3
+# ...and chunks whose peak isn't clearly above the running background level skip it too
+NOISE_FLOOR_RATIO = 2.0
+NOISE_FLOOR_ALPHA = 0.05
+NOISE_FLOOR_WINDOW = 5
+
+
+class NoiseFloor:
+    """EWMA of the peak level of idle chunks the cheap gate or VAD judged not to be speech.
+
+    Each update uses the median of the last few peaks, so a lone transient (a door, a key
+    slam) doesn't lift the floor.
+    """
+
+    def __init__(self, ratio: float = NOISE_FLOOR_RATIO, alpha: float = NOISE_FLOOR_ALPHA, window: int = NOISE_FLOOR_WINDOW):
+        self.ratio = ratio
+        self.alpha = alpha
+        self.level = 0.0
+        self._peaks = deque(maxlen=window)
+
+    def exceeds(self, peak: int) -> bool:
+        return peak > self.ratio * self.level
+
+    def update(self, peak: int) -> None:
+        self._peaks.append(peak)
+        median = sorted(self._peaks)[len(self._peaks) // 2]
+        self.level += self.alpha * (median - self.level)
+
+
+def _vad_resample(chunk_flat: np.ndarray) -> np.ndarray:
+    """Bring a capture chunk to VAD_SAMPLE_RATE using the cheapest exact-enough path."""
+    if _VAD_DECIM == 1:
+        return chunk_flat
+    if _VAD_DECIM:
+        return scipy_signal.sosfilt(_VAD_LP_SOS, chunk_flat)[::_VAD_DECIM]
+    return scipy_signal.resample_poly(chunk_flat, _VAD_UP, _VAD_DOWN, window=_VAD_FIR)
+
+
+def _vad_bytes(chunk_flat: np.ndarray) -> memoryview:
+    """Resample a capture chunk to one 16-bit VAD frame for webrtcvad.
+
+    Returns a byte view of a shared scratch buffer, valid until the next call (loop thread only).
+    At the native rate a contiguous int16 chunk is viewed directly, with no copy at all.
+    """
+    if _VAD_DECIM == 1 and chunk_flat.dtype == np.int16 and chunk_flat.flags.c_contiguous:
+        return memoryview(chunk_flat[:VAD_FRAME_SAMPLES]).cast('B')
+    vad_chunk = _vad_resample(chunk_flat)[:VAD_FRAME_SAMPLES]
+    n = len(vad_chunk)
+    np.clip(vad_chunk, -32768, 32767, out=_VAD_SCRATCH[:n], casting='unsafe')
+    return _VAD_SCRATCH_BYTES[:2 * n]
+
+
+def _cheap_speech_batch(frames: np.ndarray) -> np.ndarray:
+    """Row-wise RMS + zero-crossing check over (n_chunks, samples); False rows can't be speech."""
+    samples = frames.astype(np.float32)
+    rms = np.sqrt(np.mean(samples * samples, axis=1))
+    negative = np.signbit(frames)
+    crossings = np.count_nonzero(negative[:, 1:] != negative[:, :-1], axis=1)
+    return (rms >= IDLE_GATE_MIN_RMS) & (crossings >= IDLE_GATE_MIN_ZERO_CROSSINGS)
+
+
+def _cheap_speech(chunk_flat: np.ndarray) -> bool:
+    """RMS + zero-crossing check for a single chunk."""
+    return bool(_cheap_speech_batch(chunk_flat[np.newaxis, :])[0])
+
+
+def _peak(chunk_flat: np.ndarray) -> int:
+    """Absolute peak as a Python int (no int16 overflow on -32768)."""
+    return max(int(chunk_flat.max()), -int(chunk_flat.min()))
+
+
+def _idle_gate(chunks: list) -> Optional[np.ndarray]:
+    """Gate a drained batch in one vectorized pass (None if chunk sizes differ)."""
+    if len({chunk.size for chunk in chunks}) != 1:
+        return None
+    return _cheap_speech_batch(np.stack([chunk.reshape(-1) for chunk in chunks]))
+
 
 def samantha_loop_thread():
     """Main Samantha voice assistant loop running in a dedicated thread."""
-    global _thread_stop_flag, _tts_playing, _last_tts_time, _tts_start_time, _tts_interrupt, _thread_ready, _tts_done_event, _tts_text_queue
 
     playback.refresh_audio_devices()
 
@@ -57,45 +153,143 @@ def samantha_loop_thread():
     except Exception:
         device_name = f"device {input_dev}"
 
-    logger.info("🎧 Samantha thread started (VAD: %s, mic: %s)", "enabled" if VAD_AVAILABLE else "disabled", device_name)
+    logger.info("🎧 Samantha thread started (VAD: %s, mic: %s)", vad_backend() if VAD_AVAILABLE else "disabled", device_name)
     logger.info("   Say 'Hey Samantha' to activate")
 
-    import queue
-    from scipy import signal as scipy_signal
-
-    VAD_CHUNK_DURATION_MS = 30
     SILENCE_THRESHOLD_MS = 1000
     MIN_RECORDING_DURATION = 0.3
     INITIAL_SILENCE_GRACE_PERIOD = 1.0
-    VAD_SAMPLE_RATE = 16000
     VAD_AGGRESSIVENESS_LISTENING = 1
     VAD_AGGRESSIVENESS_TTS = 1
+    SILERO_THRESHOLD_LISTENING = 0.5
+    SILERO_THRESHOLD_TTS = 0.5
     MAX_INACTIVE_AUDIO_MS = 15000
+    STREAMING_INTERVAL_MS = 700
+    INTERRUPT_WINDOW_MS = 1500
 
     chunk_samples = int(SAMPLE_RATE * VAD_CHUNK_DURATION_MS / 1000)
-    vad_chunk_samples = int(VAD_SAMPLE_RATE * VAD_CHUNK_DURATION_MS / 1000)
     silence_timeout = 1800.0
 
     is_active = False
     last_speech_time = 0
-    audio_chunks = []
+    audio_buffer = AudioBuffer(2 * SAMPLE_RATE * MAX_INACTIVE_AUDIO_MS // 1000)
     silence_duration_ms = 0
     speech_detected = False
     recording_start = 0
 
-    audio_queue = queue.Queue()
+    stt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="samantha-stt")
+    final_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="samantha-final")
+    # Utterances being finalized off-thread, handled strictly in the order they were spoken
+    pending_utterances = deque()
+
+    # Whisper check of the speech heard during TTS, run on the STT worker
+    interrupt_check = None
+
+    def discard_captured_audio():
+        """Drop unread mic audio and any utterance in progress (TTS start, interrupt, post-TTS)."""
+        nonlocal speech_detected, silence_duration_ms, recording_start, interrupt_check
+        capture.clear()
+        speech_detected = False
+        audio_buffer.reset()
+        streamer.reset()
+        interrupt_audio.reset()
+        interrupt_check = None
+        silence_duration_ms = 0
+        recording_start = 0
+        # Detectors are shared across modes and sessions; don't let the old stream steer the new one
+        reset_vad(vad)
+        reset_vad(vad_tts)
+
+    def handle_interrupt_check(raw_text):
+        nonlocal last_speech_time
+        text = sanitize_whisper_text(raw_text) if raw_text else ""
+        is_interrupt, is_skip = detect_control_words(text)
+        if not (is_interrupt or is_skip):
+            return
+
+        is_skip_only = is_skip and not is_interrupt
+        logger.info("🔍 TTS interrupt check: %s", text[:50])
+        if is_skip_only:
+            logger.info("⏭️ Skip to next detected: %s", text[:50])
+            log_conversation("SKIP", text)
+        else:
+            logger.info("🛑 Interrupt detected: %s", text[:50])
+            log_conversation("INTERRUPT", text)
+            with playback._tts_queue_lock:
+                playback._tts_text_queue.clear()
+        playback._tts_interrupt = True
+        playback._tts_playing = False
+        # Wait for playback to actually stop (not a fixed delay) before flushing mic audio
+        if state._tts_done_event:
+            state._tts_done_event.wait(timeout=0.2)
+        discard_captured_audio()
+        if is_skip_only:
+            playback.play_sound("skip")
+        else:
+            playback.play_sound("stop")
+        if is_active:
+            last_speech_time = time.monotonic()
+
+    def new_streamer():
+        return StreamingTranscriber(transcribe_segments_sync, stt_executor, SAMPLE_RATE * STREAMING_INTERVAL_MS // 1000, SAMPLE_RATE)
+
+    streamer = new_streamer()
+
+    def handle_utterance(text):
+        nonlocal is_active, last_speech_time
+        if not text or text == "[BLANK_AUDIO]":
+            return
+        if is_echo(text):
+            logger.debug("Filtered as echo: %s", text[:50])
+            return
+        if is_noise(text):
+            logger.debug("Filtered as noise: %s", text[:50])
+            return
+
+        logger.info("📝 Heard (active=%s): %s", is_active, text[:100])
+
+        if is_active:
+            if check_for_deactivation(text):
+                logger.info("😴 Deactivating - returning to idle")
+                is_active = False
+                playback.play_sound("deactivate")
+            else:
+                logger.info("🟢 Active - sending to Claude")
+                last_speech_time = time.monotonic()
+                cleaned = clean_command(text)
+                if cleaned:
+                    log_conversation("STT", cleaned)
+                    inject_into_app(f"{VOICE_MESSAGE_PREFIX} {cleaned}{get_voice_message_suffix()}")
+        elif contains_trigger_word(text):
+            logger.info("✨ Activated!")
+            is_active = True
+            last_speech_time = time.monotonic()
+            playback.play_sound("activate")
+        else:
+            logger.debug("No trigger - discarding")
+
+    # Speech heard during TTS, a sliding window of the last INTERRUPT_WINDOW_MS re-sent on each
+    # check so a phrase split across checks is still heard
+    interrupt_window_samples = SAMPLE_RATE * INTERRUPT_WINDOW_MS // 1000
+    interrupt_audio = AudioBuffer(2 * interrupt_window_samples)
+
+    noise_floor = NoiseFloor()
+    capture = CaptureRing(MAX_INACTIVE_AUDIO_MS // VAD_CHUNK_DURATION_MS, chunk_samples)
 
     def audio_callback(indata, frames, callback_time, status):
         if status:
             logger.warning("Audio stream status: %s", status)
-        audio_queue.put(indata.copy())
+        capture.put_raw(indata)
 
     try:
-        vad = webrtcvad.Vad(VAD_AGGRESSIVENESS_LISTENING) if VAD_AVAILABLE else None
-        vad_tts = webrtcvad.Vad(VAD_AGGRESSIVENESS_TTS) if VAD_AVAILABLE else None
-
-        with sd.InputStream(samplerate=SAMPLE_RATE, channels=CHANNELS, dtype=np.int16,
-                           callback=audio_callback, blocksize=chunk_samples, device=get_input_device()) as stream:
+        vad = get_vad(VAD_AGGRESSIVENESS_LISTENING, SILERO_THRESHOLD_LISTENING) if VAD_AVAILABLE else None
+        vad_tts = get_vad(VAD_AGGRESSIVENESS_TTS, SILERO_THRESHOLD_TTS) if VAD_AVAILABLE else None
+        reset_vad(vad)
+        reset_vad(vad_tts)
+
+        # Raw stream: the callback gets the PortAudio buffer itself and copies its bytes into the ring
+        with sd.RawInputStream(samplerate=SAMPLE_RATE, channels=CHANNELS, dtype="int16",
+                               callback=audio_callback, blocksize=chunk_samples, device=get_input_device()) as stream:
             state._audio_stream = stream
             logger.debug("Started continuous audio stream")
 
@@ -104,22 +298,22 @@ def samantha_loop_thread():
 
             while not state._thread_stop_flag:
                 try:
+                    while pending_utterances and pending_utterances[0].done():
+                        handle_utterance(pending_utterances.popleft().result())
+
                     tts_text = None
-                    if not playback._tts_playing:
+                    # Unlocked emptiness peek first: the lock is only taken when something is queued
+                    if not playback._tts_playing and playback._tts_text_queue:
                         with playback._tts_queue_lock:
                             if playback._tts_text_queue:
                                 tts_text = playback._tts_text_queue.pop(0)
 
                     if tts_text:
                         playback._tts_playing = True
-                        playback._tts_start_time = time.time()
+                        playback._tts_start_time = time.monotonic()
                         state._tts_done_event = threading.Event()
 
-                        _clear_queue(audio_queue)
-                        speech_detected = False
-                        audio_chunks = []
-                        silence_duration_ms = 0
-                        recording_start = 0
+                        discard_captured_audio()
 
                         done_event = state._tts_done_event
                         tts_text_to_speak = tts_text
@@ -131,7 +325,7 @@ def samantha_loop_thread():
                             try:
                                 playback.speak_tts_sync(tts_text_to_speak)
                             finally:
-                                playback._last_tts_time = time.time()
+                                playback._last_tts_time = time.monotonic()
                                 playback._tts_start_time = 0
                                 playback._tts_playing = False
                                 playback._post_tts_pending = True
@@ -141,159 +335,124 @@ def samantha_loop_thread():
                         tts_thread.start()
 
                     if playback._tts_playing:
+                        if interrupt_check is not None and interrupt_check.done():
+                            check, interrupt_check = interrupt_check, None
+                            try:
+                                raw_text = check.result()
+                            except Exception as e:
+                                logger.debug("TTS interrupt check failed: %s", e)
+                                raw_text = None
+                            handle_interrupt_check(raw_text)
+                            continue
+
                         try:
-                            chunk = audio_queue.get(timeout=0.05)
-                            chunk_flat = chunk.flatten()
+                            chunk_flat = capture.get(timeout=0.05)
 
                             is_speech_chunk = False
                             if vad_tts:
-                                resampled_length = int(len(chunk_flat) * VAD_SAMPLE_RATE / SAMPLE_RATE)
-                                vad_chunk = scipy_signal.resample(chunk_flat, resampled_length)
-                                vad_chunk = vad_chunk[:vad_chunk_samples].astype(np.int16)
                                 try:
-                                    is_speech_chunk = vad_tts.is_speech(vad_chunk.tobytes(), VAD_SAMPLE_RATE)
+                                    is_speech_chunk = vad_tts.is_speech(_vad_bytes(chunk_flat), VAD_SAMPLE_RATE)
                                 except Exception:
                                     is_speech_chunk = False
 
                             if is_speech_chunk:
-                                audio_chunks.append(chunk_flat)
-
-                            accumulated_duration_ms = len(audio_chunks) * VAD_CHUNK_DURATION_MS
-                            tts_elapsed = time.time() - playback._tts_start_time if playback._tts_start_time > 0 else 0
-                            if accumulated_duration_ms >= 300 and tts_elapsed >= 2.0:
-                                full_audio = np.concatenate(audio_chunks)
-                                raw_text = transcribe_audio_sync(full_audio)
-                                text = sanitize_whisper_text(raw_text) if raw_text else ""
-
-                                is_interrupt = text and contains_interrupt_phrase(text)
-                                is_skip = text and contains_skip_phrase(text)
-
-                                if is_interrupt or is_skip:
-                                    is_skip_only = is_skip and not is_interrupt
-                                    logger.info("🔍 TTS interrupt check: %s", text[:50])
-                                    if is_skip_only:
-                                        logger.info("⏭️ Skip to next detected: %s", text[:50])
-                                        log_conversation("SKIP", text)
-                                    else:
-                                        logger.info("🛑 Interrupt detected: %s", text[:50])
-                                        log_conversation("INTERRUPT", text)
-                                        with playback._tts_queue_lock:
-                                            playback._tts_text_queue.clear()
-                                    playback._tts_interrupt = True
-                                    playback._tts_playing = False
-                                    time.sleep(0.1)
-                                    _clear_queue(audio_queue)
-                                    if is_skip_only:
-                                        playback.play_sound("skip")
-                                    else:
-                                        playback.play_sound("stop")
-                                    if is_active:
-                                        last_speech_time = time.time()
-
-                                audio_chunks = []
+                                audio_buffer.append(chunk_flat)
+
+                            accumulated_duration_ms = len(audio_buffer) * 1000 // SAMPLE_RATE
+                            # One check in flight at a time; the mic keeps being read while Whisper works
+                            if (interrupt_check is None and accumulated_duration_ms >= 300
+                                    and playback._tts_start_time > 0 and time.monotonic() - playback._tts_start_time >= 2.0):
+                                interrupt_audio.append(audio_buffer.view())
+                                interrupt_audio.keep_last(interrupt_window_samples)
+                                interrupt_check = stt_executor.submit(transcribe_audio_sync, interrupt_audio.view().copy())
+                                audio_buffer.reset()
+                                streamer.reset()
 
                         except queue.Empty:
                             pass
                         continue
 
                     if playback._post_tts_pending:
-                        logger.debug("🧹 Post-TTS cleanup: clearing audio queue and buffers")
-                        _clear_queue(audio_queue)
-                        speech_detected = False
-                        audio_chunks = []
-                        silence_duration_ms = 0
-                        recording_start = 0
+                        logger.debug("🧹 Post-TTS cleanup: clearing captured audio and buffers")
+                        discard_captured_audio()
                         playback._post_tts_pending = False
                         if is_active:
-                            last_speech_time = time.time()
+                            last_speech_time = time.monotonic()
                         continue
 
                     if is_active:
-                        silence_elapsed = time.time() - last_speech_time
+                        silence_elapsed = time.monotonic() - last_speech_time
                         if silence_elapsed > silence_timeout:
                             logger.info("⏰ 30min silence - returning to idle")
                             is_active = False
                             playback.play_sound("timeout")
 
                     try:
-                        chunk = audio_queue.get(timeout=0.1)
+                        chunks = capture.drain(timeout=0.2)
                     except queue.Empty:
                         continue
 
-                    chunk_flat = chunk.flatten()
-                    audio_chunks.append(chunk_flat)
+                    # One clock read per drained batch; the chunks in it arrived together anyway
+                    now = time.monotonic()
+                    idle_gate = None if is_active else _idle_gate(chunks)
 
-                    if not is_active:
-                        max_chunks = MAX_INACTIVE_AUDIO_MS // VAD_CHUNK_DURATION_MS
-                        if len(audio_chunks) > max_chunks:
-                            audio_chunks = audio_chunks[-max_chunks:]
+                    for i, chunk_flat in enumerate(chunks):
+                        audio_buffer.append(chunk_flat)
 
-                    is_speech = False
-                    if vad:
-                        resampled_length = int(len(chunk_flat) * VAD_SAMPLE_RATE / SAMPLE_RATE)
-                        vad_chunk = scipy_signal.resample(chunk_flat, resampled_length)
-                        vad_chunk = vad_chunk[:vad_chunk_samples].astype(np.int16)
-                        try:
-                            is_speech = vad.is_speech(vad_chunk.tobytes(), VAD_SAMPLE_RATE)
-                        except Exception:
+                        if not is_active:
+                            audio_buffer.keep_last(SAMPLE_RATE * MAX_INACTIVE_AUDIO_MS // 1000)
+
+                        peak = None if is_active else _peak(chunk_flat)
+                        below_floor = False
+                        if not is_active and not (idle_gate[i] if idle_gate is not None else _cheap_speech(chunk_flat)):
+                            is_speech = False
+                        elif not is_active and not noise_floor.exceeds(peak):
+                            is_speech = False
+                            below_floor = True
+                        elif vad:
+                            try:
+                                is_speech = vad.is_speech(_vad_bytes(chunk_flat), VAD_SAMPLE_RATE)
+                            except Exception:
+                                is_speech = True
+                        else:
                             is_speech = True
-                    else:
-                        is_speech = True
-
-                    if not speech_detected:
-                        if is_speech:
-                            logger.info("🎙️ Speech detected, starting active recording")
-                            speech_detected = True
-                            recording_start = time.time()
-                            silence_duration_ms = 0
-                            audio_chunks = [chunk_flat]
-                    else:
-                        if is_speech:
-                            silence_duration_ms = 0
+
+                        # Learn only from chunks the gate or VAD called silence; learning from
+                        # the floor's own rejections would ratchet it up over quiet speech
+                        if peak is not None and not is_speech and not below_floor:
+                            noise_floor.update(peak)
+
+                        if not speech_detected:
+                            if is_speech:
+                                logger.info("🎙️ Speech detected, starting active recording")
+                                speech_detected = True
+                                recording_start = now
+                                silence_duration_ms = 0
+                                audio_buffer.reset()
+                                streamer.reset()
+                                audio_buffer.append(chunk_flat)
                         else:
-                            silence_duration_ms += VAD_CHUNK_DURATION_MS
-
-                            recording_duration = time.time() - recording_start
-                            past_grace_period = recording_duration >= INITIAL_SILENCE_GRACE_PERIOD
-                            if recording_duration >= MIN_RECORDING_DURATION and silence_duration_ms >= SILENCE_THRESHOLD_MS and past_grace_period:
-                                logger.info("✓ Silence threshold reached after %.1fs", recording_duration)
-
-                                if not playback._tts_playing and audio_chunks:
-                                    full_audio = np.concatenate(audio_chunks)
-                                    text = transcribe_audio_sync(full_audio)
-
-                                    if text:
-                                        if is_echo(text):
-                                            logger.debug("Filtered as echo: %s", text[:50])
-                                        elif is_noise(text):
-                                            logger.debug("Filtered as noise: %s", text[:50])
-
-                                    if text and text not in ["[BLANK_AUDIO]", ""] and not is_echo(text) and not is_noise(text):
-                                        logger.info("📝 Heard (active=%s): %s", is_active, text[:100])
-
-                                        if is_active:
-                                            if check_for_deactivation(text):
-                                                logger.info("😴 Deactivating - returning to idle")
-                                                is_active = False
-                                                playback.play_sound("deactivate")
-                                            else:
-                                                logger.info("🟢 Active - sending to Claude")
-                                                last_speech_time = time.time()
-                                                cleaned = clean_command(text)
-                                                if cleaned:
-                                                    log_conversation("STT", cleaned)
-                                                    inject_into_app(f"{VOICE_MESSAGE_PREFIX} {cleaned}{get_voice_message_suffix()}")
-                                        elif contains_trigger_word(text):
-                                            logger.info("✨ Activated!")
-                                            is_active = True
-                                            last_speech_time = time.time()
-                                            playback.play_sound("activate")
-                                        else:
-                                            logger.debug("No trigger - discarding")
-
-                                speech_detected = False
-                                audio_chunks = []
+                            if is_active:
+                                streamer.feed(audio_buffer.view(), is_speech)
+                            if is_speech:
                                 silence_duration_ms = 0
+                            else:
+                                silence_duration_ms += VAD_CHUNK_DURATION_MS
+
+                                recording_duration = now - recording_start
+                                past_grace_period = recording_duration >= INITIAL_SILENCE_GRACE_PERIOD
+                                if recording_duration >= MIN_RECORDING_DURATION and silence_duration_ms >= SILENCE_THRESHOLD_MS and past_grace_period:
+                                    logger.info("✓ Silence threshold reached after %.1fs", recording_duration)
+
+                                    if not playback._tts_playing and len(audio_buffer):
+                                        # Finalize on a worker so the mic keeps being read during the Whisper round-trip
+                                        pending_utterances.append(final_executor.submit(streamer.finalize, audio_buffer.view().copy()))
+                                        streamer = new_streamer()
+
+                                    speech_detected = False
+                                    audio_buffer.reset()
+                                    streamer.reset()
+                                    silence_duration_ms = 0
 
                 except Exception as e:
                     logger.error("Loop error: %s", e)
@@ -303,5 +462,7 @@ def samantha_loop_thread():
         logger.error("Stream error: %s", e)
     finally:
         state._audio_stream = None
+        stt_executor.shutdown(wait=False, cancel_futures=True)
+        final_executor.shutdown(wait=False, cancel_futures=True)
 
     logger.info("🛑 Samantha thread stopped")
@@ -15,6 +15,7 @@ from .detection import (
     is_ai_running_in_ide_terminal,
     find_terminal_with_ai,
     activate_terminal_with_ai,
+    invalidate_detection_cache,
 )
 
 from .inject import (
@@ -43,6 +44,7 @@ __all__ = [
     "is_ai_running_in_ide_terminal",
     "find_terminal_with_ai",
     "activate_terminal_with_ai",
+    "invalidate_detection_cache",
     # Inject
     "simulate_paste_and_enter",
     "focus_ide_ai_input",
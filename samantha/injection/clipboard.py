@@ -3,34 +3,54 @@
 import logging
 import platform
 import shutil
-import subprocess
+
+from samantha.utils import process
 
 logger = logging.getLogger("samantha")
 
 PLATFORM = platform.system()
 
+# In-process pasteboard on macOS when pyobjc is installed; pbcopy otherwise
+NSPasteboard = None
+if PLATFORM == "Darwin":
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        NSPasteboard = None
+
+_LINUX_CLIP_COMMANDS = {
+    "xclip": ["xclip", "-selection", "clipboard"],
+    "xsel": ["xsel", "--clipboard", "--input"],
+    "wl-copy": ["wl-copy"],
+}
+_LINUX_CLIP = None
+if PLATFORM == "Linux":
+    _LINUX_CLIP = next((tool for tool in _LINUX_CLIP_COMMANDS if shutil.which(tool)), None)
+
+
+def _copy_with_pasteboard(text: str) -> bool:
+    """Write text to the general pasteboard without spawning pbcopy."""
+    pasteboard = NSPasteboard.generalPasteboard()
+    pasteboard.clearContents()
+    return bool(pasteboard.setString_forType_(text, NSPasteboardTypeString))
+
 
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to clipboard (cross-platform)."""
     try:
         if PLATFORM == "Darwin":
-            subprocess.run(["pbcopy"], input=text.encode(), check=True)
+            if NSPasteboard is not None and _copy_with_pasteboard(text):
+                return True
+            process.run(["pbcopy"], input=text.encode(), check=True)
             return True
         elif PLATFORM == "Linux":
-            if shutil.which("xclip"):
-                subprocess.run(["xclip", "-selection", "clipboard"], input=text.encode(), check=True)
-                return True
-            elif shutil.which("xsel"):
-                subprocess.run(["xsel", "--clipboard", "--input"], input=text.encode(), check=True)
-                return True
-            elif shutil.which("wl-copy"):
-                subprocess.run(["wl-copy"], input=text.encode(), check=True)
-                return True
-            else:
+            if not _LINUX_CLIP:
                 logger.error("No clipboard tool found (xclip, xsel, or wl-copy)")
                 return False
+            process.run(_LINUX_CLIP_COMMANDS[_LINUX_CLIP], input=text.encode(), check=True)
+            return True
         elif PLATFORM == "Windows":
-            subprocess.run(["clip.exe"], input=text.encode(), check=True, shell=True)
+            process.run(["clip.exe"], input=text.encode(), check=True, shell=True)
             return True
         else:
             logger.error("Unsupported platform: %s", PLATFORM)
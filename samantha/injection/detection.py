@@ -4,57 +4,122 @@ import logging
 import os
 import platform
 import re
-import signal
 import shutil
 import subprocess
 import time
+from functools import lru_cache, wraps
+
+import psutil
 
 from samantha.config import (
     IDE_PROCESS_NAMES,
     DESKTOP_APP_NAMES,
     SUPPORTED_DESKTOP_APPS,
+    SAMANTHA_ACTIVE_FILE,
     get_target_app,
     SUPPORTED_TERMINALS,
     get_ai_process_pattern,
     get_ai_window_titles,
 )
+from samantha.utils import process
 
 logger = logging.getLogger("samantha")
 
 PLATFORM = platform.system()
 
+_WM_NAME_RE = re.compile(r'"(.+)"')
+
+# X11 window tools, resolved once at import so window lookups don't walk PATH per call
+_HAS_XDOTOOL = _HAS_WMCTRL = _HAS_XPROP = False
+if PLATFORM == "Linux":
+    _HAS_XDOTOOL = shutil.which("xdotool") is not None
+    _HAS_WMCTRL = shutil.which("wmctrl") is not None
+    _HAS_XPROP = shutil.which("xprop") is not None
+
+_TERMINAL_APPS = frozenset(SUPPORTED_TERMINALS)
+_DESKTOP_APPS = frozenset(SUPPORTED_DESKTOP_APPS)
+
+# One injection asks the same detection questions several times; reuse answers briefly
+_DETECTION_TTL = 2.0
+_detection_cache = {}  # function name -> (monotonic time, result)
+
+
+def _cached_detection(func):
+    """Reuse a no-argument detection result for _DETECTION_TTL seconds."""
+
+    @wraps(func)
+    def wrapper():
+        hit = _detection_cache.get(func.__name__)
+        if hit is not None and time.monotonic() - hit[0] < _DETECTION_TTL:
+            return hit[1]
+        result = func()
+        _detection_cache[func.__name__] = (time.monotonic(), result)
+        return result
+
+    return wrapper
+
+
+def invalidate_detection_cache() -> None:
+    """Forget cached detection results (e.g. after a failed injection) so the next lookup re-probes."""
+    _detection_cache.clear()
+
+
+@lru_cache(maxsize=None)
+def _ide_names(platform_name: str) -> tuple[tuple[str, str], ...]:
+    """(name, lowercased name) for each IDE process name on the platform, in priority order."""
+    return tuple((ide, ide.lower()) for ide in IDE_PROCESS_NAMES.get(platform_name, []))
+
+# In-process frontmost-app lookup/activation on macOS when pyobjc is installed; osascript otherwise
+NSWorkspace = None
+if PLATFORM == "Darwin":
+    try:
+        from AppKit import NSWorkspace, NSApplicationActivateIgnoringOtherApps
+    except ImportError:
+        NSWorkspace = None
+
+
+def _activate_running_app(app_name: str) -> bool:
+    """Bring a running app to the front through NSRunningApplication; False if it isn't running."""
+    for app in NSWorkspace.sharedWorkspace().runningApplications():
+        if app.localizedName() == app_name:
+            return bool(app.activateWithOptions_(NSApplicationActivateIgnoringOtherApps))
+    return False
+
 
 def get_frontmost_app() -> str:
     """Get the frontmost application name (cross-platform)."""
     try:
         if PLATFORM == "Darwin":
-            result = subprocess.run(
+            if NSWorkspace is not None:
+                app = NSWorkspace.sharedWorkspace().frontmostApplication()
+                if app is not None and app.localizedName():
+                    return app.localizedName()
+            result = process.run(
                 ["osascript", "-e", 'tell application "System Events" to get name of first process whose frontmost is true'],
                 capture_output=True, text=True, check=True, timeout=5
             )
             return result.stdout.strip()
         elif PLATFORM == "Linux":
-            if shutil.which("xdotool"):
-                result = subprocess.run(
+            if _HAS_XDOTOOL:
+                result = process.run(
                     ["xdotool", "getactivewindow", "getwindowname"],
                     capture_output=True, text=True, timeout=5
                 )
                 if result.returncode == 0:
                     return result.stdout.strip()
-            if shutil.which("wmctrl") and shutil.which("xprop"):
-                result = subprocess.run(
+            if _HAS_WMCTRL and _HAS_XPROP:
+                result = process.run(
                     ["bash", "-c", "xprop -root _NET_ACTIVE_WINDOW | awk '{print $5}'"],
                     capture_output=True, text=True, timeout=5
                 )
                 if result.returncode == 0 and result.stdout.strip():
                     window_id = result.stdout.strip()
-                    result = subprocess.run(
+                    result = process.run(
                         ["xprop", "-id", window_id, "WM_NAME"],
                         capture_output=True, text=True, timeout=5
                     )
                     if result.returncode == 0:
-                        import re
-                        match = re.search(r'"(.+)"', result.stdout)
+                        match = _WM_NAME_RE.search(result.stdout)
                         if match:
                             return match.group(1)
             return ""
@@ -86,19 +151,21 @@ def activate_app(app_name: str) -> bool:
     """Activate/focus an application (cross-platform)."""
     try:
         if PLATFORM == "Darwin":
+            if NSWorkspace is not None and _activate_running_app(app_name):
+                return True
             applescript = f'''
             tell application "{app_name}"
                 activate
             end tell
             '''
-            subprocess.run(["osascript", "-e", applescript], check=True, capture_output=True)
+            process.run(["osascript", "-e", applescript], check=True, capture_output=True)
             return True
         elif PLATFORM == "Linux":
-            if shutil.which("xdotool"):
-                subprocess.run(["xdotool", "search", "--name", app_name, "windowactivate"], check=True)
+            if _HAS_XDOTOOL:
+                process.run(["xdotool", "search", "--name", app_name, "windowactivate"], check=True)
                 return True
-            elif shutil.which("wmctrl"):
-                subprocess.run(["wmctrl", "-a", app_name], check=True)
+            elif _HAS_WMCTRL:
+                process.run(["wmctrl", "-a", app_name], check=True)
                 return True
             else:
                 logger.warning("No window activation tool found (xdotool or wmctrl)")
@@ -127,7 +194,7 @@ def activate_app(app_name: str) -> bool:
                     [Win32]::SetForegroundWindow($app.MainWindowHandle)
                 }}
                 '''
-                result = subprocess.run(["powershell", "-Command", powershell_script], capture_output=True, timeout=5)
+                result = process.run(["powershell", "-Command", powershell_script], capture_output=True, timeout=5)
                 return result.returncode == 0
             except Exception:
                 pass
@@ -145,8 +212,6 @@ def is_samantha_running_elsewhere() -> bool:
     Uses the active file with PID to verify the process is still alive.
     Returns False if the active file doesn't exist or the process is dead.
     """
-    from samantha.config import SAMANTHA_ACTIVE_FILE
-
     if not SAMANTHA_ACTIVE_FILE.exists():
         return False
 
@@ -172,43 +237,42 @@ def is_samantha_running_elsewhere() -> bool:
         return False
 
 
+# Command-line fragments of samantha entry points and its services
+_SAMANTHA_PROCESS_MARKERS = (
+    '/bin/samantha',
+    'samantha/__main__',
+    'uv run samantha',
+    '/.samantha/services/whisper',
+    '/.samantha/services/kokoro',
+)
+
+
 def kill_orphaned_processes():
     """Kill all samantha-related processes (MCP servers and services)."""
     try:
         our_pid = os.getpid()
-        # Use ps to get full command lines for proper filtering
-        result = subprocess.run(
-            ["ps", "aux"], capture_output=True, text=True, timeout=5
-        )
-
-        for line in result.stdout.strip().split('\n'):
-            # Match samantha entry points and services
-            is_samantha_process = (
-                '/bin/samantha' in line or
-                'samantha/__main__' in line or
-                'uv run samantha' in line or
-                '/.samantha/services/whisper' in line or
-                '/.samantha/services/kokoro' in line
-            )
-
-            if is_samantha_process:
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        pid = int(parts[1])
-                        if pid != our_pid:
-                            os.kill(pid, signal.SIGTERM)  # Graceful first
-                            logger.info("Sent SIGTERM to samantha process: %d", pid)
-                            # Give it a moment to clean up
-                            time.sleep(0.1)
-                            try:
-                                os.kill(pid, 0)  # Check if still alive
-                                os.kill(pid, signal.SIGKILL)  # Force kill
-                                logger.info("Sent SIGKILL to samantha process: %d", pid)
-                            except ProcessLookupError:
-                                pass  # Already dead, good
-                    except (ValueError, ProcessLookupError, PermissionError) as e:
-                        logger.debug("Could not kill PID from line '%s': %s", line[:80], e)
+        terminated = []
+        for proc in psutil.process_iter(["pid", "cmdline"]):
+            if proc.info["pid"] == our_pid:
+                continue
+            cmdline = " ".join(proc.info["cmdline"] or ())
+            if not any(marker in cmdline for marker in _SAMANTHA_PROCESS_MARKERS):
+                continue
+            try:
+                proc.terminate()  # Graceful first
+                logger.info("Sent SIGTERM to samantha process: %d", proc.pid)
+                terminated.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                logger.debug("Could not kill PID %d: %s", proc.pid, e)
+
+        # One shared grace period for all of them, then force kill whatever is left
+        _, alive = psutil.wait_procs(terminated, timeout=0.1)
+        for proc in alive:
+            try:
+                proc.kill()
+                logger.info("Sent SIGKILL to samantha process: %d", proc.pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                logger.debug("Could not kill PID %d: %s", proc.pid, e)
     except Exception as e:
         logger.warning("Orphan cleanup failed: %s", e)
 
@@ -217,7 +281,7 @@ def _is_app_running_with_windows(app_name: str) -> bool:
     """Check if a specific app is running with at least one window open."""
     try:
         if PLATFORM == "Darwin":
-            result = subprocess.run(
+            result = process.run(
                 ["osascript", "-e", f'tell application "System Events" to tell process "{app_name}" to get (count of windows)'],
                 capture_output=True, text=True, timeout=5
             )
@@ -225,14 +289,14 @@ def _is_app_running_with_windows(app_name: str) -> bool:
                 window_count = int(result.stdout.strip())
                 return window_count > 0
         elif PLATFORM == "Linux":
-            if shutil.which("xdotool"):
-                result = subprocess.run(
+            if _HAS_XDOTOOL:
+                result = process.run(
                     ["xdotool", "search", "--name", app_name],
                     capture_output=True, text=True, timeout=5
                 )
                 return result.returncode == 0 and bool(result.stdout.strip())
-            if shutil.which("wmctrl"):
-                result = subprocess.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=5)
+            if _HAS_WMCTRL:
+                result = process.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=5)
                 return result.returncode == 0 and app_name.lower() in result.stdout.lower()
         elif PLATFORM == "Windows":
             try:
@@ -240,7 +304,7 @@ def _is_app_running_with_windows(app_name: str) -> bool:
                 windows = gw.getWindowsWithTitle(app_name)
                 return len(windows) > 0
             except ImportError:
-                result = subprocess.run(
+                result = process.run(
                     ["powershell", "-Command", f"Get-Process -Name '{app_name}' -ErrorAction SilentlyContinue"],
                     capture_output=True, text=True, timeout=5
                 )
@@ -253,7 +317,7 @@ def _is_app_running_with_windows(app_name: str) -> bool:
 def _get_running_processes_macos() -> list[str]:
     """Get list of running process names on macOS using ps (no accessibility needed)."""
     try:
-        result = subprocess.run(
+        result = process.run(
             ["ps", "-eo", "comm="],
             capture_output=True, text=True, timeout=5
         )
@@ -264,6 +328,52 @@ def _get_running_processes_macos() -> list[str]:
     return []
 
 
+# One System Events round-trip listing every GUI process that has a window open
+_WINDOWED_PROCESSES_SCRIPT = """
+tell application "System Events"
+    set names to {}
+    repeat with proc in (every process whose background only is false)
+        try
+            if (count of windows of proc) > 0 then set end of names to name of proc
+        end try
+    end repeat
+end tell
+set AppleScript's text item delimiters to linefeed
+return names as text
+"""
+
+
+def _processes_with_windows_macos() -> set[str]:
+    """Names of macOS processes with at least one window (empty if System Events is unavailable)."""
+    try:
+        result = process.run(
+            ["osascript", "-e", _WINDOWED_PROCESSES_SCRIPT],
+            capture_output=True, text=True, timeout=5
+        )
+        if result.returncode == 0:
+            return {name.strip() for name in result.stdout.splitlines() if name.strip()}
+    except subprocess.TimeoutExpired:
+        logger.debug("Timed out listing windowed processes")
+    return set()
+
+
+def _linux_window_titles() -> str:
+    """All window titles, lowercased and newline-separated, from a single wmctrl/xdotool call."""
+    if _HAS_WMCTRL:
+        cmd = ["wmctrl", "-l"]
+    elif _HAS_XDOTOOL:
+        cmd = ["xdotool", "search", "--name", ".", "getwindowname", "%@"]
+    else:
+        return ""
+    try:
+        result = process.run(cmd, capture_output=True, text=True, timeout=5)
+    except subprocess.TimeoutExpired:
+        logger.debug("Timed out listing windows with %s", cmd[0])
+        return ""
+    return result.stdout.lower() if result.returncode == 0 else ""
+
+
+@_cached_detection
 def get_running_ide() -> str | None:
     """Find which supported IDE is running with windows open (cross-platform).
 
@@ -274,10 +384,10 @@ def get_running_ide() -> str | None:
     """
     target = get_target_app()
     if target:
-        if target in SUPPORTED_TERMINALS:
+        if target in _TERMINAL_APPS:
             logger.debug("target_app is terminal '%s', skipping IDE detection", target)
             return None
-        if target in SUPPORTED_DESKTOP_APPS:
+        if target in _DESKTOP_APPS:
             logger.debug("target_app is desktop app '%s', skipping IDE detection", target)
             return None
         if _is_app_running_with_windows(target):
@@ -289,49 +399,28 @@ def get_running_ide() -> str | None:
 
     try:
         if PLATFORM == "Darwin":
-            for ide in ide_names:
-                try:
-                    result = subprocess.run(
-                        ["osascript", "-e", f'tell application "System Events" to tell process "{ide}" to get (count of windows)'],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode == 0:
-                        window_count = int(result.stdout.strip())
-                        if window_count > 0:
-                            logger.debug("Found IDE: %s with %d windows", ide, window_count)
-                            return ide
-                except (ValueError, subprocess.TimeoutExpired):
-                    continue
+            # Case-insensitive like System Events' own process lookup (Zed reports as "zed")
+            windowed = {name.lower() for name in _processes_with_windows_macos()}
+            for ide, ide_lower in _ide_names(PLATFORM):
+                if ide_lower in windowed:
+                    logger.debug("Found IDE: %s with windows open", ide)
+                    return ide
             # Fallback: use ps if osascript failed (e.g., no accessibility permissions)
             running_procs = _get_running_processes_macos()
             if running_procs:
-                running_lower = [p.lower() for p in running_procs]
-                for ide in ide_names:
-                    ide_lower = ide.lower()
-                    if ide_lower in running_lower or ide in running_procs:
+                running_lower = {p.lower() for p in running_procs}
+                for ide, ide_lower in _ide_names(PLATFORM):
+                    if ide_lower in running_lower:
                         logger.debug("Found IDE via ps fallback: %s", ide)
                         return ide
             return None
         elif PLATFORM == "Linux":
-            if shutil.which("xdotool"):
-                for ide in ide_names:
-                    result = subprocess.run(
-                        ["xdotool", "search", "--name", ide],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode == 0 and result.stdout.strip():
-                        logger.debug("Found IDE via xdotool: %s", ide)
+            titles = _linux_window_titles()
+            if titles:
+                for ide, ide_lower in _ide_names(PLATFORM):
+                    if ide_lower in titles:
+                        logger.debug("Found IDE by window title: %s", ide)
                         return ide
-            if shutil.which("wmctrl"):
-                result = subprocess.run(
-                    ["wmctrl", "-l"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    for ide in ide_names:
-                        if ide.lower() in result.stdout.lower():
-                            logger.debug("Found IDE via wmctrl: %s", ide)
-                            return ide
             return None
         elif PLATFORM == "Windows":
             try:
@@ -345,7 +434,7 @@ def get_running_ide() -> str | None:
                 pass
             for ide in ide_names:
                 try:
-                    result = subprocess.run(
+                    result = process.run(
                         ["powershell", "-Command", f"Get-Process -Name '{ide}' -ErrorAction SilentlyContinue"],
                         capture_output=True, text=True, timeout=5
                     )
@@ -375,7 +464,7 @@ def get_running_desktop_app() -> str | None:
     """
     target = get_target_app()
     if target:
-        if target in SUPPORTED_DESKTOP_APPS:
+        if target in _DESKTOP_APPS:
             if _is_app_running_with_windows(target):
                 logger.debug("Using configured desktop target_app: %s", target)
                 return target
@@ -396,6 +485,20 @@ def is_desktop_app_available() -> bool:
     return get_running_desktop_app() is not None
 
 
+@_cached_detection
+def _ai_process_ttys() -> list[str]:
+    """TTYs of running processes matching ai_process_pattern, from one ps call (macOS/Linux)."""
+    ai_process = re.compile(get_ai_process_pattern(), re.IGNORECASE)
+    result = process.run(["ps", "-Ao", "tty=,command="], capture_output=True, text=True, timeout=5)
+    ttys = []
+    for line in result.stdout.splitlines():
+        tty, _, command = line.strip().partition(" ")
+        if ai_process.search(command):
+            ttys.append(tty)
+    return ttys
+
+
+@_cached_detection
 def is_ai_process_running() -> bool:
     """Check if any AI CLI process is running (cross-platform).
 
@@ -405,15 +508,10 @@ def is_ai_process_running() -> bool:
     pattern = get_ai_process_pattern()
     try:
         if PLATFORM in ("Darwin", "Linux"):
-            result = subprocess.run(
-                ["bash", "-c", f"ps aux | grep -E '{pattern}' | grep -v grep | wc -l"],
-                capture_output=True, text=True, timeout=5
-            )
-            count = int(result.stdout.strip()) if result.stdout.strip() else 0
-            return count > 0
+            return bool(_ai_process_ttys())
         elif PLATFORM == "Windows":
             pattern_windows = pattern.replace("|", "*' -or $_.ProcessName -like '*")
-            result = subprocess.run(
+            result = process.run(
                 ["powershell", "-Command", f"Get-Process | Where-Object {{$_.ProcessName -like '*{pattern_windows}*'}} | Measure-Object | Select-Object -ExpandProperty Count"],
                 capture_output=True, text=True, timeout=5
             )
@@ -435,15 +533,11 @@ def is_ai_running_in_terminal() -> bool:
     pattern = get_ai_process_pattern()
     try:
         if PLATFORM in ("Darwin", "Linux"):
-            result = subprocess.run(
-                ["bash", "-c", f"ps aux | grep -E '{pattern}' | grep -v grep | awk '{{print $7}}' | grep -v '??' | head -1"],
-                capture_output=True, text=True, timeout=5
-            )
-            tty = result.stdout.strip()
-            return bool(tty and tty != "??")
+            # No controlling terminal shows as "??" on macOS and "?" on Linux
+            return any(tty not in ("?", "??") for tty in _ai_process_ttys())
         elif PLATFORM == "Windows":
             pattern_windows = pattern.replace("|", "*' -or $_.ProcessName -like '*")
-            result = subprocess.run(
+            result = process.run(
                 ["powershell", "-Command", f"Get-Process | Where-Object {{($_.ProcessName -like '*{pattern_windows}*') -and $_.MainWindowHandle -ne 0}} | Measure-Object | Select-Object -ExpandProperty Count"],
                 capture_output=True, text=True, timeout=5
             )
@@ -470,7 +564,7 @@ def is_ai_running_in_ide_terminal(ide_name: str) -> bool:
     try:
         if PLATFORM == "Darwin":
             # Get all process info in a single command (optimized from multiple calls)
-            result = subprocess.run(
+            result = process.run(
                 ["ps", "-eo", "pid=,ppid=,tty=,comm="],
                 capture_output=True, text=True, timeout=5
             )
@@ -480,7 +574,7 @@ def is_ai_running_in_ide_terminal(ide_name: str) -> bool:
             # Build process tree in memory
             processes = {}  # pid -> (ppid, comm)
             ai_pids = []
-            pattern_lower = pattern.lower()
+            ai_process = re.compile(pattern.lower())
 
             for line in result.stdout.strip().split('\n'):
                 parts = line.split()
@@ -493,7 +587,7 @@ def is_ai_running_in_ide_terminal(ide_name: str) -> bool:
                     processes[pid] = (ppid, comm_lower)
 
                     # Check if this is an AI process with a real TTY
-                    if tty != "??" and re.search(pattern_lower, comm_lower):
+                    if tty != "??" and ai_process.search(comm_lower):
                         ai_pids.append(pid)
 
             if not ai_pids:
@@ -532,6 +626,30 @@ def is_ai_running_in_ide_terminal(ide_name: str) -> bool:
         return False
 
 
+# Terminal apps checked on macOS, in priority order
+_MACOS_TERMINAL_APPS = ("Terminal", "iTerm2", "iTerm", "Alacritty", "kitty", "Warp")
+_MACOS_TERMINAL_LIST = "{" + ", ".join(f'"{app}"' for app in _MACOS_TERMINAL_APPS) + "}"
+
+# First terminal app with an open window, in one System Events query
+_TERMINAL_WITH_WINDOWS_SCRIPT = f"""
+tell application "System Events"
+    repeat with appName in {_MACOS_TERMINAL_LIST}
+        set appName to appName as string
+        if exists process appName then
+            if (count of windows of process appName) > 0 then return appName
+        end if
+    end repeat
+end tell
+return ""
+"""
+
+
+@_cached_detection
+def _macos_terminal_with_windows() -> str:
+    result = process.run(["osascript", "-e", _TERMINAL_WITH_WINDOWS_SCRIPT], capture_output=True, text=True, timeout=5)
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
 def find_terminal_with_ai() -> str:
     """Find a terminal window running an AI CLI (cross-platform).
 
@@ -544,29 +662,19 @@ def find_terminal_with_ai() -> str:
 
     try:
         if PLATFORM == "Darwin":
-            for app in ["Terminal", "iTerm2", "iTerm", "Alacritty", "kitty", "Warp"]:
-                try:
-                    result = subprocess.run(
-                        ["osascript", "-e", f'tell application "System Events" to tell process "{app}" to get (count of windows)'],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode == 0 and result.stdout.strip() and int(result.stdout.strip()) > 0:
-                        return app
-                except Exception:
-                    continue
-            return ""
+            return _macos_terminal_with_windows()
         elif PLATFORM == "Linux":
             terminals = ["gnome-terminal", "konsole", "xfce4-terminal", "xterm", "alacritty", "kitty", "terminator", "tilix"]
-            if shutil.which("xdotool"):
+            if _HAS_XDOTOOL:
                 for term in terminals:
-                    result = subprocess.run(
+                    result = process.run(
                         ["xdotool", "search", "--name", term],
                         capture_output=True, text=True, timeout=5
                     )
                     if result.returncode == 0 and result.stdout.strip():
                         return term
-            if shutil.which("wmctrl"):
-                result = subprocess.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=5)
+            if _HAS_WMCTRL:
+                result = process.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
                     for term in terminals:
                         if term.lower() in result.stdout.lower():
@@ -599,56 +707,55 @@ def activate_terminal_with_ai() -> bool:
     titles = get_ai_window_titles()
     try:
         if PLATFORM == "Darwin":
-            for app in ["Terminal", "iTerm2", "iTerm", "Alacritty", "kitty", "Warp"]:
-                try:
-                    title_conditions = " or ".join([f'name of aWindow contains "{t}"' for t in titles])
-                    title_conditions_cap = " or ".join([f'name of aWindow contains "{t.capitalize()}"' for t in titles])
-                    applescript = f'''
-                    tell application "System Events"
-                        if exists process "{app}" then
-                            tell process "{app}"
-                                set windowList to every window
-                                repeat with aWindow in windowList
-                                    if {title_conditions} or {title_conditions_cap} then
-                                        perform action "AXRaise" of aWindow
-                                        set frontmost to true
-                                        return "{app}"
-                                    end if
-                                end repeat
-                            end tell
-                        end if
-                    end tell
-                    return ""
-                    '''
-                    result = subprocess.run(["osascript", "-e", applescript], capture_output=True, text=True, timeout=5)
-                    if result.stdout.strip() == app:
-                        logger.debug("Found AI in %s window", app)
-                        return True
-                except Exception as e:
-                    logger.debug("Error checking %s: %s", app, e)
-                    continue
+            # All terminal apps in one script: raise the first window whose title names an AI CLI
+            title_conditions = " or ".join([f'name of aWindow contains "{t}"' for t in titles])
+            title_conditions_cap = " or ".join([f'name of aWindow contains "{t.capitalize()}"' for t in titles])
+            applescript = f'''
+            tell application "System Events"
+                repeat with appName in {_MACOS_TERMINAL_LIST}
+                    set appName to appName as string
+                    if exists process appName then
+                        tell process appName
+                            repeat with aWindow in every window
+                                if {title_conditions} or {title_conditions_cap} then
+                                    perform action "AXRaise" of aWindow
+                                    set frontmost to true
+                                    return appName
+                                end if
+                            end repeat
+                        end tell
+                    end if
+                end repeat
+            end tell
+            return ""
+            '''
+            result = process.run(["osascript", "-e", applescript], capture_output=True, text=True, timeout=5)
+            app = result.stdout.strip()
+            if app:
+                logger.debug("Found AI in %s window", app)
+                return True
             return False
 
         elif PLATFORM == "Linux":
-            if shutil.which("xdotool"):
+            if _HAS_XDOTOOL:
                 for title in titles:
-                    result = subprocess.run(
+                    result = process.run(
                         ["xdotool", "search", "--name", title],
                         capture_output=True, text=True, timeout=5
                     )
                     if result.returncode == 0 and result.stdout.strip():
                         window_id = result.stdout.strip().split('\n')[0]
-                        subprocess.run(["xdotool", "windowactivate", window_id], timeout=5)
+                        process.run(["xdotool", "windowactivate", window_id], timeout=5)
                         logger.debug("Found AI window via xdotool: %s", window_id)
                         return True
-            if shutil.which("wmctrl"):
-                result = subprocess.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=5)
+            if _HAS_WMCTRL:
+                result = process.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
                     for line in result.stdout.strip().split('\n'):
                         for title in titles:
                             if title in line.lower():
                                 window_id = line.split()[0]
-                                subprocess.run(["wmctrl", "-i", "-a", window_id], timeout=5)
+                                process.run(["wmctrl", "-i", "-a", window_id], timeout=5)
                                 logger.debug("Found AI window via wmctrl: %s", window_id)
                                 return True
             return False
@@ -668,7 +775,7 @@ def activate_terminal_with_ai() -> bool:
                 pass
             try:
                 title_pattern = "|".join([f"*{t}*" for t in titles])
-                result = subprocess.run(
+                result = process.run(
                     ["powershell", "-Command", f'''
                     Add-Type @"
                     using System;
@@ -3,7 +3,6 @@
 import logging
 import platform
 import shutil
-import subprocess
 import time
 
 import samantha.audio.playback as playback
@@ -18,12 +17,19 @@ from samantha.injection.detection import (
     is_ai_process_running,
     is_ai_running_in_ide_terminal,
     is_ai_running_in_terminal,
+    invalidate_detection_cache,
 )
+from samantha.utils import process
 
 logger = logging.getLogger("samantha")
 
 PLATFORM = platform.system()
 
+# Keystroke tool resolved once at import (xdotool preferred) so injection doesn't walk PATH per call
+_LINUX_KEY_TOOL = None
+if PLATFORM == "Linux":
+    _LINUX_KEY_TOOL = next((tool for tool in ("xdotool", "ydotool") if shutil.which(tool)), None)
+
 
 def simulate_paste_and_enter() -> bool:
     """Simulate Cmd/Ctrl+V paste and Enter keystroke (cross-platform)."""
@@ -36,22 +42,22 @@ def simulate_paste_and_enter() -> bool:
                 key code 36
             end tell
             """
-            subprocess.run(
+            process.run(
                 ["osascript", "-e", applescript], check=True, capture_output=True
             )
             return True
         elif PLATFORM == "Linux":
-            if shutil.which("xdotool"):
-                subprocess.run(["xdotool", "key", "ctrl+v"], check=True)
+            if _LINUX_KEY_TOOL == "xdotool":
+                process.run(["xdotool", "key", "ctrl+v"], check=True)
                 time.sleep(0.2)
-                subprocess.run(["xdotool", "key", "Return"], check=True)
+                process.run(["xdotool", "key", "Return"], check=True)
                 return True
-            elif shutil.which("ydotool"):
-                subprocess.run(
+            elif _LINUX_KEY_TOOL == "ydotool":
+                process.run(
                     ["ydotool", "key", "29:1", "47:1", "47:0", "29:0"], check=True
                 )
                 time.sleep(0.2)
-                subprocess.run(["ydotool", "key", "28:1", "28:0"], check=True)
+                process.run(["ydotool", "key", "28:1", "28:0"], check=True)
                 return True
             else:
                 logger.error("No keystroke tool found (xdotool or ydotool)")
@@ -71,7 +77,7 @@ def simulate_paste_and_enter() -> bool:
                 Start-Sleep -Milliseconds 200
                 [System.Windows.Forms.SendKeys]::SendWait("{ENTER}")
                 """
-                subprocess.run(
+                process.run(
                     ["powershell", "-Command", powershell_script], check=True
                 )
                 return True
@@ -96,7 +102,7 @@ def focus_ide_ai_input(ide_name: str) -> bool:
             time.sleep(0.3)
             # Zed uses Cmd+? (Shift+Cmd+/) for assistant::ToggleFocus
             if ide_name.lower() == "zed":
-                subprocess.run(
+                process.run(
                     [
                         "osascript",
                         "-e",
@@ -107,7 +113,7 @@ def focus_ide_ai_input(ide_name: str) -> bool:
                     timeout=5,
                 )
             else:
-                subprocess.run(
+                process.run(
                     [
                         "osascript",
                         "-e",
@@ -122,17 +128,17 @@ def focus_ide_ai_input(ide_name: str) -> bool:
         elif PLATFORM == "Linux":
             activate_app(ide_name)
             time.sleep(0.3)
-            if shutil.which("xdotool"):
+            if _LINUX_KEY_TOOL == "xdotool":
                 # Zed uses Ctrl+? (Ctrl+Shift+/) for assistant::ToggleFocus
                 if ide_name.lower() == "zed":
-                    subprocess.run(
+                    process.run(
                         ["xdotool", "key", "ctrl+shift+slash"],
                         check=True,
                         capture_output=True,
                         timeout=5,
                     )
                 else:
-                    subprocess.run(
+                    process.run(
                         ["xdotool", "key", "ctrl+Escape"],
                         check=True,
                         capture_output=True,
@@ -140,10 +146,10 @@ def focus_ide_ai_input(ide_name: str) -> bool:
                     )
                 time.sleep(0.2)
                 return True
-            elif shutil.which("ydotool"):
+            elif _LINUX_KEY_TOOL == "ydotool":
                 # Zed uses Ctrl+? (Ctrl+Shift+/) - key codes: 29=ctrl, 42=shift, 53=slash
                 if ide_name.lower() == "zed":
-                    subprocess.run(
+                    process.run(
                         [
                             "ydotool",
                             "key",
@@ -159,7 +165,7 @@ def focus_ide_ai_input(ide_name: str) -> bool:
                         timeout=5,
                     )
                 else:
-                    subprocess.run(
+                    process.run(
                         ["ydotool", "key", "29:1", "1:1", "1:0", "29:0"],
                         check=True,
                         capture_output=True,
@@ -195,7 +201,7 @@ def focus_ide_ai_input(ide_name: str) -> bool:
                     Add-Type -AssemblyName System.Windows.Forms
                     [System.Windows.Forms.SendKeys]::SendWait("^{ESC}")
                     """
-                subprocess.run(
+                process.run(
                     ["powershell", "-Command", powershell_script], check=True, timeout=5
                 )
                 time.sleep(0.2)
@@ -223,7 +229,7 @@ def focus_ide_terminal(ide_name: str) -> bool:
             time.sleep(0.3)
             # Zed uses Cmd+J for workspace::ToggleBottomDock (terminal)
             if ide_name.lower() == "zed":
-                subprocess.run(
+                process.run(
                     [
                         "osascript",
                         "-e",
@@ -234,7 +240,7 @@ def focus_ide_terminal(ide_name: str) -> bool:
                     timeout=5,
                 )
             else:
-                subprocess.run(
+                process.run(
                     [
                         "osascript",
                         "-e",
@@ -249,17 +255,17 @@ def focus_ide_terminal(ide_name: str) -> bool:
         elif PLATFORM == "Linux":
             activate_app(ide_name)
             time.sleep(0.3)
-            if shutil.which("xdotool"):
+            if _LINUX_KEY_TOOL == "xdotool":
                 # Zed uses Ctrl+J for workspace::ToggleBottomDock (terminal)
                 if ide_name.lower() == "zed":
-                    subprocess.run(
+                    process.run(
                         ["xdotool", "key", "ctrl+j"],
                         check=True,
                         capture_output=True,
                         timeout=5,
                     )
                 else:
-                    subprocess.run(
+                    process.run(
                         ["xdotool", "key", "ctrl+grave"],
                         check=True,
                         capture_output=True,
@@ -267,17 +273,17 @@ def focus_ide_terminal(ide_name: str) -> bool:
                     )
                 time.sleep(0.2)
                 return True
-            elif shutil.which("ydotool"):
+            elif _LINUX_KEY_TOOL == "ydotool":
                 # Zed uses Ctrl+J - key codes: 29=ctrl, 36=j
                 if ide_name.lower() == "zed":
-                    subprocess.run(
+                    process.run(
                         ["ydotool", "key", "29:1", "36:1", "36:0", "29:0"],
                         check=True,
                         capture_output=True,
                         timeout=5,
                     )
                 else:
-                    subprocess.run(
+                    process.run(
                         ["ydotool", "key", "29:1", "41:1", "41:0", "29:0"],
                         check=True,
                         capture_output=True,
@@ -313,7 +319,7 @@ def focus_ide_terminal(ide_name: str) -> bool:
                     Add-Type -AssemblyName System.Windows.Forms
                     [System.Windows.Forms.SendKeys]::SendWait("^{`}")
                     """
-                subprocess.run(
+                process.run(
                     ["powershell", "-Command", powershell_script], check=True, timeout=5
                 )
                 time.sleep(0.2)
@@ -380,7 +386,7 @@ def _try_inject_cli(ide_name: str, text: str) -> bool:
     return False
 
 
-def inject_into_ide(text: str) -> bool:
+def inject_into_ide(text: str, ide_name: str = None) -> bool:
     """Inject text into IDE's Claude input field or integrated terminal.
 
     Behavior depends on injection_mode config:
@@ -388,9 +394,10 @@ def inject_into_ide(text: str) -> bool:
     - 'extension': Focus Claude Code extension input (Cmd+Escape)
     - 'cli': Focus integrated terminal (Ctrl+`) for Claude CLI
 
+    ide_name skips detection when the caller already found the IDE.
     Returns True if injection succeeded, False otherwise.
     """
-    ide_name = get_running_ide()
+    ide_name = ide_name or get_running_ide()
     if not ide_name:
         logger.debug("No supported IDE available")
         return False
@@ -455,13 +462,14 @@ def focus_desktop_app_input(app_name: str) -> bool:
         return False
 
 
-def inject_into_desktop(text: str) -> bool:
+def inject_into_desktop(text: str, app_name: str = None) -> bool:
     """Inject text into a desktop AI app (e.g., Claude Desktop).
 
     Activates the app window, pastes text from clipboard, and sends Enter.
+    app_name skips detection when the caller already found the app.
     Returns True if injection succeeded, False otherwise.
     """
-    app_name = get_running_desktop_app()
+    app_name = app_name or get_running_desktop_app()
     if not app_name:
         logger.debug("No desktop AI app available")
         return False
@@ -506,7 +514,7 @@ def inject_into_app(text: str, log_type: str = None):
 
     if injection_mode == "desktop":
         app_name = get_running_desktop_app()
-        if app_name and inject_into_desktop(text):
+        if app_name and inject_into_desktop(text, app_name):
             success = True
             target_app = app_name
         else:
@@ -520,14 +528,14 @@ def inject_into_app(text: str, log_type: str = None):
             logger.error("Terminal injection failed - no AI running in terminal")
     elif injection_mode in ("extension", "cli"):
         ide_name = get_running_ide()
-        if ide_name and inject_into_ide(text):
+        if ide_name and inject_into_ide(text, ide_name):
             success = True
             target_app = ide_name
         else:
             logger.error("%s mode injection failed", injection_mode)
     else:
         ide_name = get_running_ide()
-        if ide_name and inject_into_ide(text):
+        if ide_name and inject_into_ide(text, ide_name):
             success = True
             target_app = ide_name
         else:
@@ -536,7 +544,7 @@ def inject_into_app(text: str, log_type: str = None):
             else:
                 logger.debug("No IDE found, trying desktop app")
             desktop_name = get_running_desktop_app()
-            if desktop_name and inject_into_desktop(text):
+            if desktop_name and inject_into_desktop(text, desktop_name):
                 success = True
                 target_app = desktop_name
             else:
@@ -551,6 +559,7 @@ def inject_into_app(text: str, log_type: str = None):
                     logger.error("All injection methods failed - no AI target found")
 
     if not success:
+        invalidate_detection_cache()
         try:
             with playback._tts_queue_lock:
                 playback._tts_text_queue.append(
@@ -23,13 +23,9 @@ from . import resources
 def main():
     """Run the Samantha MCP server."""
     import sys
-    import warnings
     from .logging_setup import setup_logging
     from .version import __version__
 
-    warnings.filterwarnings("ignore", category=SyntaxWarning, module="pydub.utils")
-    warnings.filterwarnings("ignore", message="'audioop' is deprecated", category=DeprecationWarning)
-
     logger = setup_logging()
     logger.info(f"Starting Samantha v{__version__}")
 
@@ -6,10 +6,16 @@ from .health import (
     ensure_kokoro_running,
     ensure_whisper_running,
 )
+from .http import (
+    close_http_client,
+    get_http_session,
+)
 
 __all__ = [
     "_check_service_health",
     "_wait_for_service",
+    "close_http_client",
     "ensure_kokoro_running",
     "ensure_whisper_running",
+    "get_http_session",
 ]
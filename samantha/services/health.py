@@ -6,35 +6,42 @@ import platform
 import shutil
 import subprocess
 
-try:
-    import httpx
-except ImportError:
-    httpx = None
-
 from samantha.config import SAMANTHA_DIR
+from .http import _get_http_client
 
 logger = logging.getLogger("samantha")
 
+PLATFORM = platform.system()
+
 
 async def _check_service_health(health_url: str) -> bool:
     """Check if a service is healthy."""
     try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(health_url)
-            return response.status_code == 200
+        response = await _get_http_client().get(health_url)
+        return response.status_code == 200
     except Exception:
         return False
 
 
-async def _wait_for_service(health_url: str, service_name: str, max_attempts: int, log_interval: int) -> bool:
-    """Wait for a service to become healthy."""
-    for i in range(max_attempts):
-        await asyncio.sleep(1)
+async def _wait_for_service(health_url: str, service_name: str, max_wait: int, log_interval: int) -> bool:
+    """Wait up to max_wait seconds for a service to become healthy.
+
+    Probes back off from 50ms to 1s, so a service that comes up quickly is noticed quickly.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    delay = 0.05
+    next_log = log_interval
+    while loop.time() - start < max_wait:
+        await asyncio.sleep(delay)
         if await _check_service_health(health_url):
             logger.info("%s started successfully", service_name)
             return True
-        if i % log_interval == log_interval - 1:
-            logger.info("Waiting for %s... (%ds)", service_name, i + 1)
+        elapsed = loop.time() - start
+        if elapsed >= next_log:
+            logger.info("Waiting for %s... (%ds)", service_name, elapsed)
+            next_log += log_interval
+        delay = min(delay * 1.5, 1.0)
     return False
 
 
@@ -49,12 +56,11 @@ async def ensure_kokoro_running() -> bool:
     logger.info("Kokoro TTS not running, attempting to start...")
 
     kokoro_dir = SAMANTHA_DIR / "services" / "kokoro"
-    system = platform.system()
     started = False
 
-    if system == "Darwin":
+    if PLATFORM == "Darwin":
         start_script = kokoro_dir / "start-gpu_mac.sh"
-    elif system == "Linux":
+    elif PLATFORM == "Linux":
         if shutil.which("nvidia-smi"):
             start_script = kokoro_dir / "start-gpu.sh"
         else:
@@ -67,8 +73,11 @@ async def ensure_kokoro_running() -> bool:
             subprocess.Popen(
                 ["bash", str(start_script)],
                 cwd=str(kokoro_dir),
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True
             )
             logger.info("Started Kokoro via %s", start_script.name)
             started = True
@@ -97,7 +106,7 @@ async def ensure_whisper_running() -> bool:
 
     logger.info("Whisper STT not running, attempting to start...")
 
-    if platform.system() == "Darwin":
+    if PLATFORM == "Darwin":
         started = False
         start_script = SAMANTHA_DIR / "services" / "whisper" / "bin" / "start-whisper-server.sh"
 
@@ -105,8 +114,11 @@ async def ensure_whisper_running() -> bool:
             try:
                 subprocess.Popen(
                     ["bash", str(start_script)],
+                    stdin=subprocess.DEVNULL,
                     stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                    start_new_session=True
                 )
                 logger.info("Started Whisper via start script")
                 started = True
@@ -0,0 +1,64 @@
+"""Shared HTTP clients for the local Whisper and Kokoro services."""
+
+import asyncio
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger("samantha")
+
+
+# Shared async client so health polling and async STT reuse one connection pool; tied to the loop that created it
+_http_client = None
+_http_client_loop = None
+
+# Shared sync session for the audio threads (STT workers, TTS); urllib3's pool is thread-safe
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_client():
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=2.0,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+def get_http_session() -> requests.Session:
+    """Keep-alive session for blocking calls to Whisper and Kokoro."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP clients (called on stop)."""
+    global _http_client, _http_client_loop, _http_session
+    session, _http_session = _http_session, None
+    if session is not None:
+        session.close()
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("Error closing HTTP client: %s", e)
@@ -3,9 +3,17 @@
 from .stt import (
     transcribe_audio,
     transcribe_audio_sync,
+    transcribe_segments_sync,
+)
+from .streaming import (
+    LocalAgreement,
+    StreamingTranscriber,
 )
 
 __all__ = [
     "transcribe_audio",
     "transcribe_audio_sync",
+    "transcribe_segments_sync",
+    "LocalAgreement",
+    "StreamingTranscriber",
 ]
@@ -0,0 +1,169 @@
+"""Incremental (streaming) transcription for Samantha.
+
+While the user is still talking, the unconfirmed tail of the utterance is
+re-transcribed on a background worker every few hundred milliseconds. Words
+that two consecutive hypotheses agree on are committed (LocalAgreement-2), and
+once a whole Whisper segment is committed the audio before its end timestamp
+is dropped from later rounds, so each round only re-processes the tail. When
+speech ends the latest hypothesis usually already covers everything, so the
+final Whisper pass after the silence timeout can be skipped. If agreement
+stalls and the unconfirmed window grows past a cap, everything up to the last
+segment boundary is committed as heard, so a round never re-sends more than
+about that much audio.
+"""
+
+import logging
+import string
+from concurrent.futures import Executor, Future
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger("samantha")
+
+Segments = list[tuple[float, str]]
+
+MAX_WINDOW_SECONDS = 15.0
+
+
+def _norm(word: str) -> str:
+    return word.lower().strip(string.punctuation)
+
+
+class LocalAgreement:
+    """LocalAgreement-2: commit the word prefix that two consecutive hypotheses agree on."""
+
+    def __init__(self):
+        self.confirmed: list[str] = []
+        self._previous: list[str] = []
+
+    def reset(self) -> None:
+        self.confirmed = []
+        self._previous = []
+
+    def update(self, words: list[str]) -> list[str]:
+        """Feed a hypothesis for the current window; returns the newly confirmed words."""
+        start = len(self.confirmed)
+        agreed = 0
+        for new, old in zip(words[start:], self._previous[start:]):
+            if _norm(new) != _norm(old):
+                break
+            agreed += 1
+        newly_confirmed = words[start:start + agreed]
+        self.confirmed.extend(newly_confirmed)
+        self._previous = words
+        return newly_confirmed
+
+    def drop(self, n: int) -> list[str]:
+        """Remove the first n confirmed words once the window moves past them."""
+        dropped = self.confirmed[:n]
+        self.confirmed = self.confirmed[n:]
+        self._previous = self._previous[n:]
+        return dropped
+
+    def text(self, words: list[str]) -> str:
+        """Confirmed words followed by the unconfirmed remainder of a hypothesis."""
+        return " ".join(self.confirmed + words[len(self.confirmed):])
+
+
+class StreamingTranscriber:
+    """Runs periodic transcription rounds on the unconfirmed tail of a buffer, at most one in flight."""
+
+    def __init__(self, transcribe: Callable[[np.ndarray], Optional[Segments]], executor: Executor,
+                 interval_samples: int, sample_rate: int, max_window_seconds: float = MAX_WINDOW_SECONDS):
+        self._transcribe = transcribe
+        self._executor = executor
+        self._interval = interval_samples
+        self._sample_rate = sample_rate
+        self._max_window = int(max_window_seconds * sample_rate)
+        self.agreement = LocalAgreement()
+        self.reset()
+
+    def reset(self) -> None:
+        self.agreement.reset()
+        self._committed: list[str] = []
+        self._offset = 0
+        self._future: Optional[Future] = None
+        self._future_samples = 0
+        self._hypothesis: Optional[list[str]] = None
+        self._hypothesis_samples = 0
+        self._last_speech_samples = 0
+
+    def feed(self, audio: np.ndarray, is_speech: bool) -> None:
+        """Call once per chunk with the whole buffered utterance."""
+        if is_speech:
+            self._last_speech_samples = len(audio)
+        if self._future is not None and self._future.done():
+            self._collect()
+        if self._future is None and len(audio) - self._future_samples >= self._interval:
+            self._future_samples = len(audio)
+            self._future = self._executor.submit(self._transcribe, audio[self._offset:].copy())
+
+    def finalize(self, audio: np.ndarray) -> Optional[str]:
+        """Final text for the utterance, reusing the last round if it already heard all the speech."""
+        if self._future is not None:
+            self._collect()
+        if self._hypothesis is not None and self._hypothesis_samples >= self._last_speech_samples:
+            logger.debug("Streaming STT: reusing hypothesis, skipping final Whisper pass")
+            tail = self.agreement.text(self._hypothesis)
+        else:
+            segments = self._transcribe(audio[self._offset:])
+            if segments is None and not self._committed:
+                self.reset()
+                return None
+            tail = " ".join(text for _, text in segments or [])
+        text = " ".join(filter(None, [" ".join(self._committed), tail]))
+        self.reset()
+        return text
+
+    def _collect(self) -> None:
+        future, self._future = self._future, None
+        try:
+            segments = future.result()
+        except Exception as e:
+            logger.debug("Streaming STT error: %s", e)
+            return
+        segments = segments or []
+        words = [word for _, text in segments for word in text.split()]
+        self._hypothesis = words
+        self._hypothesis_samples = self._future_samples
+        newly_confirmed = self.agreement.update(words)
+        if newly_confirmed:
+            logger.debug("Streaming STT confirmed: %s", " ".join(newly_confirmed))
+        base = self._offset
+        trimmed = self._trim(segments)
+        if self._future_samples - self._offset > self._max_window:
+            self._flush(segments[trimmed:], base)
+
+    def _trim(self, segments: Segments) -> int:
+        """Move the window past the last segment whose words are all confirmed; returns segments consumed."""
+        confirmed = len(self.agreement.confirmed)
+        consumed = 0
+        trim_end = None
+        trimmed = 0
+        for end, text in segments:
+            n = len(text.split())
+            if consumed + n > confirmed:
+                break
+            consumed += n
+            trim_end = end
+            trimmed += 1
+        if trim_end is None or consumed == 0:
+            return 0
+        self._committed.extend(self.agreement.drop(consumed))
+        self._offset = min(self._offset + int(trim_end * self._sample_rate), self._future_samples)
+        self._hypothesis = self._hypothesis[consumed:]
+        logger.debug("Streaming STT: window now starts at %.1fs", self._offset / self._sample_rate)
+        return trimmed
+
+    def _flush(self, segments: Segments, base: int) -> None:
+        """Window over the cap: commit all but the last unconfirmed segment (all of it if it is the only one)."""
+        flushed = segments[:-1] or segments
+        if not flushed:
+            return
+        n = sum(len(text.split()) for _, text in flushed)
+        self.agreement.drop(n)
+        self._committed.extend(self._hypothesis[:n])
+        self._hypothesis = self._hypothesis[n:]
+        self._offset = min(base + int(flushed[-1][0] * self._sample_rate), self._future_samples)
+        logger.debug("Streaming STT: window over cap, flushed to %.1fs", self._offset / self._sample_rate)
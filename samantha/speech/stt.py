@@ -1,45 +1,55 @@
 """Speech-to-text utilities for Samantha."""
 
+import asyncio
 import logging
 from typing import Optional
 
 import numpy as np
 
-try:
-    import httpx
-except ImportError:
-    httpx = None
-
-from samantha.config import WHISPER_URL, get_min_audio_energy
+from samantha.config import SAMPLE_RATE, WHISPER_URL, get_min_audio_energy, get_whisper_language
 from samantha.audio.recording import normalize_audio, _prepare_audio_for_whisper
+from samantha.services.http import _get_http_client, get_http_session
 
 logger = logging.getLogger("samantha")
 
+# whisper.cpp rejects clips shorter than 100ms; don't spend a round-trip on them
+MIN_WHISPER_SAMPLES = SAMPLE_RATE // 10
+
+
+def _whisper_form(response_format: str) -> dict:
+    """Request fields: greedy decoding with no temperature fallback, pinned language."""
+    return {
+        "response_format": response_format,
+        "language": get_whisper_language(),
+        "temperature": "0",
+        "temperature_inc": "0",
+    }
+
 
 async def transcribe_audio(audio_data: np.ndarray) -> Optional[str]:
-    """Transcribe audio using Whisper STT."""
+    """Transcribe audio using Whisper STT (WAV encoding runs off the event loop)."""
     try:
-        wav_buffer = _prepare_audio_for_whisper(audio_data)
+        wav_buffer = await asyncio.to_thread(_prepare_audio_for_whisper, audio_data)
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                WHISPER_URL,
-                files={"file": ("audio.wav", wav_buffer, "audio/wav")},
-                data={"response_format": "json"}
-            )
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("text", "").strip()
+        response = await _get_http_client().post(
+            WHISPER_URL,
+            files={"file": ("audio.wav", wav_buffer, "audio/wav")},
+            data=_whisper_form("json"),
+            timeout=10.0
+        )
+        if response.status_code == 200:
+            result = response.json()
+            return result.get("text", "").strip()
     except Exception as e:
         logger.debug("STT error: %s", e)
     return None
 
 
-def transcribe_audio_sync(audio_data: np.ndarray) -> Optional[str]:
-    """Synchronous transcribe for use in thread."""
+def _whisper_request_sync(audio_data: np.ndarray, response_format: str) -> Optional[dict]:
+    """POST audio to Whisper, skipping quiet clips. Returns the parsed JSON response."""
+    if len(audio_data) < MIN_WHISPER_SAMPLES:
+        return None
     try:
-        import requests
-
         min_energy = get_min_audio_energy()
         max_energy = np.max(np.abs(audio_data))
         if max_energy < min_energy:
@@ -49,17 +59,35 @@ def transcribe_audio_sync(audio_data: np.ndarray) -> Optional[str]:
         audio_data = normalize_audio(audio_data)
         wav_buffer = _prepare_audio_for_whisper(audio_data)
 
-        response = requests.post(
+        response = get_http_session().post(
             WHISPER_URL,
             files={"file": ("audio.wav", wav_buffer, "audio/wav")},
-            data={"response_format": "json"},
+            data=_whisper_form(response_format),
             timeout=10.0
         )
         if response.status_code == 200:
             result = response.json()
             text = result.get("text", "").strip()
             logger.debug("Audio energy: %d (threshold: %d) - Whisper heard: %s", max_energy, min_energy, text[:50] if text else "(empty)")
-            return text
+            return result
     except Exception as e:
         logger.debug("STT error: %s", e)
     return None
+
+
+def transcribe_audio_sync(audio_data: np.ndarray) -> Optional[str]:
+    """Synchronous transcribe for use in thread."""
+    result = _whisper_request_sync(audio_data, "json")
+    return result.get("text", "").strip() if result is not None else None
+
+
+def transcribe_segments_sync(audio_data: np.ndarray) -> Optional[list[tuple[float, str]]]:
+    """Synchronous transcribe returning Whisper segments as (end_seconds, text)."""
+    result = _whisper_request_sync(audio_data, "verbose_json")
+    if result is None:
+        return None
+    segments = result.get("segments")
+    if not segments:
+        text = result.get("text", "").strip()
+        return [(len(audio_data) / SAMPLE_RATE, text)] if text else []
+    return [(float(seg["end"]), seg.get("text", "").strip()) for seg in segments]
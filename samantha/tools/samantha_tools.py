@@ -1,11 +1,11 @@
 """Samantha MCP tools - Voice assistant with wake word detection and TTS."""
 
+import asyncio
 import json
 import logging
 import os
 import signal
 import threading
-import time
 
 from samantha.server import mcp
 from samantha.config import (
@@ -17,7 +17,7 @@ from samantha.config import (
 )
 import samantha.audio.playback as playback
 from samantha.injection.detection import kill_orphaned_processes, is_samantha_running_elsewhere, get_running_ide, find_terminal_with_ai
-from samantha.services.health import ensure_kokoro_running, ensure_whisper_running
+from samantha.services import close_http_client, ensure_kokoro_running, ensure_whisper_running
 from samantha.core.loop import samantha_loop_thread
 import samantha.core.state as state
 
@@ -57,8 +57,8 @@ async def samantha_start() -> str:
     # Write our PID to the active file so other instances can check if we're alive
     SAMANTHA_ACTIVE_FILE.write_text(str(os.getpid()))
 
-    kokoro_ok = await ensure_kokoro_running()
-    whisper_ok = await ensure_whisper_running()
+    # Independent services: start and poll both at once
+    kokoro_ok, whisper_ok = await asyncio.gather(ensure_kokoro_running(), ensure_whisper_running())
 
     if not kokoro_ok:
         SAMANTHA_ACTIVE_FILE.unlink(missing_ok=True)
@@ -97,6 +97,22 @@ async def samantha_start() -> str:
     return status
 
 
+async def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait up to timeout for a process to exit without blocking the event loop; True if it's gone."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(0.02)
+
+
 @mcp.tool()
 async def samantha_stop() -> str:
     """Stop Samantha voice mode.
@@ -114,13 +130,12 @@ async def samantha_stop() -> str:
                     try:
                         os.kill(recorded_pid, signal.SIGTERM)
                         logger.info("Sent SIGTERM to recorded PID: %d", recorded_pid)
-                        time.sleep(0.2)
-                        try:
-                            os.kill(recorded_pid, 0)  # Check if still alive
-                            os.kill(recorded_pid, signal.SIGKILL)
-                            logger.info("Sent SIGKILL to recorded PID: %d", recorded_pid)
-                        except ProcessLookupError:
-                            pass  # Already dead, good
+                        if not await _wait_for_exit(recorded_pid, 0.2):
+                            try:
+                                os.kill(recorded_pid, signal.SIGKILL)
+                                logger.info("Sent SIGKILL to recorded PID: %d", recorded_pid)
+                            except ProcessLookupError:
+                                pass  # Exited just now, good
                     except (ProcessLookupError, PermissionError):
                         pass
         except (ValueError, Exception) as e:
@@ -159,6 +174,14 @@ async def samantha_stop() -> str:
     # Clean up any remaining orphan processes
     kill_orphaned_processes()
 
+    # A TTS thread may still be reading Kokoro through the shared session; let it see the
+    # interrupt and finish before the session is closed under it
+    tts_done = state._tts_done_event
+    if tts_done is not None and not tts_done.is_set():
+        await asyncio.to_thread(tts_done.wait, 2.0)
+
+    await close_http_client()
+
     return "🛑 Samantha stopped"
 
 
@@ -169,8 +192,7 @@ async def samantha_speak(text: str) -> str:
         playback._last_tts_text = text
 
         if state._samantha_thread and state._samantha_thread.is_alive():
-            with playback._tts_queue_lock:
-                playback._tts_text_queue.append(text)
+            playback.enqueue_tts(text)
             return f"🔊 Spoke: {text}"
         else:
             logger.info("Samantha not running, speaking directly")
@@ -13,6 +13,7 @@ from .text import (
 
 from .logging import (
     log_conversation,
+    flush_conversation_log,
     get_persona,
 )
 
@@ -26,5 +27,6 @@ __all__ = [
     "sanitize_whisper_text",
     "is_noise",
     "log_conversation",
+    "flush_conversation_log",
     "get_persona",
 ]
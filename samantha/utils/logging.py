@@ -1,6 +1,9 @@
 """Logging utilities for Samantha."""
 
+import atexit
 import logging
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -8,9 +11,69 @@ from samantha.config import CONVERSATION_LOG
 
 logger = logging.getLogger("samantha")
 
+# Conversation entries are appended by one writer thread that keeps the file open and
+# flushes whenever it catches up, so callers on the audio/TTS threads never touch the disk
+_log_writer = None  # (thread, queue) of the running writer
+_log_writer_lock = threading.Lock()
+# Bounded so a stalled disk can't grow memory without limit; overflow drops the entry instead of blocking
+_LOG_QUEUE_SIZE = 1000
+
+
+def _write_conversation_log(entries: queue.Queue) -> None:
+    log_file = None
+    try:
+        while True:
+            entry = entries.get()
+            if entry is None:
+                return
+            try:
+                if log_file is None:
+                    CONVERSATION_LOG.parent.mkdir(parents=True, exist_ok=True)
+                    log_file = open(CONVERSATION_LOG, "a")
+                log_file.write(entry + "\n")
+                if entries.empty():
+                    log_file.flush()
+            except Exception as e:
+                logger.debug("Failed to write conversation log: %s", e)
+    finally:
+        if log_file is not None:
+            log_file.close()
+
+
+def _enqueue_conversation_entry(entry: str) -> None:
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            entries = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+            thread = threading.Thread(target=_write_conversation_log, args=(entries,), name="samantha-convlog", daemon=True)
+            thread.start()
+            _log_writer = (thread, entries)
+        try:
+            _log_writer[1].put_nowait(entry)
+        except queue.Full:
+            logger.debug("Conversation log queue full, dropping entry")
+
+
+def flush_conversation_log(timeout: float = 2.0) -> None:
+    """Write out queued entries and close the file (a new writer starts on the next entry)."""
+    global _log_writer
+    with _log_writer_lock:
+        writer, _log_writer = _log_writer, None
+    if writer is None:
+        return
+    thread, entries = writer
+    try:
+        entries.put(None, timeout=timeout)
+    except queue.Full:
+        return
+    thread.join(timeout)
+
+
+atexit.register(flush_conversation_log)
+
 
 def log_conversation(entry_type: str, text: str):
-    """Log conversation entry to file."""
+    """Log conversation entry to file (written asynchronously)."""
     timestamp = datetime.now().strftime("%H:%M:%S")
 
     if entry_type == "STT":
@@ -22,27 +85,33 @@ def log_conversation(entry_type: str, text: str):
     else:
         log_entry = f"[{timestamp}] {entry_type}: {text}"
 
-    try:
-        CONVERSATION_LOG.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONVERSATION_LOG, "a") as f:
-            f.write(log_entry + "\n")
-    except Exception as e:
-        logger.debug("Failed to write conversation log: %s", e)
-
+    _enqueue_conversation_entry(log_entry)
     logger.info(log_entry)
 
 
+_CLAUDE_MD = Path(__file__).parent.parent.parent / "CLAUDE.md"
+_persona_cache = {"stamp": None, "value": ""}
+
+
 def get_persona() -> str:
-    """Read persona instructions from CLAUDE.md."""
+    """Read persona instructions from CLAUDE.md (re-read only when the file changes)."""
+    try:
+        st = _CLAUDE_MD.stat()
+    except OSError:
+        return ""
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp == _persona_cache["stamp"]:
+        return _persona_cache["value"]
+    value = ""
     try:
-        claude_md_path = Path(__file__).parent.parent.parent / "CLAUDE.md"
-        if claude_md_path.exists():
-            content = claude_md_path.read_text()
-            start = content.find("## Samantha Persona")
-            if start != -1:
-                end = content.find("---", start)
-                if end != -1:
-                    return content[start:end].strip()
+        content = _CLAUDE_MD.read_text()
+        start = content.find("## Samantha Persona")
+        if start != -1:
+            end = content.find("---", start)
+            if end != -1:
+                value = content[start:end].strip()
     except Exception:
         pass
-    return ""
+    _persona_cache["stamp"] = stamp
+    _persona_cache["value"] = value
+    return value
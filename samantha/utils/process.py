@@ -0,0 +1,37 @@
+"""Subprocess helpers for the short-lived tools Samantha shells out to (osascript, xdotool, players)."""
+
+import platform
+import shutil
+import subprocess
+from functools import lru_cache
+
+PLATFORM = platform.system()
+
+
+@lru_cache(maxsize=None)
+def _executable(name: str) -> str | None:
+    return shutil.which(name)
+
+
+def _spawn_kwargs(cmd: list[str], kwargs: dict) -> dict:
+    """On macOS, let CPython use posix_spawn instead of fork+exec.
+
+    That needs an absolute executable and close_fds=False; fds Python opens are non-inheritable,
+    so children still only get stdio. Linux already uses vfork, so calls there are left as-is.
+    """
+    if PLATFORM != "Darwin" or kwargs.get("shell"):
+        return kwargs
+    executable = _executable(cmd[0])
+    if executable is None:
+        return kwargs
+    return {"executable": executable, "close_fds": False, **kwargs}
+
+
+def run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run for an external tool, spawned cheaply where the platform allows it."""
+    return subprocess.run(cmd, **_spawn_kwargs(cmd, kwargs))
+
+
+def popen(cmd: list[str], **kwargs) -> subprocess.Popen:
+    """subprocess.Popen for an external tool, spawned cheaply where the platform allows it."""
+    return subprocess.Popen(cmd, **_spawn_kwargs(cmd, kwargs))
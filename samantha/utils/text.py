@@ -1,6 +1,7 @@
 """Text processing utilities for Samantha."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from samantha.config import (
@@ -12,20 +13,62 @@ from samantha.config import (
     get_deactivation_phrases,
 )
 
+_NOISE_PHRASES = (
+    'thank you for watching',
+    'look at the next video',
+)
+
+_NOISE_WORDS = frozenset({
+    'click', 'clap', 'ding', 'bell', 'tick', 'thud', 'bang',
+    'engine', 'revving', 'keyboard', 'typing', 'noise',
+    'silence', 'static', 'hum', 'buzz', 'music',
+})
+
+
+@lru_cache(maxsize=32)
+def _phrase_pattern(phrases: tuple[str, ...]) -> re.Pattern:
+    """Compile phrases into one alternation so "any phrase in text" is a single scan."""
+    if not phrases:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(re.escape(p) for p in _longest_first(tuple(set(phrases)))))
+
+
+@lru_cache(maxsize=8)
+def _longest_first(phrases: tuple[str, ...]) -> tuple[str, ...]:
+    """Phrases sorted longest first, memoized per phrase set."""
+    return tuple(sorted(phrases, key=len, reverse=True))
+
 
+@lru_cache(maxsize=8)
+def _phrase_set(phrases: tuple[str, ...]) -> frozenset[str]:
+    """Phrases for an exact-match check before the substring scan."""
+    return frozenset(phrases)
+
+
+# Any non-word, non-space character: also catches Whisper's curly quotes, ellipses and dashes
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=8)
 def normalize_text(text: str) -> str:
-    """Normalize text by removing punctuation and converting to lowercase."""
+    """Normalize text by removing punctuation and converting to lowercase.
+
+    Cached so the wake/stop/deactivation checks on one transcript normalize it once.
+    """
     if not text:
         return ""
-    import string
-    return text.lower().translate(str.maketrans('', '', string.punctuation)).strip()
+    return _PUNCTUATION_RE.sub("", text.lower()).strip()
 
 
 def check_for_wake_word(text: str) -> Optional[str]:
     if not text:
         return None
     text_clean = normalize_text(text)
-    for wake_word in get_wake_words():
+    wake_words = tuple(get_wake_words())
+    if not _phrase_pattern(wake_words).search(text_clean):
+        return None
+    # Ordered scan only on a hit, so the first configured wake word still wins
+    for wake_word in wake_words:
         if wake_word in text_clean:
             return wake_word
     return None
@@ -34,58 +77,168 @@ def check_for_wake_word(text: str) -> Optional[str]:
 def check_for_stop_phrase(text: str) -> bool:
     if not text:
         return False
+    phrases = tuple(get_stop_phrases())
     text_clean = normalize_text(text)
-    return any(phrase in text_clean for phrase in get_stop_phrases())
+    # Short utterances are often exactly the phrase
+    if text_clean in _phrase_set(phrases):
+        return True
+    return _phrase_pattern(phrases).search(text_clean) is not None
 
 
 def check_for_deactivation(text: str) -> bool:
     """Check if text contains a deactivation phrase to stop active listening."""
     if not text:
         return False
+    phrases = tuple(get_deactivation_phrases())
     text_clean = normalize_text(text)
-    return any(phrase in text_clean for phrase in get_deactivation_phrases())
+    if text_clean in _phrase_set(phrases):
+        return True
+    return _phrase_pattern(phrases).search(text_clean) is not None
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_SANITIZE_RE = re.compile(r"[^\w\s']")
+
+
+@lru_cache(maxsize=8)
+def _wake_word_patterns(wake_words: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Wake phrases longest first, each tolerating punctuation between its words."""
+    return tuple(
+        re.compile(r'[^\w]*'.join(re.escape(w) for w in wake_word.split()), re.IGNORECASE)
+        for wake_word in _longest_first(wake_words)
+    )
+
+
+@lru_cache(maxsize=8)
+def _stop_phrase_pattern(phrases: tuple[str, ...]) -> Optional[re.Pattern]:
+    """Alternation of the stop phrases with flexible whitespace."""
+    if not phrases:
+        return None
+    escaped = [r'\s+'.join(re.escape(w) for w in p.split()) for p in phrases]
+    return re.compile(r'(' + '|'.join(escaped) + r')', re.IGNORECASE)
+
+
+def _strip_whisper_sounds(text: str) -> str:
+    """Remove Whisper sound tags; most transcripts have none, so skip the regex when no tag can start."""
+    if '[' not in text and '(' not in text and '♪' not in text:
+        return text
+    return WHISPER_SOUND_PATTERN.sub('', text)
 
 
 def clean_command(text: str) -> str:
     """Clean recorded command text. Removes content BEFORE wake word, Whisper metadata, and anything AFTER stop phrases."""
-    cleaned = WHISPER_SOUND_PATTERN.sub('', text).strip()
+    cleaned = _strip_whisper_sounds(text).strip()
 
-    for wake_word in sorted(get_wake_words(), key=len, reverse=True):
-        pattern = r'[^\w]*'.join(re.escape(w) for w in wake_word.split())
-        match = re.search(pattern, cleaned, re.IGNORECASE)
+    for pattern in _wake_word_patterns(tuple(get_wake_words())):
+        match = pattern.search(cleaned)
         if match:
             cleaned = cleaned[match.start():].strip()
             break
 
-    phrases = get_stop_phrases()
-    escaped = [r'\s+'.join(re.escape(w) for w in p.split()) for p in phrases]
-    stop_phrases_pattern = r'(' + '|'.join(escaped) + r')'
-    match = re.search(stop_phrases_pattern, cleaned, flags=re.IGNORECASE)
+    stop_pattern = _stop_phrase_pattern(tuple(get_stop_phrases()))
+    match = stop_pattern.search(cleaned) if stop_pattern is not None else None
     if match:
         cleaned = cleaned[:match.end()]
 
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
     return cleaned
 
 
+_TRIGGER_PREFIXES = frozenset({"hey", "hi", "hello", "ok", "okay", "a", "the", "yo"})
+
+
+@lru_cache(maxsize=8)
+def _trigger_words(wake_words: tuple[str, ...]) -> tuple[str, ...]:
+    """The distinctive words in the wake phrases (greetings and short words dropped)."""
+    return tuple(sorted({
+        word
+        for wake_word in wake_words
+        for word in wake_word.split()
+        if word not in _TRIGGER_PREFIXES and len(word) >= 3
+    }))
+
+
+@lru_cache(maxsize=8)
+def _trigger_pattern(wake_words: tuple[str, ...]) -> Optional[re.Pattern]:
+    """Word-boundary alternation of the distinctive words in the wake phrases."""
+    trigger_words = _trigger_words(wake_words)
+    if not trigger_words:
+        return None
+    return re.compile(r'\b(?:' + '|'.join(re.escape(w) for w in trigger_words) + r')\b')
+
+
+_PHONETIC_SUBS = (("ph", "f"), ("ck", "k"), ("c", "k"), ("q", "k"), ("z", "s"), ("x", "ks"))
+_PHONETIC_DROP_RE = re.compile(r"[aeiouhwy]")
+_REPEAT_RE = re.compile(r"(.)\1+")
+_LETTERS_RE = re.compile(r"[^\W\d_]+")
+
+
+def _phonetic_key(word: str) -> str:
+    """Rough sound-alike key: first letter, then consonants with spelling variants folded."""
+    for spelling, sound in _PHONETIC_SUBS:
+        word = word.replace(spelling, sound)
+    return _REPEAT_RE.sub(r"\1", word[:1] + _PHONETIC_DROP_RE.sub("", word[1:]))
+
+
+@lru_cache(maxsize=8)
+def _trigger_keys(wake_words: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Trigger words grouped by phonetic key, skipping keys too short to match safely."""
+    keys = {}
+    for word in _trigger_words(wake_words):
+        key = _phonetic_key(word)
+        if len(key) >= 3:
+            keys[key] = keys.get(key, ()) + (word,)
+    return keys
+
+
+def _within_edits(a: str, b: str, limit: int) -> bool:
+    """True if a and b are at most `limit` single-letter edits apart."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+def _sounds_like(token: str, word: str) -> bool:
+    """A misspelling of word: same first letter, length within one, and one edit (two for long words)."""
+    return (
+        token[0] == word[0]
+        and abs(len(token) - len(word)) <= 1
+        and _within_edits(token, word, 2 if len(word) >= 8 else 1)
+    )
+
+
 def contains_trigger_word(text: str) -> bool:
-    """Check if text contains a trigger word from the active profile's wake words."""
+    """Check if text contains a trigger word from the active profile's wake words.
+
+    Falls back to a phonetic match so Whisper misspellings ("Samanta") still activate; the
+    key alone is too loose ("comment" vs "cemantha"), so the spelling must also be close.
+    """
     if not text:
         return False
+    wake_words = tuple(get_wake_words())
+    pattern = _trigger_pattern(wake_words)
+    if pattern is None:
+        return False
     text_lower = text.lower()
-    prefixes = {"hey", "hi", "hello", "ok", "okay", "a", "the", "yo"}
-    trigger_words = set()
-    for wake_word in get_wake_words():
-        for word in wake_word.split():
-            if word not in prefixes and len(word) >= 3:
-                trigger_words.add(word)
-    for word in trigger_words:
-        pattern = r'\b' + re.escape(word) + r'\b'
-        if re.search(pattern, text_lower):
-            return True
+    if pattern.search(text_lower):
+        return True
+    keys = _trigger_keys(wake_words)
+    for token in _LETTERS_RE.findall(text_lower):
+        for word in keys.get(_phonetic_key(token), ()):
+            if _sounds_like(token, word):
+                return True
     return False
 
 
+@lru_cache(maxsize=8)
 def sanitize_whisper_text(text: str) -> str:
     """Clean Whisper transcription by removing metadata and hallucinations.
 
@@ -95,16 +248,14 @@ def sanitize_whisper_text(text: str) -> str:
     - Musical notes: ♪♪♪
     - Extra whitespace and special punctuation
 
-    Returns the cleaned dialogue text.
+    Returns the cleaned dialogue text. Cached: the loop and is_noise sanitize the same transcript.
     """
     if not text:
         return ""
 
-    cleaned = WHISPER_SOUND_PATTERN.sub('', text)
-    cleaned = re.sub(r"[^\w\s']", '', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip().lower()
-
-    return cleaned
+    cleaned = _SANITIZE_RE.sub('', _strip_whisper_sounds(text))
+    # split/join collapses and trims whitespace in one pass, without a second regex
+    return ' '.join(cleaned.split()).lower()
 
 
 def is_noise(text: str) -> bool:
@@ -117,25 +268,11 @@ def is_noise(text: str) -> bool:
     if not sanitized or len(sanitized) < 3:
         return True
 
-    all_keywords = get_wake_words() + get_stop_phrases() + get_deactivation_phrases() + INTERRUPT_WORDS + SKIP_WORDS
-    for keyword in all_keywords:
-        if keyword in sanitized:
-            return False
+    all_keywords = (*get_wake_words(), *get_stop_phrases(), *get_deactivation_phrases(), *INTERRUPT_WORDS, *SKIP_WORDS)
+    if _phrase_pattern(all_keywords).search(sanitized):
+        return False
 
-    noise_phrases = [
-        'thank you for watching',
-        'look at the next video',
-    ]
-    for phrase in noise_phrases:
-        if phrase in sanitized:
-            return True
-
-    noise_words = [
-        'click', 'clap', 'ding', 'bell', 'tick', 'thud', 'bang',
-        'engine', 'revving', 'keyboard', 'typing', 'noise',
-        'silence', 'static', 'hum', 'buzz', 'music',
-    ]
-    if sanitized in noise_words:
+    if _phrase_pattern(_NOISE_PHRASES).search(sanitized):
         return True
 
-    return False
+    return sanitized in _NOISE_WORDS
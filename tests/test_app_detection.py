@@ -0,0 +1,133 @@
+"""Tests for IDE/terminal detection batching and injection tool lookup."""
+
+import subprocess
+
+import pytest
+
+import samantha.injection.detection as detection
+import samantha.utils.process as process
+
+
+@pytest.fixture(autouse=True)
+def fresh_detection():
+    detection.invalidate_detection_cache()
+    yield
+    detection.invalidate_detection_cache()
+
+
+def _completed(stdout, returncode=0):
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr="")
+
+
+def test_macos_ide_detection_uses_one_system_events_query(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Darwin")
+    monkeypatch.setattr(detection, "get_target_app", lambda: None)
+    run = mocker.patch.object(detection.process, "run", return_value=_completed("Finder\nZed\nCode\n"))
+
+    assert detection.get_running_ide() == "Code"
+    assert run.call_count == 1
+    assert run.call_args.args[0][0] == "osascript"
+
+
+def test_macos_ide_detection_falls_back_to_ps(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Darwin")
+    monkeypatch.setattr(detection, "get_target_app", lambda: None)
+    mocker.patch.object(detection.process, "run", return_value=_completed("", returncode=1))
+    mocker.patch.object(detection, "_get_running_processes_macos", return_value=["launchd", "Windsurf"])
+
+    assert detection.get_running_ide() == "Windsurf"
+
+
+def test_linux_paste_uses_keystroke_tool_resolved_at_import(monkeypatch, mocker):
+    import samantha.injection.inject as inject
+
+    monkeypatch.setattr(inject, "PLATFORM", "Linux")
+    monkeypatch.setattr(inject, "_LINUX_KEY_TOOL", "ydotool")
+    mocker.patch.object(inject.time, "sleep")
+    which = mocker.patch.object(inject.shutil, "which")
+    run = mocker.patch.object(inject.process, "run")
+
+    assert inject.simulate_paste_and_enter()
+    assert [c.args[0][0] for c in run.call_args_list] == ["ydotool", "ydotool"]
+    which.assert_not_called()
+
+    monkeypatch.setattr(inject, "_LINUX_KEY_TOOL", None)
+    assert not inject.simulate_paste_and_enter()
+
+
+def test_linux_ide_detection_lists_windows_once(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Linux")
+    monkeypatch.setattr(detection, "get_target_app", lambda: None)
+    monkeypatch.setattr(detection, "_HAS_WMCTRL", True)
+    monkeypatch.setattr(detection, "_HAS_XDOTOOL", False)
+    titles = "0x01  0 host Terminal\n0x02  0 host main.py - project - Visual Studio Code\n"
+    run = mocker.patch.object(detection.process, "run", return_value=_completed(titles))
+
+    assert detection.get_running_ide() == "code"
+    assert run.call_count == 1
+    assert run.call_args.args[0] == ["wmctrl", "-l"]
+
+
+def test_macos_tools_are_spawned_with_absolute_path(mocker, monkeypatch):
+    monkeypatch.setattr(process, "PLATFORM", "Darwin")
+    mocker.patch.object(process, "_executable", return_value="/usr/bin/osascript")
+    run = mocker.patch.object(process.subprocess, "run")
+
+    process.run(["osascript", "-e", "beep"], capture_output=True)
+    assert run.call_args.args[0] == ["osascript", "-e", "beep"]
+    assert run.call_args.kwargs == {"executable": "/usr/bin/osascript", "close_fds": False, "capture_output": True}
+
+    process.run(["clip.exe"], shell=True)
+    assert run.call_args.kwargs == {"shell": True}
+
+
+def test_detection_results_are_reused_until_invalidated(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Linux")
+    monkeypatch.setattr(detection, "get_target_app", lambda: None)
+    monkeypatch.setattr(detection, "_HAS_WMCTRL", True)
+    titles = mocker.patch.object(detection, "_linux_window_titles", return_value="0x01 0 host cursor")
+
+    assert detection.get_running_ide() == "cursor"
+    assert detection.get_running_ide() == "cursor"
+    assert titles.call_count == 1
+
+    detection.invalidate_detection_cache()
+    titles.return_value = ""
+    assert detection.get_running_ide() is None
+    assert titles.call_count == 2
+
+
+def test_terminal_ai_check_uses_one_ps_scan(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Linux")
+    monkeypatch.setattr(detection, "get_ai_process_pattern", lambda: "claude|aider")
+    ps = "?        /usr/bin/python -m samantha\n?        node /opt/Claude/extension\npts/3    claude --resume\n"
+    run = mocker.patch.object(detection.process, "run", return_value=_completed(ps))
+
+    assert detection.is_ai_process_running()
+    assert detection.is_ai_running_in_terminal()
+    assert run.call_count == 1
+
+    detection.invalidate_detection_cache()
+    run.return_value = _completed("?        node /opt/Claude/extension\n")
+    assert not detection.is_ai_running_in_terminal()
+
+
+def test_macos_terminal_lookups_are_one_query_each(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Darwin")
+    monkeypatch.setattr(detection, "is_ai_running_in_terminal", lambda: True)
+    monkeypatch.setattr(detection, "get_ai_window_titles", lambda: ["claude"])
+    run = mocker.patch.object(detection.process, "run", return_value=_completed("iTerm2\n"))
+
+    assert detection.find_terminal_with_ai() == "iTerm2"
+    assert detection.find_terminal_with_ai() == "iTerm2"
+    assert detection.activate_terminal_with_ai()
+    assert run.call_count == 2
+    assert '"Terminal", "iTerm2"' in run.call_args.args[0][2]
+
+
+def test_ai_process_pattern_matches_regardless_of_case(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Darwin")
+    monkeypatch.setattr(detection, "get_ai_process_pattern", lambda: "Claude|Cursor")
+    mocker.patch.object(detection.process, "run", return_value=_completed("ttys001  /usr/local/bin/claude\n"))
+
+    assert detection.is_ai_running_in_terminal()
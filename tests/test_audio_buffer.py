@@ -0,0 +1,107 @@
+"""Tests for the capture buffering and level helpers used by the listening loop."""
+
+import queue
+
+import numpy as np
+import pytest
+
+from samantha.audio import AudioBuffer, CaptureRing
+
+
+def _samples(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.int16)
+
+
+def test_append_and_view_preserve_order():
+    buf = AudioBuffer(8)
+    buf.append(_samples(0, 3))
+    buf.append(_samples(3, 3))
+    assert len(buf) == 6
+    assert buf.view().tolist() == list(range(6))
+
+
+def test_grows_past_initial_capacity():
+    buf = AudioBuffer(4)
+    for i in range(10):
+        buf.append(_samples(i * 3, 3))
+    assert buf.view().tolist() == list(range(30))
+
+
+def test_keep_last_trims_oldest_and_compacts_on_wrap():
+    buf = AudioBuffer(8)
+    for i in range(20):
+        buf.append(_samples(i * 2, 2))
+        buf.keep_last(6)
+    assert buf.view().tolist() == list(range(34, 40))
+    # Trimming must not force growth: the window fits the original storage
+    assert len(buf._data) == 8
+
+
+def test_reset_empties_buffer():
+    buf = AudioBuffer(4)
+    buf.append(_samples(0, 4))
+    buf.reset()
+    assert len(buf) == 0
+    buf.append(_samples(7, 1))
+    assert buf.view().tolist() == [7]
+
+
+def _block(start: int, n: int) -> bytearray:
+    """A mono int16 buffer as RawInputStream hands it to the callback."""
+    return bytearray(_samples(start, n).tobytes())
+
+
+def test_capture_ring_hands_out_blocks_in_order():
+    ring = CaptureRing(slots=4, block_samples=4)
+    ring.put_raw(_block(0, 4))
+    ring.put_raw(_block(4, 4))
+    assert ring.get(timeout=0.01).tolist() == [0, 1, 2, 3]
+    ring.put_raw(_block(8, 4))
+    assert [b.tolist() for b in ring.drain(timeout=0.01)] == [[4, 5, 6, 7], [8, 9, 10, 11]]
+    with pytest.raises(queue.Empty):
+        ring.drain(timeout=0.01)
+
+
+def test_capture_ring_reuses_slots_and_drops_when_full():
+    ring = CaptureRing(slots=2, block_samples=4)
+    ring.put_raw(_block(0, 4))
+    first = ring.get(timeout=0.01)
+    ring.put_raw(_block(4, 4))
+    ring.put_raw(_block(8, 4))
+    ring.put_raw(_block(12, 4))  # ring full: dropped, unread blocks are kept
+    assert ring.dropped == 1
+    blocks = ring.drain(timeout=0.01)
+    assert [b.tolist() for b in blocks] == [[4, 5, 6, 7], [8, 9, 10, 11]]
+    assert np.shares_memory(first, blocks[1])
+
+
+def test_capture_ring_splits_oversized_blocks_and_clears():
+    ring = CaptureRing(slots=4, block_samples=4)
+    ring.put_raw(_block(0, 6))
+    assert len(ring) == 2
+    assert [b.tolist() for b in ring.drain(timeout=0.01)] == [[0, 1, 2, 3], [4, 5]]
+    ring.put_raw(_block(6, 4))
+    ring.clear()
+    assert len(ring) == 0
+
+
+def test_capture_ring_wakes_waiting_consumer():
+    import threading
+
+    ring = CaptureRing(slots=4, block_samples=4)
+    timer = threading.Timer(0.05, ring.put_raw, args=(_block(0, 4),))
+    timer.start()
+    assert ring.get(timeout=2.0).tolist() == [0, 1, 2, 3]
+    timer.join()
+
+
+def test_normalize_audio_boosts_quiet_clips_and_handles_int16_min():
+    from samantha.audio import normalize_audio
+
+    quiet = np.array([0, 500, -1000, 250], dtype=np.int16)
+    boosted = normalize_audio(quiet)
+    assert boosted.dtype == np.int16
+    assert boosted.tolist() == [0, 10000, -20000, 5000]
+
+    loud = np.array([-32768, 0, 100], dtype=np.int16)
+    assert normalize_audio(loud) is loud
@@ -0,0 +1,40 @@
+"""Tests for chime playback (in-process decode with system-player fallback)."""
+
+import pytest
+
+import samantha.audio.playback as playback
+
+
+@pytest.fixture
+def linux(monkeypatch):
+    monkeypatch.setattr(playback, "PLATFORM", "Linux")
+    monkeypatch.setattr(playback, "_LINUX_PLAYER", "paplay")
+    monkeypatch.setattr(playback, "get_output_device", lambda: None)
+    playback._load_sound.cache_clear()
+    yield
+    playback._load_sound.cache_clear()
+
+
+def test_chime_is_decoded_once_and_played_in_process(linux, monkeypatch, mocker):
+    soundfile = mocker.Mock()
+    soundfile.read.return_value = ("samples", 48000)
+    monkeypatch.setattr(playback, "soundfile", soundfile)
+    play = mocker.patch.object(playback.sd, "play")
+    popen = mocker.patch.object(playback.process, "popen")
+
+    playback.play_sound("activate")
+    playback.play_sound("activate")
+
+    assert soundfile.read.call_count == 1
+    assert play.call_count == 2
+    assert play.call_args.args == ("samples", 48000)
+    popen.assert_not_called()
+
+
+def test_chime_falls_back_to_system_player(linux, monkeypatch, mocker):
+    monkeypatch.setattr(playback, "soundfile", None)
+    popen = mocker.patch.object(playback.process, "popen")
+
+    playback.play_sound("stop")
+
+    assert popen.call_args.args[0] == ["paplay", playback.SOUNDS_LINUX["stop"]]
@@ -0,0 +1,26 @@
+"""Tests for the installer's Whisper model selection."""
+
+import samantha.cli as cli
+
+
+def test_quantized_model_names():
+    assert cli.whisper_model_name("small") == "small-q8_0"
+    assert cli.whisper_model_name("large-v3") == "large-v3-q5_0"
+    assert cli.whisper_model_name("small", quantized=False) == "small"
+    assert set(cli.WHISPER_QUANTIZATION) == set(cli.WHISPER_MODELS)
+
+
+def test_start_script_defaults_to_installed_model(monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "WHISPER_DIR", tmp_path)
+    script = cli.create_whisper_start_script("small-q8_0").read_text()
+    assert 'MODEL_NAME="${SAMANTHA_WHISPER_MODEL:-small-q8_0}"' in script
+
+
+def test_download_model_fetches_quantized_weights(mocker, monkeypatch, tmp_path):
+    from click.testing import CliRunner
+
+    monkeypatch.setattr(cli, "WHISPER_DIR", tmp_path)
+    download = mocker.patch.object(cli, "download_whisper_model")
+    assert CliRunner().invoke(cli.cli, ["download-model", "base"]).exit_code == 0
+    assert CliRunner().invoke(cli.cli, ["download-model", "base", "--full-precision"]).exit_code == 0
+    assert [c.args[0] for c in download.call_args_list] == ["base-q8_0", "base"]
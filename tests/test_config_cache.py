@@ -0,0 +1,104 @@
+"""Tests for the mtime-keyed config cache."""
+
+import json
+import os
+
+import pytest
+
+import samantha.config.settings as settings
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(settings, "CONFIG_FILE", path)
+    monkeypatch.setattr(settings, "_config_cache", {"stamp": None, "data": {}, "checked": None, "generation": 0})
+    monkeypatch.setattr(settings, "_CONFIG_STAT_INTERVAL", 0.0)
+    return path
+
+
+def _touch(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_config_is_parsed_once_until_file_changes(config_file, mocker):
+    config_file.write_text(json.dumps({"voice": "af_one"}))
+    loads = mocker.spy(settings.json, "loads")
+
+    assert settings.get_config("voice") == "af_one"
+    assert settings.get_config("voice") == "af_one"
+    assert loads.call_count == 1
+
+    config_file.write_text(json.dumps({"voice": "af_two", "x": 1}))
+    _touch(config_file)
+    assert settings.get_config("voice") == "af_two"
+    assert loads.call_count == 2
+
+
+def test_missing_or_invalid_config_is_empty(config_file):
+    assert settings.load_config() == {}
+    config_file.write_text("{not json")
+    assert settings.load_config() == {}
+
+
+def test_stat_is_skipped_within_interval(config_file, monkeypatch):
+    config_file.write_text(json.dumps({"voice": "af_one"}))
+    monkeypatch.setattr(settings, "_CONFIG_STAT_INTERVAL", 60.0)
+    assert settings.get_config("voice") == "af_one"
+
+    config_file.write_text(json.dumps({"voice": "af_two", "x": 1}))
+    _touch(config_file)
+    assert settings.get_config("voice") == "af_one"
+
+    settings._config_cache["checked"] = None
+    assert settings.get_config("voice") == "af_two"
+
+
+def test_getters_are_memoized_until_config_changes(config_file, mocker):
+    config_file.write_text(json.dumps({"wake_words": "Hey Sam, Sam"}))
+    get_config = mocker.spy(settings, "get_config")
+
+    assert settings.get_wake_words() == ["hey sam", "sam"]
+    calls = get_config.call_count
+    assert settings.get_wake_words() == ["hey sam", "sam"]
+    assert get_config.call_count == calls
+
+    config_file.write_text(json.dumps({"wake_words": ["Computer"]}))
+    _touch(config_file)
+    assert settings.get_wake_words() == ["computer"]
+
+
+def test_voice_message_suffix_is_rebuilt_only_on_config_change(config_file, mocker):
+    config_file.write_text(json.dumps({"user_name": "Ada"}))
+    get_profile = mocker.spy(settings, "get_profile")
+
+    suffix = settings.get_voice_message_suffix()
+    assert '"Ada"' in suffix
+    calls = get_profile.call_count
+    assert settings.get_voice_message_suffix() is suffix
+    assert get_profile.call_count == calls
+
+    config_file.write_text(json.dumps({"user_name": "Grace"}))
+    _touch(config_file)
+    assert '"Grace"' in settings.get_voice_message_suffix()
+
+
+def test_injection_getters_follow_config_changes(config_file):
+    config_file.write_text(json.dumps({"injection_mode": "cli", "restore_focus": False}))
+    assert settings.get_injection_mode() == "cli"
+    assert settings.get_restore_focus() is False
+
+    config_file.write_text(json.dumps({"injection_mode": "desktop", "target_app": " Cursor "}))
+    _touch(config_file)
+    assert settings.get_injection_mode() == "desktop"
+    assert settings.get_restore_focus() is True
+    assert settings.get_target_app() == "Cursor"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (True, True), (False, False), ("true", True), ("Yes", True), ("1", True), ("false", False), ("off", False), (None, True),
+])
+def test_bool_settings_accept_json_bools_and_strings(config_file, value, expected):
+    config_file.write_text(json.dumps({"restore_focus": value}))
+    assert settings.get_restore_focus() is expected
@@ -0,0 +1,39 @@
+"""Tests for interrupt/skip word detection during TTS playback."""
+
+import pytest
+
+import samantha.audio.playback as playback
+from samantha.audio import detect_control_words, get_active_interrupt_words
+
+
+@pytest.fixture
+def tts_text():
+    saved = playback._last_tts_text
+
+    def _set(text):
+        playback._last_tts_text = text
+
+    yield _set
+    playback._last_tts_text = saved
+
+
+def test_detects_interrupt_and_skip_in_one_pass(tts_text):
+    tts_text("Here is the weather forecast")
+    assert detect_control_words("please stop") == (True, False)
+    assert detect_control_words("skip this one") == (False, True)
+    assert detect_control_words("stop and skip") == (True, True)
+    assert detect_control_words("nonstop talking") == (False, False)
+    assert detect_control_words("") == (False, False)
+
+
+def test_interrupt_word_spoken_by_tts_needs_repeating(tts_text):
+    tts_text("I will stop the timer now")
+    assert "stop" not in get_active_interrupt_words()
+    assert detect_control_words("stop") == (False, False)
+    assert detect_control_words("stop stop") == (True, False)
+    assert detect_control_words("quiet") == (True, False)
+
+
+def test_skip_disabled_when_tts_says_skip_word(tts_text):
+    tts_text("Should I continue with the plan?")
+    assert detect_control_words("continue") == (False, False)
@@ -0,0 +1,69 @@
+"""Tests for utils.logging: background conversation log writer and persona cache."""
+
+import threading
+
+import pytest
+
+import samantha.utils.logging as conv_logging
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    conv_logging.flush_conversation_log()
+    path = tmp_path / "logs" / "conversation.log"
+    monkeypatch.setattr(conv_logging, "CONVERSATION_LOG", path)
+    yield path
+    conv_logging.flush_conversation_log()
+
+
+def test_entries_are_written_in_order_after_flush(log_path):
+    conv_logging.log_conversation("STT", "open the door")
+    conv_logging.log_conversation("TTS", "done")
+    conv_logging.log_conversation("SKIP", "next")
+    conv_logging.flush_conversation_log()
+
+    lines = log_path.read_text().splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == [
+        "🎙️ User: open the door",
+        "🔊 Samantha: done",
+        "SKIP: next",
+    ]
+
+
+def test_writer_restarts_after_flush(log_path):
+    conv_logging.log_conversation("STT", "first")
+    conv_logging.flush_conversation_log()
+    conv_logging.log_conversation("STT", "second")
+    conv_logging.flush_conversation_log()
+
+    assert len(log_path.read_text().splitlines()) == 2
+
+
+def test_full_queue_drops_instead_of_blocking(log_path, monkeypatch):
+    release = threading.Event()
+    real_writer = conv_logging._write_conversation_log
+
+    def stalled_writer(entries):
+        release.wait(2)
+        real_writer(entries)
+
+    monkeypatch.setattr(conv_logging, "_LOG_QUEUE_SIZE", 2)
+    monkeypatch.setattr(conv_logging, "_write_conversation_log", stalled_writer)
+    for i in range(5):
+        conv_logging.log_conversation("STT", f"line {i}")
+    release.set()
+    conv_logging.flush_conversation_log()
+
+    assert len(log_path.read_text().splitlines()) == 2
+
+
+def test_persona_is_reread_only_when_file_changes(tmp_path, monkeypatch, mocker):
+    path = tmp_path / "CLAUDE.md"
+    path.write_text("intro\n## Samantha Persona\nwarm\n---\nrest")
+    monkeypatch.setattr(conv_logging, "_CLAUDE_MD", path)
+    monkeypatch.setattr(conv_logging, "_persona_cache", {"stamp": None, "value": ""})
+    read_text = mocker.spy(type(path), "read_text")
+
+    assert conv_logging.get_persona() == "## Samantha Persona\nwarm"
+    assert conv_logging.get_persona() == "## Samantha Persona\nwarm"
+    assert read_text.call_count == 1
@@ -0,0 +1,54 @@
+"""Tests for service health checks (shared client, startup polling)."""
+
+import asyncio
+
+import samantha.services.health as health
+import samantha.services.http as http
+
+
+def test_health_checks_reuse_one_client_per_loop(mocker):
+    get = mocker.AsyncMock(return_value=mocker.Mock(status_code=200))
+
+    async def run():
+        client = http._get_http_client()
+        mocker.patch.object(client, "get", get)
+        results = [await health._check_service_health("http://localhost:1/health") for _ in range(3)]
+        assert http._get_http_client() is client
+        await http.close_http_client()
+        return results
+
+    assert asyncio.run(run()) == [True, True, True]
+    assert get.await_count == 3
+    assert http._http_client is None
+
+
+def test_new_event_loop_gets_a_fresh_client():
+    async def grab():
+        return http._get_http_client()
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    asyncio.run(http.close_http_client())
+
+
+def test_wait_for_service_notices_fast_startup(mocker):
+    checks = mocker.patch.object(health, "_check_service_health", side_effect=[False, False, True])
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        ok = await health._wait_for_service("http://localhost:1/health", "Test", 45, 10)
+        return ok, loop.time() - start
+
+    ok, elapsed = asyncio.run(run())
+    assert ok
+    assert checks.call_count == 3
+    assert elapsed < 0.5
+
+
+def test_sync_session_is_shared_until_closed():
+    session = http.get_http_session()
+    assert http.get_http_session() is session
+    asyncio.run(http.close_http_client())
+    assert http.get_http_session() is not session
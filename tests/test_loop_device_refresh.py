@@ -53,7 +53,7 @@ def test_loop_refreshes_devices_before_opening_input_stream(mocker, restore_stat
         def __exit__(self, *_):
             return False
 
-    mocker.patch.object(loop.sd, "InputStream", return_value=_FakeStream())
+    mocker.patch.object(loop.sd, "RawInputStream", return_value=_FakeStream())
 
     state._thread_stop_flag = True
     state._thread_ready = threading.Event()
@@ -0,0 +1,52 @@
+"""Tests for the in-process AppKit paths used instead of osascript on macOS."""
+
+import samantha.injection.detection as detection
+
+
+class _App:
+    def __init__(self, name):
+        self.name = name
+        self.activated = False
+
+    def localizedName(self):
+        return self.name
+
+    def activateWithOptions_(self, options):
+        self.activated = True
+        return True
+
+
+class _Workspace:
+    def __init__(self, apps):
+        self.apps = apps
+
+    def sharedWorkspace(self):
+        return self
+
+    def frontmostApplication(self):
+        return self.apps[0]
+
+    def runningApplications(self):
+        return self.apps
+
+
+def test_frontmost_and_activate_skip_osascript(monkeypatch, mocker):
+    apps = [_App("Cursor"), _App("Terminal")]
+    monkeypatch.setattr(detection, "PLATFORM", "Darwin")
+    monkeypatch.setattr(detection, "NSWorkspace", _Workspace(apps))
+    monkeypatch.setattr(detection, "NSApplicationActivateIgnoringOtherApps", 1, raising=False)
+    run = mocker.patch.object(detection.process, "run")
+
+    assert detection.get_frontmost_app() == "Cursor"
+    assert detection.activate_app("Terminal")
+    assert apps[1].activated
+    run.assert_not_called()
+
+
+def test_activate_falls_back_to_osascript_when_app_not_running(monkeypatch, mocker):
+    monkeypatch.setattr(detection, "PLATFORM", "Darwin")
+    monkeypatch.setattr(detection, "NSWorkspace", _Workspace([_App("Cursor")]))
+    run = mocker.patch.object(detection.process, "run")
+
+    assert detection.activate_app("Windsurf")
+    assert run.call_args.args[0][0] == "osascript"
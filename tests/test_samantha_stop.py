@@ -0,0 +1,106 @@
+"""Tests for samantha_start service startup and samantha_stop's wait on the recorded process."""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import samantha.tools.samantha_tools as tools
+
+
+def test_wait_for_exit_returns_as_soon_as_process_is_gone():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+
+    start = time.monotonic()
+    assert asyncio.run(tools._wait_for_exit(proc.pid, 1.0))
+    assert time.monotonic() - start < 0.5
+
+
+def test_wait_for_exit_times_out_on_live_process():
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        assert not asyncio.run(tools._wait_for_exit(proc.pid, 0.05))
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_start_brings_up_services_concurrently(mocker):
+    started = {}
+    overlapped = []
+
+    async def ensure(name, other):
+        # Each service waits for the other to have started; run one after the other, this times out
+        started.setdefault(name, asyncio.Event()).set()
+        try:
+            await asyncio.wait_for(started.setdefault(other, asyncio.Event()).wait(), timeout=1.0)
+            overlapped.append(name)
+        except asyncio.TimeoutError:
+            pass
+        return False
+
+    mocker.patch.object(tools, "kill_orphaned_processes")
+    mocker.patch.object(tools, "is_samantha_running_elsewhere", return_value=False)
+    mocker.patch.object(tools, "SAMANTHA_DIR", mocker.Mock())
+    mocker.patch.object(tools, "SAMANTHA_ACTIVE_FILE", mocker.Mock())
+    mocker.patch.object(tools, "ensure_kokoro_running", lambda: ensure("kokoro", "whisper"))
+    mocker.patch.object(tools, "ensure_whisper_running", lambda: ensure("whisper", "kokoro"))
+    mocker.patch.object(tools.state, "_samantha_thread", None)
+
+    result = asyncio.run(tools.samantha_start())
+    assert sorted(overlapped) == ["kokoro", "whisper"]
+    assert "Kokoro" in result
+
+
+def test_orphan_cleanup_terminates_matches_and_kills_survivors(mocker):
+    import os
+
+    import samantha.injection.detection as detection
+
+    def proc(pid, cmdline):
+        return mocker.Mock(pid=pid, info={"pid": pid, "cmdline": cmdline})
+
+    ours = proc(os.getpid(), ["/usr/bin/samantha"])
+    server = proc(101, ["python", "/venv/bin/samantha"])
+    kokoro = proc(102, ["uvicorn", "/home/u/.samantha/services/kokoro/main.py"])
+    other = proc(103, ["vim", "notes.txt"])
+    denied = proc(104, None)
+    mocker.patch.object(detection.psutil, "process_iter", return_value=[ours, server, kokoro, other, denied])
+    wait = mocker.patch.object(detection.psutil, "wait_procs", return_value=([server], [kokoro]))
+
+    detection.kill_orphaned_processes()
+
+    assert wait.call_args.args[0] == [server, kokoro]
+    ours.terminate.assert_not_called()
+    other.terminate.assert_not_called()
+    server.kill.assert_not_called()
+    kokoro.kill.assert_called_once()
+
+
+def test_stop_waits_for_tts_before_closing_http_session(mocker):
+    import threading
+
+    tts_done = threading.Event()
+    order = []
+
+    async def close_http_client():
+        order.append("close")
+
+    def finish_tts():
+        time.sleep(0.05)
+        order.append("tts done")
+        tts_done.set()
+
+    mocker.patch.object(tools, "SAMANTHA_ACTIVE_FILE", mocker.Mock(exists=lambda: False))
+    mocker.patch.object(tools, "kill_orphaned_processes")
+    mocker.patch.object(tools, "close_http_client", close_http_client)
+    mocker.patch.object(tools.state, "_samantha_thread", None)
+    mocker.patch.object(tools.state, "_tts_done_event", tts_done)
+    mocker.patch.object(tools.playback, "_tts_interrupt", False)
+
+    threading.Thread(target=finish_tts).start()
+    asyncio.run(tools.samantha_stop())
+
+    assert tools.playback._tts_interrupt
+    assert order == ["tts done", "close"]
@@ -0,0 +1,109 @@
+"""Tests for incremental transcription (LocalAgreement-2 with window trimming)."""
+
+from concurrent.futures import Future
+
+import numpy as np
+
+from samantha.speech import LocalAgreement, StreamingTranscriber
+
+
+class _InlineExecutor:
+    """Runs submitted work immediately so rounds complete deterministically."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def _audio(n: int) -> np.ndarray:
+    return np.arange(n, dtype=np.int16)
+
+
+def test_local_agreement_commits_common_prefix_only():
+    agreement = LocalAgreement()
+    assert agreement.update("open the".split()) == []
+    assert agreement.update("open the door".split()) == ["open", "the"]
+    assert agreement.update("Open the door, please".split()) == ["door,"]
+    assert agreement.confirmed == ["open", "the", "door,"]
+    assert agreement.text("open the door please now".split()) == "open the door, please now"
+
+
+def test_local_agreement_drop_shifts_window():
+    agreement = LocalAgreement()
+    agreement.update("open the door".split())
+    agreement.update("open the door".split())
+    assert agreement.drop(2) == ["open", "the"]
+    assert agreement.update("door please".split()) == []
+    assert agreement.confirmed == ["door"]
+
+
+def test_finalize_reuses_hypothesis_that_covers_all_speech():
+    calls = []
+
+    def transcribe(audio):
+        calls.append(len(audio))
+        return [(0.04, "hello there")] if len(audio) >= 20 else [(0.01, "hello")]
+
+    streamer = StreamingTranscriber(transcribe, _InlineExecutor(), interval_samples=10, sample_rate=1000)
+    for n, is_speech in ((10, True), (20, True), (30, False)):
+        streamer.feed(_audio(n), is_speech)
+
+    assert streamer.finalize(_audio(30)) == "hello there"
+    assert calls == [10, 20, 30]
+
+
+def test_finalize_transcribes_when_speech_outran_last_round():
+    calls = []
+
+    def transcribe(audio):
+        calls.append(len(audio))
+        return [(0.01, "partial")] if len(audio) < 30 else [(0.03, "full sentence")]
+
+    streamer = StreamingTranscriber(transcribe, _InlineExecutor(), interval_samples=20, sample_rate=1000)
+    streamer.feed(_audio(20), True)
+    streamer.feed(_audio(30), True)
+
+    assert streamer.finalize(_audio(30)) == "full sentence"
+    assert calls == [20, 30]
+
+
+def test_confirmed_segments_are_trimmed_from_later_rounds():
+    seen = []
+
+    def transcribe(audio):
+        seen.append(int(audio[0]))
+        if int(audio[0]) == 0:
+            return [(0.01, "turn on"), (0.02, "the lights")]
+        return [(0.01, "please")]
+
+    streamer = StreamingTranscriber(transcribe, _InlineExecutor(), interval_samples=10, sample_rate=1000)
+    streamer.feed(_audio(10), True)
+    streamer.feed(_audio(20), True)  # agrees on "turn on the lights": both segments committed
+    streamer.feed(_audio(30), True)  # window now starts at 20 samples
+
+    assert seen == [0, 0, 20]
+    streamer.feed(_audio(40), False)
+    assert streamer.finalize(_audio(40)) == "turn on the lights please"
+
+
+def test_unconfirmed_window_is_flushed_at_segment_boundary_when_over_cap():
+    seen = []
+    rounds = iter([
+        [(0.01, "alpha beta"), (0.02, "gamma")],
+        [(0.01, "alpha bravo"), (0.02, "gamma")],
+        [(0.01, "delta")],
+    ])
+
+    def transcribe(audio):
+        seen.append(int(audio[0]))
+        return next(rounds)
+
+    streamer = StreamingTranscriber(transcribe, _InlineExecutor(), interval_samples=10, sample_rate=1000,
+                                    max_window_seconds=0.015)
+    streamer.feed(_audio(10), True)
+    streamer.feed(_audio(20), True)  # only "alpha" agrees, but 20 samples > cap: flush through first segment
+    streamer.feed(_audio(30), True)
+
+    assert seen == [0, 0, 10]
+    assert streamer.finalize(_audio(30)) == "alpha bravo delta"
@@ -0,0 +1,76 @@
+"""Tests for the Whisper client request shape and short-circuits."""
+
+import numpy as np
+
+import samantha.speech.stt as stt
+from samantha.config import SAMPLE_RATE
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+def test_sends_greedy_decoding_and_language(mocker):
+    post = mocker.patch.object(stt.get_http_session(), "post")
+    post.return_value.status_code = 200
+    post.return_value.json.return_value = {"text": " hello "}
+
+    assert stt.transcribe_audio_sync(_speech(0.5)) == "hello"
+
+    data = post.call_args.kwargs["data"]
+    assert data["temperature"] == "0"
+    assert data["temperature_inc"] == "0"
+    assert data["language"] == stt.get_whisper_language()
+    assert data["response_format"] == "json"
+
+
+def test_skips_clips_too_short_or_too_quiet(mocker):
+    post = mocker.patch.object(stt.get_http_session(), "post")
+    assert stt.transcribe_audio_sync(_speech(0.05)) is None
+    assert stt.transcribe_audio_sync(np.zeros(SAMPLE_RATE, dtype=np.int16)) is None
+    post.assert_not_called()
+
+
+def test_whisper_upload_is_16k_wav():
+    import wave
+
+    from samantha.audio.recording import _prepare_audio_for_whisper
+
+    with wave.open(_prepare_audio_for_whisper(_speech(1.0))) as wav:
+        assert wav.getframerate() == 16000
+        assert wav.getsampwidth() == 2
+        assert abs(wav.getnframes() - 16000) <= 1
+
+
+def test_pcm_to_wav_round_trips_samples():
+    import wave
+
+    from samantha.audio.recording import pcm_to_wav
+
+    samples = np.array([0, 1, -1, 32767, -32768], dtype=np.int16)
+    with wave.open(pcm_to_wav(samples, 16000)) as wav:
+        assert wav.getnchannels() == 1
+        assert np.array_equal(np.frombuffer(wav.readframes(5), dtype=np.int16), samples)
+
+
+def test_async_transcribe_encodes_off_loop_and_uses_shared_client(mocker):
+    import asyncio
+    import threading
+
+    encoded_on = []
+    prepare = stt._prepare_audio_for_whisper
+
+    def tracking_prepare(audio):
+        encoded_on.append(threading.current_thread())
+        return prepare(audio)
+
+    mocker.patch.object(stt, "_prepare_audio_for_whisper", tracking_prepare)
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {"text": " hi "}
+    client = mocker.Mock(post=mocker.AsyncMock(return_value=response))
+    mocker.patch.object(stt, "_get_http_client", return_value=client)
+
+    assert asyncio.run(stt.transcribe_audio(_speech(0.5))) == "hi"
+    assert encoded_on and encoded_on[0] is not threading.main_thread()
+    assert client.post.await_args.kwargs["data"]["response_format"] == "json"
@@ -0,0 +1,158 @@
+"""Tests for transcript filtering (noise, echo, command cleanup).
+
+These predicates run on every Whisper result, so they are implemented with
+precompiled/cached matchers. The tests pin the observable behavior so the
+fast paths stay equivalent to the plain substring checks they replaced.
+"""
+
+import time
+
+import pytest
+
+import samantha.audio.playback as playback
+from samantha.audio.processing import is_echo
+import samantha.utils.text as text_utils
+from samantha.utils.text import is_noise
+
+
+@pytest.fixture
+def restore_tts_text():
+    saved = (playback._last_tts_text, playback._last_tts_time)
+    yield
+    playback._last_tts_text, playback._last_tts_time = saved
+
+
+@pytest.mark.parametrize("text", ["", "[Music]", "(coughing)", "ok", "keyboard", "static"])
+def test_is_noise_filters_sounds_and_short_fragments(text):
+    assert is_noise(text)
+
+
+def test_is_noise_filters_known_hallucinations():
+    assert is_noise("Thank you for watching!")
+
+
+@pytest.mark.parametrize("text", ["Hey Samantha, what time is it?", "stop", "that's all", "skip this one"])
+def test_is_noise_keeps_keywords(text):
+    assert not is_noise(text)
+
+
+def test_is_noise_keyword_wins_over_noise_phrase():
+    assert not is_noise("samantha thank you for watching")
+
+
+def test_is_noise_keeps_regular_speech():
+    assert not is_noise("refactor the parser please")
+
+
+def test_is_echo_detects_recent_tts(restore_tts_text):
+    playback._last_tts_text = "Sure, I refactored the parser and the tests pass now."
+    playback._last_tts_time = time.monotonic()
+
+    assert is_echo("the tests pass now")
+    assert is_echo("I refactored the parser and tests pass")
+    assert not is_echo("please open the settings file")
+
+
+def test_is_echo_follows_tts_text_changes(restore_tts_text):
+    playback._last_tts_time = time.monotonic()
+    playback._last_tts_text = "first reply about the database"
+    assert is_echo("about the database")
+
+    playback._last_tts_text = "second reply about the network"
+    assert not is_echo("about the database")
+    assert is_echo("about the network")
+
+
+def test_is_echo_expires(restore_tts_text):
+    playback._last_tts_text = "an old reply"
+    playback._last_tts_time = time.monotonic() - 60
+
+    assert not is_echo("an old reply")
+
+
+def test_clean_command_trims_before_longest_wake_word(monkeypatch):
+    monkeypatch.setattr(text_utils, "get_wake_words", lambda: ["samantha", "hey samantha"])
+    monkeypatch.setattr(text_utils, "get_stop_phrases", lambda: ["over"])
+    assert text_utils.clean_command("um hey, Samantha open the door over and out") == "hey, Samantha open the door over"
+
+
+def test_clean_command_without_stop_phrases_keeps_text(monkeypatch):
+    monkeypatch.setattr(text_utils, "get_wake_words", lambda: ["samantha"])
+    monkeypatch.setattr(text_utils, "get_stop_phrases", lambda: [])
+    assert text_utils.clean_command("[Music] Samantha   open  the door") == "Samantha open the door"
+
+
+def test_contains_trigger_word_ignores_prefixes_and_partial_words(monkeypatch):
+    monkeypatch.setattr(text_utils, "get_wake_words", lambda: ["hey samantha", "ok jarvis"])
+    assert text_utils.contains_trigger_word("So, Samantha, what's up")
+    assert text_utils.contains_trigger_word("JARVIS!")
+    assert not text_utils.contains_trigger_word("hey okay")
+    assert not text_utils.contains_trigger_word("samanthas")
+
+
+def test_contains_trigger_word_accepts_sound_alike_spellings(monkeypatch):
+    monkeypatch.setattr(text_utils, "get_wake_words", lambda: ["hey samantha", "ok jarvis"])
+    assert text_utils.contains_trigger_word("Hey Samanta, are you there?")
+    assert text_utils.contains_trigger_word("hay semantha")
+    assert text_utils.contains_trigger_word("ok jarvus")
+    assert not text_utils.contains_trigger_word("samanthas")
+    assert not text_utils.contains_trigger_word("ask santa about the summit")
+
+
+@pytest.mark.parametrize("text", [
+    "please add a comment here",
+    "pour the cement",
+    "he summons them",
+    "open the simmons file",
+])
+def test_sound_alike_fallback_ignores_ordinary_words(monkeypatch, text):
+    monkeypatch.setattr(text_utils, "get_wake_words", lambda: ["hey samantha", "samansa", "cemantha", "semantha"])
+    assert not text_utils.contains_trigger_word(text)
+
+
+def test_wake_word_returns_first_configured_match(monkeypatch):
+    monkeypatch.setattr(text_utils, "get_wake_words", lambda: ["samantha", "hey samantha"])
+    assert text_utils.check_for_wake_word("Hey, Samantha!") == "samantha"
+    assert text_utils.check_for_wake_word("hello there") is None
+
+
+def test_empty_phrase_list_never_matches(monkeypatch):
+    monkeypatch.setattr(text_utils, "get_deactivation_phrases", lambda: [])
+    assert not text_utils.check_for_deactivation("goodbye samantha")
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Hey, Samantha!", "hey samantha"),
+    ("  Stop... please?  ", "stop please"),
+    ("That’s all — “thanks”…", "thats all  thanks"),
+    ("", ""),
+])
+def test_normalize_text_strips_ascii_and_unicode_punctuation(raw, expected):
+    assert text_utils.normalize_text(raw) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("plain words stay", "plain words stay"),
+    ("[Music] hello (coughs) there ♪♪", " hello  there "),
+    ("[BLANK_AUDIO]", ""),
+])
+def test_strip_whisper_sounds(raw, expected):
+    assert text_utils._strip_whisper_sounds(raw) == expected
+
+
+def test_exact_and_embedded_phrases_both_match(monkeypatch):
+    monkeypatch.setattr(text_utils, "get_deactivation_phrases", lambda: ["samantha sleep"])
+    monkeypatch.setattr(text_utils, "get_stop_phrases", lambda: ["thats all"])
+    assert text_utils.check_for_deactivation("Samantha, sleep.")
+    assert text_utils.check_for_deactivation("ok samantha sleep now")
+    assert not text_utils.check_for_deactivation("samantha")
+    assert text_utils.check_for_stop_phrase("That's all!")
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("[Music]  Hey,\tSamantha!  (coughs) ♪ ", "hey samantha"),
+    ("It's   done.\n", "it's done"),
+    ("♪♪", ""),
+])
+def test_sanitize_whisper_text(raw, expected):
+    assert text_utils.sanitize_whisper_text(raw) == expected
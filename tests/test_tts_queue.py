@@ -0,0 +1,152 @@
+"""Tests for TTS queueing (sentence coalescing), PCM chunk handling and the PCM cache."""
+
+import threading
+
+import pytest
+
+import samantha.audio.playback as playback
+
+
+@pytest.fixture(autouse=True)
+def empty_queue():
+    with playback._tts_queue_lock:
+        saved = list(playback._tts_text_queue)
+        playback._tts_text_queue.clear()
+    yield
+    with playback._tts_queue_lock:
+        playback._tts_text_queue[:] = saved
+
+
+def test_fragments_merge_until_sentence_ends():
+    playback.enqueue_tts("Sure, I can")
+    playback.enqueue_tts("help with that.")
+    playback.enqueue_tts("What file")
+    playback.enqueue_tts("should I open?")
+    assert playback._tts_text_queue == ["Sure, I can help with that.", "What file should I open?"]
+
+
+def test_complete_sentences_stay_separate():
+    playback.enqueue_tts("Done.")
+    playback.enqueue_tts('She said "hi."')
+    playback.enqueue_tts("Next")
+    assert playback._tts_text_queue == ["Done.", 'She said "hi."', "Next"]
+
+
+def test_separate_unpunctuated_messages_stay_separate(monkeypatch):
+    playback.enqueue_tts("Done")
+    monkeypatch.setattr(playback, "_tts_last_enqueue_time", playback._tts_last_enqueue_time - playback.TTS_MERGE_WINDOW)
+    playback.enqueue_tts("On it")
+    assert playback._tts_text_queue == ["Done", "On it"]
+
+
+def test_fragment_is_not_merged_into_text_already_playing():
+    playback.enqueue_tts("Working on it")
+    playback._tts_text_queue.pop(0)  # loop picked it up
+    playback.enqueue_tts("now.")
+    assert playback._tts_text_queue == ["now."]
+
+
+def test_whole_samples_carries_split_sample():
+    chunks = [b"\x01\x02\x03", b"\x04", b"", b"\x05\x06", b"\x07"]
+    assert list(playback._whole_samples(chunks)) == [b"\x01\x02", b"\x03\x04", b"\x05\x06"]
+
+
+@pytest.fixture
+def pcm_cache(monkeypatch):
+    monkeypatch.setattr(playback, "_tts_pcm_cache", playback.OrderedDict())
+    monkeypatch.setattr(playback, "_tts_pcm_cache_bytes", 0)
+
+
+class _CallbackStream:
+    """Output stream stand-in that pulls PCM through the callback on a thread, like PortAudio."""
+
+    def __init__(self, callback, finished_callback, blocksize, max_ticks=None, **_):
+        self.callback = callback
+        self.finished_callback = finished_callback
+        self.frames = blocksize
+        self.max_ticks = max_ticks
+        self.played = bytearray()
+        self.active = False
+
+    def _run(self):
+        ticks = 0
+        try:
+            while self.max_ticks is None or ticks < self.max_ticks:
+                ticks += 1
+                outdata = bytearray(self.frames * 2)
+                try:
+                    self.callback(outdata, self.frames, None, None)
+                except (playback.sd.CallbackStop, playback.sd.CallbackAbort) as e:
+                    if isinstance(e, playback.sd.CallbackStop):
+                        self.played += outdata
+                    return
+                self.played += outdata
+        finally:
+            self.active = False
+            self.finished_callback()
+
+    def start(self):
+        self.active = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def close(self):
+        pass
+
+
+def test_repeated_phrase_is_played_from_cache(mocker, pcm_cache):
+    streams = []
+    mocker.patch.object(playback.sd, "RawOutputStream", side_effect=lambda **kw: streams.append(_CallbackStream(**kw)) or streams[-1])
+    mocker.patch.object(playback, "get_voice", return_value="af_sky")
+    mocker.patch.object(playback, "log_conversation")
+    response = mocker.MagicMock(status_code=200)
+    response.__enter__.return_value = response
+    response.iter_content.return_value = [b"\x01\x02", b"\x03\x04"]
+    post = mocker.patch.object(playback.get_http_session(), "post", return_value=response)
+
+    assert playback._speak_with_sounddevice("Got it.")
+    assert playback._speak_with_sounddevice("Got it.")
+
+    assert post.call_count == 1
+    for stream in streams:
+        assert bytes(stream.played).strip(b"\x00") == b"\x01\x02\x03\x04"
+
+
+def test_stream_that_stops_early_is_not_cached(mocker, pcm_cache):
+    # The device goes away after one tick, without the callback ever reaching the end
+    mocker.patch.object(playback.sd, "RawOutputStream", side_effect=lambda **kw: _CallbackStream(max_ticks=1, **kw))
+    mocker.patch.object(playback, "get_voice", return_value="af_sky")
+    log = mocker.patch.object(playback, "log_conversation")
+    response = mocker.MagicMock(status_code=200)
+    response.__enter__.return_value = response
+    response.iter_content.return_value = [b"\x01\x02" * 1024] * 4
+    mocker.patch.object(playback.get_http_session(), "post", return_value=response)
+
+    assert not playback._speak_with_sounddevice("Got it.")
+
+    assert playback._tts_pcm_cache == {}
+    log.assert_not_called()
+
+
+def test_interrupt_aborts_on_next_callback(monkeypatch):
+    monkeypatch.setattr(playback, "_tts_interrupt", False)
+    feed = playback._PcmFeed()
+    outdata = bytearray(4)
+
+    feed._chunks.append(b"\x01\x02\x03\x04\x05\x06")
+    feed.callback(outdata, 2, None, None)
+    assert outdata == b"\x01\x02\x03\x04"
+
+    monkeypatch.setattr(playback, "_tts_interrupt", True)
+    with pytest.raises(playback.sd.CallbackAbort):
+        feed.callback(outdata, 2, None, None)
+
+
+def test_pcm_cache_evicts_least_recently_used(monkeypatch, pcm_cache):
+    monkeypatch.setattr(playback, "TTS_CACHE_MAX_BYTES", 8)
+    playback._cache_pcm(("v", "a"), b"1234")
+    playback._cache_pcm(("v", "b"), b"5678")
+    assert playback._cached_pcm(("v", "a")) == b"1234"
+    playback._cache_pcm(("v", "c"), b"9012")
+    assert playback._cached_pcm(("v", "b")) is None
+    assert list(playback._tts_pcm_cache) == [("v", "a"), ("v", "c")]
+    assert playback._tts_pcm_cache_bytes == 8
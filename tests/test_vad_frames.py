@@ -0,0 +1,187 @@
+"""Tests for the capture-chunk -> VAD frame conversion, idle pre-gate and Silero windowing."""
+
+import numpy as np
+import pytest
+
+import samantha.core.loop as loop
+from samantha.config import SAMPLE_RATE
+
+
+def _tone(amplitude: float, rate: int = SAMPLE_RATE) -> np.ndarray:
+    n = rate * loop.VAD_CHUNK_DURATION_MS // 1000
+    t = np.arange(n) / rate
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+@pytest.fixture
+def polyphase_24k(monkeypatch):
+    """Configure the VAD resampler for a 24kHz capture rate (2/3 polyphase)."""
+    from scipy import signal as scipy_signal
+
+    monkeypatch.setattr(loop, "_VAD_DECIM", None)
+    monkeypatch.setattr(loop, "_VAD_UP", 2)
+    monkeypatch.setattr(loop, "_VAD_DOWN", 3)
+    monkeypatch.setattr(loop, "_VAD_FIR", scipy_signal.firwin(97, 1 / 3))
+
+
+def test_vad_bytes_is_one_16bit_frame():
+    frame = loop._vad_bytes(_tone(10000))
+    assert len(frame) == loop.VAD_FRAME_SAMPLES * 2
+
+
+def test_polyphase_resample_yields_one_frame(polyphase_24k):
+    assert len(loop._vad_bytes(_tone(10000, rate=24000))) == loop.VAD_FRAME_SAMPLES * 2
+
+
+def test_vad_bytes_clips_instead_of_wrapping(polyphase_24k):
+    samples = np.frombuffer(loop._vad_bytes(_tone(32767, rate=24000)), dtype=np.int16)
+    # Filter overshoot on a full-scale tone must saturate, never wrap to the opposite sign
+    middle = samples[40:-40]
+    assert np.all(np.abs(np.diff(middle.astype(np.int32))) < 20000)
+
+
+def test_cheap_speech_rejects_silence_and_rumble():
+    n = SAMPLE_RATE * loop.VAD_CHUNK_DURATION_MS // 1000
+    assert not loop._cheap_speech(np.zeros(n, dtype=np.int16))
+    assert not loop._cheap_speech(np.full(n, 5000, dtype=np.int16))
+    assert not loop._cheap_speech(_tone(50))
+
+
+def test_cheap_speech_passes_voiced_audio():
+    assert loop._cheap_speech(_tone(3000))
+
+
+def test_integer_ratio_rates_decimate(monkeypatch):
+    from scipy import signal as scipy_signal
+
+    monkeypatch.setattr(loop, "_VAD_DECIM", 3)
+    monkeypatch.setattr(loop, "_VAD_LP_SOS", scipy_signal.butter(4, 0.9 / 3, output="sos"))
+    chunk = _tone(8000, rate=3 * loop.VAD_SAMPLE_RATE)
+    assert len(loop._vad_bytes(chunk)) == loop.VAD_FRAME_SAMPLES * 2
+
+
+def test_matching_rates_pass_through(monkeypatch):
+    monkeypatch.setattr(loop, "_VAD_DECIM", 1)
+    chunk = np.arange(loop.VAD_FRAME_SAMPLES, dtype=np.int16)
+    assert loop._vad_bytes(chunk) == chunk.tobytes()
+    assert np.shares_memory(np.frombuffer(loop._vad_bytes(chunk), dtype=np.int16), chunk)
+
+
+def test_webrtcvad_accepts_scratch_view():
+    webrtcvad = pytest.importorskip("webrtcvad")
+    assert webrtcvad.Vad(1).is_speech(loop._vad_bytes(_tone(10000)), loop.VAD_SAMPLE_RATE) in (True, False)
+
+
+def test_idle_gate_matches_per_chunk_check():
+    n = SAMPLE_RATE * loop.VAD_CHUNK_DURATION_MS // 1000
+    chunks = [
+        _tone(3000).reshape(-1, 1),
+        np.zeros((n, 1), dtype=np.int16),
+        _tone(50).reshape(-1, 1),
+        _tone(12000).reshape(-1, 1),
+    ]
+    gate = loop._idle_gate(chunks)
+    assert gate.tolist() == [loop._cheap_speech(c.reshape(-1)) for c in chunks] == [True, False, False, True]
+    assert loop._idle_gate([chunks[0], np.zeros((n // 2, 1), dtype=np.int16)]) is None
+
+
+class _FakeSilero:
+    """Records each inference window and returns a fixed speech probability."""
+
+    def __init__(self, probability):
+        self.probability = probability
+        self.windows = []
+
+    def run(self, outputs, feeds):
+        self.windows.append(feeds["input"].copy())
+        return np.array([[self.probability]], dtype=np.float32), feeds["state"] + 1
+
+
+def test_silero_runs_once_per_512_samples_with_context():
+    from samantha.audio.vad import SileroVad
+
+    session = _FakeSilero(0.9)
+    vad = SileroVad(session, threshold=0.5)
+    frame = np.arange(480, dtype=np.int16)
+
+    assert vad.is_speech(frame.tobytes(), 16000) is False  # 480 < 512: no window yet
+    assert vad.is_speech(frame.tobytes(), 16000) is True
+    assert len(session.windows) == 1
+    window = session.windows[0][0]
+    assert window.shape == (SileroVad.CONTEXT + SileroVad.WINDOW,)
+    assert np.all(window[:SileroVad.CONTEXT] == 0)
+    assert np.allclose(window[SileroVad.CONTEXT:SileroVad.CONTEXT + 480] * 32768, frame)
+
+    vad.is_speech(frame.tobytes(), 16000)
+    assert np.array_equal(session.windows[1][0][:SileroVad.CONTEXT], window[-SileroVad.CONTEXT:])
+    assert np.all(vad._state == 2)
+
+
+def test_reset_vad_clears_silero_stream_state():
+    from samantha.audio.vad import SileroVad, reset_vad
+
+    session = _FakeSilero(0.9)
+    vad = SileroVad(session, threshold=0.5)
+    frame = np.arange(600, dtype=np.int16)
+    assert vad.is_speech(frame.tobytes(), 16000)
+
+    reset_vad(vad)
+    assert vad.is_speech(frame[:100].tobytes(), 16000) is False  # earlier speech doesn't carry over
+    vad.is_speech(frame[100:512].tobytes(), 16000)
+    assert np.all(session.windows[1][0][:SileroVad.CONTEXT] == 0)
+    assert np.all(vad._state == 1)
+
+    reset_vad(object())  # WebRTC detectors have no stream state
+
+
+def test_create_vad_falls_back_to_webrtc_without_model(monkeypatch):
+    import samantha.audio.vad as vad_module
+
+    monkeypatch.setattr(vad_module, "_silero_session", lambda: None)
+    vad = vad_module.create_vad(1)
+    if vad_module.webrtcvad is None:
+        assert vad is None
+    else:
+        assert isinstance(vad, vad_module.webrtcvad.Vad)
+
+
+def test_get_vad_shares_one_detector_per_setting(monkeypatch):
+    import samantha.audio.vad as vad_module
+
+    monkeypatch.setattr(vad_module, "_VAD_INSTANCES", {})
+    monkeypatch.setattr(vad_module, "create_vad", lambda aggressiveness, threshold=0.5: object())
+    assert vad_module.get_vad(1) is vad_module.get_vad(1)
+    assert vad_module.get_vad(1) is not vad_module.get_vad(3)
+
+
+def test_noise_floor_tracks_background_and_gates_below_ratio():
+    floor = loop.NoiseFloor(ratio=2.0, alpha=0.5)
+    assert floor.exceeds(50)
+    for _ in range(10):
+        floor.update(400)
+    assert 390 < floor.level <= 400
+    assert not floor.exceeds(700)
+    assert floor.exceeds(900)
+
+
+def test_noise_floor_ignores_lone_transients():
+    floor = loop.NoiseFloor(ratio=2.0, alpha=0.5)
+    for _ in range(10):
+        floor.update(400)
+    floor.update(30000)
+    assert floor.level <= 400
+    assert floor.exceeds(900)
+
+
+def test_steady_speech_level_does_not_lift_floor_above_itself():
+    floor = loop.NoiseFloor(ratio=2.0, alpha=0.5)
+    for _ in range(10):
+        floor.update(400)
+    for _ in range(200):
+        floor.update(700)
+    assert floor.level <= 700
+    assert floor.exceeds(1500)
+
+
+def test_peak_handles_int16_min():
+    assert loop._peak(np.array([-32768, 5], dtype=np.int16)) == 32768